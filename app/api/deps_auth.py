@@ -1,12 +1,16 @@
+from dataclasses import dataclass
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy import select
+from sqlalchemy import event, inspect, select
 from sqlalchemy.orm import Session
 
+from app.api.deps_config import get_config
+from app.core.cache import TTLCache
+from app.core.config import Settings, settings
 from app.core.security import decode_access_token
-from app.db.deps import get_db
+from app.db.deps import AsyncDB, get_async_db
 from app.schemas.user import TokenData
 
 from app.models.user import User, UserRole # Nuevo import para RBAC (helper para roles (ADMIN/MANAGER))
@@ -15,16 +19,93 @@ from typing import Callable # Nuevo import para RBAC (helper para roles (ADMIN/M
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
-def get_user_by_email(db: Session, email: str) -> Optional[User]:
+@dataclass(frozen=True)
+class CachedPrincipal:
+    id: int
+    email: str
+    full_name: Optional[str]
+    role: UserRole
+    is_active: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "CachedPrincipal":
+        return cls(
+            id = user.id,
+            email = user.email,
+            full_name = user.full_name,
+            role = user.role,
+            is_active = user.is_active,
+        )
+
+    def to_user(self) -> User:
+        # instancia transitoria (no asociada a ninguna sesion)
+        return User(
+            id = self.id,
+            email = self.email,
+            full_name = self.full_name,
+            role = self.role,
+            is_active = self.is_active,
+        )
+
+
+# Cache de principals por "sub" del token para no consultar users en cada request
+principal_cache = TTLCache(
+    maxsize = settings.principal_cache_size,
+    ttl = settings.principal_cache_ttl_seconds,
+)
+
+
+def invalidate_principal(email: str) -> None:
+    principal_cache.delete(email)
+
+
+@event.listens_for(User, "before_update")
+def _bump_token_version(mapper, connection, target: User) -> None:
+    # los refresh tokens emitidos con la version anterior dejan de servir
+    state = inspect(target)
+    if state.attrs.role.history.has_changes() or state.attrs.is_active.history.has_changes():
+        target.token_version = (target.token_version or 0) + 1
+
+
+# emails a invalidar cuando la transaccion en curso se confirme (en session.info)
+_STALE_PRINCIPALS_KEY = "stale_principals"
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _collect_stale_principal(mapper, connection, target: User) -> None:
+    # cambios de rol / desactivacion deben verse en el siguiente request; se invalida
+    # recien con el commit: antes, otro request todavia leeria (y cachearia) la fila vieja
+    session = inspect(target).session
+    if session is None:
+        return
+    stale = session.info.setdefault(_STALE_PRINCIPALS_KEY, set())
+    stale.add(target.email)
+    stale.update(inspect(target).attrs.email.history.deleted)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_principals(session: Session) -> None:
+    for email in session.info.pop(_STALE_PRINCIPALS_KEY, ()):
+        invalidate_principal(email)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_stale_principals(session: Session) -> None:
+    session.info.pop(_STALE_PRINCIPALS_KEY, None)
+
+
+async def get_user_by_email(db: AsyncDB, email: str) -> Optional[User]:
     stmt = select(User).where(User.email == email)
-    return db.scalar(stmt)
+    return await db.scalar(stmt)
 
 
-def get_current_user(
-    db: Session = Depends(get_db),
+async def get_current_user(
+    db: AsyncDB = Depends(get_async_db),
     token: str = Depends(oauth2_scheme),
+    config: Settings = Depends(get_config),
 ) -> User:
-    payload = decode_access_token(token)
+    payload = decode_access_token(token, config)
     if payload is None or "sub" not in payload:
         raise HTTPException(
             status_code = status.HTTP_401_UNAUTHORIZED,
@@ -40,7 +121,11 @@ def get_current_user(
             headers = {"WWW-Authenticate": "Bearer"},
         )
 
-    user = get_user_by_email(db, token_data.email)
+    cached = principal_cache.get(token_data.email)
+    if cached is not None:
+        return cached.to_user()
+
+    user = await get_user_by_email(db, token_data.email)
     if user is None:
         raise HTTPException(
             status_code = status.HTTP_401_UNAUTHORIZED,
@@ -48,10 +133,11 @@ def get_current_user(
             headers = {"WWW-Authenticate": "Bearer"},
         )
 
+    principal_cache.set(token_data.email, CachedPrincipal.from_user(user))
     return user
 
 
-def get_current_active_user(
+async def get_current_active_user(
     current_user: User = Depends(get_current_user),
 ) -> User:
     if not current_user.is_active:
@@ -61,6 +147,38 @@ def get_current_active_user(
         )
     return current_user
 
+
+async def get_token_principal(
+    db: AsyncDB = Depends(get_async_db),
+    token: str = Depends(oauth2_scheme),
+    config: Settings = Depends(get_config),
+) -> User:
+    """
+    Usuario armado con los claims del access token (uid, role), sin consultar la BD.
+    Los tokens solo se emiten a usuarios activos; un cambio de rol o una desactivacion
+    se ven cuando el access token expira y /auth/refresh lo rechaza.
+    Tokens sin esos claims (emitidos antes) siguen el camino con BD.
+    """
+    payload = decode_access_token(token, config)
+    if payload is not None and "uid" in payload and "role" in payload and "sub" in payload:
+        try:
+            role = UserRole(payload["role"])
+        except ValueError:
+            raise HTTPException(
+                status_code = status.HTTP_401_UNAUTHORIZED,
+                detail = "Could not validate credentials",
+                headers = {"WWW-Authenticate": "Bearer"},
+            )
+        return CachedPrincipal(
+            id = payload["uid"],
+            email = payload["sub"],
+            full_name = None,
+            role = role,
+            is_active = True,
+        ).to_user()
+
+    return await get_current_active_user(await get_current_user(db, token, config))
+
 def require_roles(*roles : UserRole) -> Callable[[User], User]:
     """"
     Dependencia para restringir acceso segun rol.
@@ -68,7 +186,7 @@ def require_roles(*roles : UserRole) -> Callable[[User], User]:
         current_admin = Depends(require_roles(UserRole.ADMIN))
         current_manager_or_admin = Depends(require_roles(UserRole.ADMIN, UserRole.MANAGER))
     """
-    def role_checker(current_user: User = Depends  (get_current_active_user)) -> User:
+    async def role_checker(current_user: User = Depends  (get_token_principal)) -> User:
         if current_user.role not in roles:
             raise HTTPException(
                 status_code = status.HTTP_403_FORBIDDEN,
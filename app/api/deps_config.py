@@ -0,0 +1,13 @@
+from typing import Annotated
+
+from fastapi import Depends, Request
+
+from app.core.config import Settings
+
+
+def get_config(request: Request) -> Settings:
+    """Configuracion con la que se armo la app (create_app(config)), no el settings global."""
+    return request.app.state.config
+
+
+AppConfig = Annotated[Settings, Depends(get_config)]
@@ -1,31 +1,57 @@
+from datetime import datetime, timedelta, timezone
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
 
 from app.api.deps_auth import get_user_by_email
+from sqlalchemy import select, update
+
+from app.api.deps_config import AppConfig
+from app.core.config import Settings
 from app.core.security import (
     create_access_token,
-    get_password_hash,
-    verify_password,
+    create_refresh_token,
+    hash_refresh_token,
+    password_hasher,
+    user_claims,
 )
-from app.db.deps import get_db
+from app.db.deps import AsyncDB, get_async_db
+from app.models.refresh_token import RefreshToken
 from app.models.user import User, UserRole
-from app.schemas.user import Token, UserCreate, UserRead
+from app.schemas.user import RefreshRequest, Token, UserCreate, UserRead
 
 from app.api.deps_auth import get_current_active_user # asegurarse de importar esto para la ruta /me
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
-DBSession = Annotated[Session, Depends(get_db)]
+DBSession = Annotated[AsyncDB, Depends(get_async_db)]
+
+def _utc(value: datetime) -> datetime:
+    # SQLite devuelve datetimes naive aunque la columna sea timezone=True
+    return value if value.tzinfo is not None else value.replace(tzinfo = timezone.utc)
+
+def _issue_tokens(db: AsyncDB, user: User, config: Settings) -> Token:
+    """Access token con claims + refresh token nuevo (queda en la sesion, falta el commit)."""
+    refresh_token, token_hash = create_refresh_token()
+    db.add(RefreshToken(
+        user_id = user.id,
+        token_hash = token_hash,
+        token_version = user.token_version,
+        expires_at = datetime.now(timezone.utc) + timedelta(days = config.refresh_token_expire_days),
+    ))
+    return Token(
+        access_token = create_access_token(subject = user.email, claims = user_claims(user), config = config),
+        refresh_token = refresh_token,
+        expires_in = config.access_token_expire_minutes * 60,
+    )
 
 @router.post("/register", response_model=UserRead, status_code = status.HTTP_201_CREATED)
-def register_user(
+async def register_user(
     payload: UserCreate,
     db: DBSession,
 ) -> User:
-    existing = get_user_by_email(db, payload.email)
+    existing = await get_user_by_email(db, payload.email)
     if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -35,43 +61,105 @@ def register_user(
     user = User(
         email = payload.email,
         full_name = payload.full_name,
-        hashed_password = get_password_hash(payload.password),
+        # hashing es CPU: en el pool dedicado, fuera del event loop y del threadpool
+        hashed_password = await password_hasher.hash(payload.password),
         role = UserRole.ADMIN, # por ahora el que registra es ADMIN
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     return user
 
 @router.post("/login", response_model = Token)
-def login (
+async def login (
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     db: DBSession,
+    config: AppConfig,
 ) -> Token:
-    user = get_user_by_email(db, form_data.username)
+    user = await get_user_by_email(db, form_data.username)
     if not user:
         raise HTTPException(
             status_code = status.HTTP_401_UNAUTHORIZED, # cambiar de 400 a 401
             detail = "Incorrect email or password",
         )
     
-    if not verify_password(form_data.password, user.hashed_password):
+    valid, new_hash = await password_hasher.verify_and_update(form_data.password, user.hashed_password)
+    if not valid:
         raise HTTPException(
             status_code = status.HTTP_401_UNAUTHORIZED, # cambiar de 400 a 401,
             detail = "Incorrect email or password",
         )
-    
+
     if not user.is_active:
         raise HTTPException(
             status_code = status.HTTP_401_UNAUTHORIZED, # cambiar de 400 a 401,
             detail = "Inactive user",
         )
-    
-    access_token = create_access_token(subject = user.email)
-    return Token(access_token = access_token)
+
+    # el hash usa parametros viejos (PASSWORD_HASH_ROUNDS cambio): se reemplaza en el
+    # mismo commit que el refresh token (un commit en el medio expira user y leerlo
+    # despues seria un SELECT sync en el event loop)
+    if new_hash is not None:
+        user.hashed_password = new_hash
+
+    token = _issue_tokens(db, user, config)
+    await db.commit()
+    return token
+
+@router.post("/refresh", response_model = Token)
+async def refresh_access_token(
+    payload: RefreshRequest,
+    db: DBSession,
+    config: AppConfig,
+) -> Token:
+    """
+    Cambia un refresh token por un access token nuevo (y rota el refresh token).
+    Falla si el token expiro, ya se uso, o el usuario cambio de rol / fue desactivado.
+    """
+    invalid = HTTPException(
+        status_code = status.HTTP_401_UNAUTHORIZED,
+        detail = "Invalid refresh token",
+    )
+    stored = await db.scalar(
+        select(RefreshToken).where(RefreshToken.token_hash == hash_refresh_token(payload.refresh_token))
+    )
+    if stored is None:
+        raise invalid
+
+    now = datetime.now(timezone.utc)
+    # revocacion condicional: de dos peticiones concurrentes con el mismo token solo
+    # una actualiza la fila (rowcount == 1); la otra cae en la rama de reuso
+    revoked = await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.id == stored.id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at = now)
+    )
+    if revoked.rowcount != 1:
+        # un token ya rotado que se vuelve a usar: posible robo, se revocan todos los del usuario
+        await db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.user_id == stored.user_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at = now)
+        )
+        await db.commit()
+        raise invalid
+
+    user = await db.get(User, stored.user_id)
+    if (
+        _utc(stored.expires_at) <= now
+        or user is None
+        or not user.is_active
+        or stored.token_version != user.token_version
+    ):
+        await db.commit()
+        raise invalid
+
+    token = _issue_tokens(db, user, config)
+    await db.commit()
+    return token
 
 @router.get("/me", response_model = UserRead)
-def read_current_user(
+async def read_current_user(
     current_user: User = Depends(get_current_active_user),
 ) -> User:
     return current_user
\ No newline at end of file
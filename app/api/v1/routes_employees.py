@@ -1,34 +1,142 @@
-from typing import Annotated, List
+import csv
+import io
+import json
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date
+from typing import Annotated, AsyncIterator, List, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
 
 from app.api.deps_auth import require_roles
-from app.db.deps import get_db
-from app.models.employee import Employee
+from app.api.deps_config import AppConfig
+from app.db.deps import AsyncDB, get_async_db
+from app.models.employee import EMPLOYEE_FULL_NAME, Employee
 from app.models.user import User, UserRole
 from app.schemas.employee import (
+    EmployeeBulkDeactivateRequest,
+    EmployeeBulkFilter,
+    EmployeeBulkResponse,
+    EmployeeBulkResult,
+    EmployeeBulkUpdateRequest,
+    EmployeeBulkUpdateResponse,
     EmployeeCreate,
+    EmployeeLookupRequest,
+    EmployeeLookupResponse,
     EmployeeRead,
+    EmployeeStats,
     EmployeeUpdate
 )
+from app.core.config import Settings
+from app.core.employee_stats import (
+    apply_stats_deltas,
+    count_deltas,
+    count_keys,
+    employee_key,
+    read_stats,
+    stats_deltas,
+    stats_key,
+)
+from app.core.http_cache import collection_etag, if_match, if_none_match, resource_etag
+from app.core.response_cache import CachedResponse, response_cache
+from app.core.serialization import FastJSONResponse, dumps
 from app.core.logging import create_activity # import para logging
+from app.core.pagination import (
+    InvalidCursor,
+    decode_cursor,
+    keyset_order,
+    keyset_predicate,
+    next_cursor,
+)
 
-router = APIRouter(prefix = "/employees", tags = ["Employees"])
+router = APIRouter(prefix = "/employees", tags = ["Employees"], default_response_class = FastJSONResponse)
 
-DBSession = Annotated[Session, Depends(get_db)]
+DBSession = Annotated[AsyncDB, Depends(get_async_db)]
 CurrentAdminOrManager = Annotated [
     User,
     Depends(require_roles(UserRole.ADMIN, UserRole.MANAGER)),
 ]
 
+# columnas permitidas en ?sort= (prefijo "-" para descendente)
+EMPLOYEE_SORT_COLUMNS = {
+    "id": Employee.id,
+    "first_name": Employee.first_name,
+    "last_name": Employee.last_name,
+    "email": Employee.email,
+    "department": Employee.department,
+    "position": Employee.position,
+    "hired_at": Employee.hired_at,
+    "created_at": Employee.created_at,
+    "updated_at": Employee.updated_at,
+}
+
+# campos de EmployeeRead, en el mismo orden; list/detail/export leen solo estas columnas
+READ_FIELDS = list(EmployeeRead.model_fields)
+READ_COLUMNS = [getattr(Employee, name) for name in READ_FIELDS]
+
+def _read_dict(row) -> dict:
+    # las primeras columnas de la fila son READ_COLUMNS
+    return dict(zip(READ_FIELDS, row))
+
+def _like_pattern(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+@dataclass
+class EmployeeFilters:
+    """Filtros comunes del listado y del export."""
+    is_active: bool = Query(True, description = "Filter by active status")
+    department: Optional[str] = Query(None, description = "Exact department")
+    position: Optional[str] = Query(None, description = "Exact position")
+    hired_from: Optional[date] = Query(None, description = "hired_at >= this date")
+    hired_to: Optional[date] = Query(None, description = "hired_at <= this date")
+    created_by_id: Optional[int] = Query(None, description = "Id of the user who created the employee")
+    q: Optional[str] = Query(None, min_length = 1, max_length = 100, description = "Search in name and email")
+
+    def clauses(self) -> list:
+        clauses = [Employee.is_active == self.is_active]
+        if self.department is not None:
+            clauses.append(Employee.department == self.department)
+        if self.position is not None:
+            clauses.append(Employee.position == self.position)
+        if self.hired_from is not None:
+            clauses.append(Employee.hired_at >= self.hired_from)
+        if self.hired_to is not None:
+            clauses.append(Employee.hired_at <= self.hired_to)
+        if self.created_by_id is not None:
+            clauses.append(Employee.created_by_id == self.created_by_id)
+        if self.q:
+            # ILIKE '%q%' -> indices pg_trgm en Postgres
+            pattern = _like_pattern(self.q)
+            clauses.append(or_(
+                EMPLOYEE_FULL_NAME.ilike(pattern, escape = "\\"),
+                Employee.email.ilike(pattern, escape = "\\"),
+            ))
+        return clauses
+
+Filters = Annotated[EmployeeFilters, Depends()]
+
+def _resolve_sort(sort: str):
+    descending = sort.startswith("-")
+    column = EMPLOYEE_SORT_COLUMNS.get(sort.lstrip("-"))
+    if column is None:
+        raise HTTPException(
+            status_code = status.HTTP_400_BAD_REQUEST,
+            detail = f"Invalid sort field. Allowed: {', '.join(EMPLOYEE_SORT_COLUMNS)}",
+        )
+    return column, descending
+
 @router.post(
     "",
     response_model = EmployeeRead,
     status_code = status.HTTP_201_CREATED
 )
-def create_employee(
+async def create_employee(
     payload: EmployeeCreate,
     db: DBSession,
     current_user: CurrentAdminOrManager,
@@ -36,7 +144,7 @@ def create_employee(
     # opcional: validar email unico si viene
     if payload.email:
         existing_stmt = select(Employee).where(Employee.email == payload.email)
-        existing = db.scalar(existing_stmt)
+        existing = await db.scalar(existing_stmt)
         if existing:
             raise HTTPException(
                 status_code = status.HTTP_400_BAD_REQUEST,
@@ -54,7 +162,8 @@ def create_employee(
         created_by_id = current_user.id,
     )
     db.add(employee)
-    db.flush() # Obtiene el ID del empleado sin hacer commit aun
+    await db.flush() # Obtiene el ID del empleado sin hacer commit aun
+    await apply_stats_deltas(db, stats_deltas(after = [employee_key(employee)]))
     create_activity(
         db = db,
         user = current_user,
@@ -63,31 +172,479 @@ def create_employee(
         resource_id = (employee.id),
         details = f"Created employee {employee.first_name} {employee.last_name} {employee.id})"
     )
-    db.commit()
-    db.refresh(employee)
+    await response_cache.invalidate_employees(db)
+    await db.commit()
+    await db.refresh(employee)
     return employee
     
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson")
+
+def _parse_bulk_body(body: bytes, content_type: str) -> list:
+    media_type = content_type.split(";")[0].strip().lower()
+    try:
+        if media_type in NDJSON_MEDIA_TYPES:
+            return [json.loads(line) for line in body.splitlines() if line.strip()]
+        rows = json.loads(body)
+    except ValueError:
+        raise HTTPException(
+            status_code = status.HTTP_400_BAD_REQUEST,
+            detail = "Invalid JSON body",
+        )
+    if not isinstance(rows, list):
+        raise HTTPException(
+            status_code = status.HTTP_400_BAD_REQUEST,
+            detail = "Body must be a JSON array (or NDJSON) of employees",
+        )
+    return rows
+
+async def _bulk_write_chunk(
+    db: AsyncDB,
+    chunk: list[tuple[int, EmployeeCreate]],
+    current_user: User,
+    upsert: bool,
+) -> list[EmployeeBulkResult]:
+    # un solo SELECT por chunk para detectar emails existentes
+    emails = [payload.email for _, payload in chunk if payload.email]
+    existing: dict[str, int] = {}
+    versions: dict[int, int] = {}
+    # estado previo de los que se van a actualizar (delta de employee_stats)
+    previous: dict[int, tuple] = {}
+    if emails:
+        rows = await db.execute(
+            select(
+                Employee.email, Employee.id, Employee.version,
+                Employee.department, Employee.hired_at, Employee.is_active,
+            )
+            .where(Employee.email.in_(emails))
+        )
+        for row in rows.all():
+            existing[row.email] = row.id
+            versions[row.id] = row.version
+            previous[row.id] = stats_key(row.department, row.hired_at, row.is_active)
+
+    results: list[EmployeeBulkResult] = []
+    to_insert: list[tuple[int, dict]] = []
+    to_update: list[tuple[int, dict]] = []
+    for index, payload in chunk:
+        values = payload.model_dump()
+        employee_id = existing.get(payload.email) if payload.email else None
+        if employee_id is None:
+            to_insert.append((index, {**values, "created_by_id": current_user.id}))
+        elif upsert:
+            # con la version leida: UPDATE ... WHERE id = :id AND version = :version
+            to_update.append((index, {**values, "id": employee_id, "version": versions[employee_id]}))
+        else:
+            results.append(EmployeeBulkResult(
+                index = index,
+                status = "duplicate",
+                id = employee_id,
+                error = "Employee with this email already exists",
+            ))
+
+    if not to_insert and not to_update:
+        return results
+
+    try:
+        inserted_ids: list[int] = []
+        if to_insert:
+            inserted = await db.scalars(
+                insert(Employee).returning(Employee.id, sort_by_parameter_order = True),
+                [values for _, values in to_insert],
+            )
+            inserted_ids = inserted.all()
+        if to_update:
+            # UPDATE ... WHERE id = :id en executemany
+            await db.execute(update(Employee), [values for _, values in to_update])
+        await apply_stats_deltas(db, stats_deltas(
+            before = [previous[values["id"]] for _, values in to_update],
+            after = [
+                stats_key(values["department"], values["hired_at"], values["is_active"])
+                for _, values in to_insert + to_update
+            ],
+        ))
+
+        create_activity(
+            db = db,
+            user = current_user,
+            action = "bulk_create_employees",
+            resource_type = "employee",
+            details = f"Bulk import: {len(to_insert)} created, {len(to_update)} updated",
+        )
+        await response_cache.invalidate_employees(db)
+        await db.commit()
+    except (IntegrityError, StaleDataError):
+        # otro proceso inserto el mismo email (o modifico un empleado) entre el SELECT y la escritura
+        await db.rollback()
+        return results + [
+            EmployeeBulkResult(index = index, status = "error", error = "Conflict while writing batch, batch rolled back")
+            for index, _ in to_insert + to_update
+        ]
+
+    results.extend(
+        EmployeeBulkResult(index = index, status = "created", id = employee_id)
+        for (index, _), employee_id in zip(to_insert, inserted_ids)
+    )
+    results.extend(
+        EmployeeBulkResult(index = index, status = "updated", id = values["id"])
+        for index, values in to_update
+    )
+    return results
+
+@router.post("/bulk", response_model = EmployeeBulkResponse)
+async def bulk_create_employees(
+    request: Request,
+    db: DBSession,
+    current_user: CurrentAdminOrManager,
+    config: AppConfig,
+    upsert: bool = Query(False, description = "Update existing employees matched by email"),
+) -> EmployeeBulkResponse:
+    """
+    Alta masiva: recibe un array JSON o NDJSON (application/x-ndjson) de EmployeeCreate.
+    Se escribe por chunks (una transaccion y una entrada de actividad por chunk)
+    y devuelve el resultado de cada fila.
+    """
+    raw_rows = _parse_bulk_body(await request.body(), request.headers.get("content-type", ""))
+    if len(raw_rows) > config.bulk_max_rows:
+        raise HTTPException(
+            status_code = status.HTTP_413_CONTENT_TOO_LARGE,
+            detail = f"Too many rows (max {config.bulk_max_rows})",
+        )
+
+    results: list[Optional[EmployeeBulkResult]] = [None] * len(raw_rows)
+    valid: list[tuple[int, EmployeeCreate]] = []
+    seen_emails: set[str] = set()
+    for index, raw in enumerate(raw_rows):
+        try:
+            payload = EmployeeCreate.model_validate(raw)
+        except ValidationError as exc:
+            results[index] = EmployeeBulkResult(
+                index = index,
+                status = "invalid",
+                error = "; ".join(
+                    f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in exc.errors()
+                ),
+            )
+            continue
+        if payload.email:
+            if payload.email in seen_emails:
+                results[index] = EmployeeBulkResult(
+                    index = index,
+                    status = "duplicate",
+                    error = "Email repeated in payload",
+                )
+                continue
+            seen_emails.add(payload.email)
+        valid.append((index, payload))
+
+    chunk_size = max(1, config.bulk_chunk_size)
+    for start in range(0, len(valid), chunk_size):
+        for result in await _bulk_write_chunk(db, valid[start:start + chunk_size], current_user, upsert):
+            results[result.index] = result
+
+    created = sum(1 for r in results if r.status == "created")
+    updated = sum(1 for r in results if r.status == "updated")
+    return EmployeeBulkResponse(
+        created = created,
+        updated = updated,
+        failed = len(results) - created - updated,
+        results = results,
+    )
+
+def _json_response(entry: CachedResponse, if_none_match_header: Optional[str]) -> Response:
+    # el cliente ya tiene esta version: 304 sin body
+    if if_none_match(if_none_match_header, entry.headers["ETag"]):
+        return Response(status_code = status.HTTP_304_NOT_MODIFIED, headers = entry.headers)
+    return Response(content = entry.body, media_type = "application/json", headers = entry.headers)
+
 @router.get("", response_model = List[EmployeeRead])
-def list_employeess(
+async def list_employeess(
+    request: Request,
     db: DBSession,
     current_user: CurrentAdminOrManager,
-    is_active: bool = Query(True, description = "Filter by active status"),
+    filters: Filters,
     skip: int = Query(0, ge = 0),
     limit: int = Query(20, ge = 1, le = 100),
+    sort: str = Query("id", description = "Sort field, prefix with '-' for descending"),
+    cursor: Optional[str] = Query(None, description = "Opaque cursor from X-Next-Cursor"),
+    if_none_match_header: Optional[str] = Header(None, alias = "If-None-Match"),
 ) -> list [Employee]:
+    column, descending = _resolve_sort(sort)
+
+    # la clave depende de todos los query params (orden canonico)
+    cached, cache_key = await response_cache.get_list(
+        db,
+        "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    )
+    if cached is not None:
+        return _json_response(cached, if_none_match_header)
+
+    # solo las columnas de EmployeeRead (+ version para el ETag y la columna
+    # de orden para el cursor): sin instancias ORM ni validacion de Pydantic
+    extra = [Employee.version]
+    if column.key not in READ_FIELDS:
+        extra.append(column)
+    stmt = select(*READ_COLUMNS, *extra).where(*filters.clauses())
+
+    # keyset pagination: el costo de cada pagina no depende de la profundidad
+    if cursor is not None:
+        if skip:
+            raise HTTPException(
+                status_code = status.HTTP_400_BAD_REQUEST,
+                detail = "skip and cursor cannot be used together",
+            )
+        try:
+            value, last_id = decode_cursor(cursor, sort, column)
+        except InvalidCursor:
+            raise HTTPException(
+                status_code = status.HTTP_400_BAD_REQUEST,
+                detail = "Invalid cursor",
+            )
+        stmt = stmt.where(keyset_predicate(column, Employee.id, value, last_id, descending))
+
     stmt = (
-        select(Employee)
-        .where(Employee.is_active == is_active)
-        .order_by(Employee.id)
+        stmt
+        .order_by(*keyset_order(column, Employee.id, descending))
         .offset(skip)
         .limit(limit)
     )
-    employees = db.scalars(stmt).all()
-    return employees
+    employees = (await db.execute(stmt)).all()
+
+    cursor_value = next_cursor(employees, limit, sort, column.key)
+    headers = {"ETag": collection_etag((emp.id, emp.version) for emp in employees)}
+    if cursor_value is not None:
+        headers["X-Next-Cursor"] = cursor_value
+
+    # el cliente ya tiene esta pagina: 304 sin serializar
+    if if_none_match(if_none_match_header, headers["ETag"]):
+        return Response(status_code = status.HTTP_304_NOT_MODIFIED, headers = headers)
+
+    entry = CachedResponse(body = dumps([_read_dict(emp) for emp in employees]), headers = headers)
+    await response_cache.store(cache_key, entry)
+    return _json_response(entry, None)
+
+async def _export_rows(
+        db: AsyncDB,
+        filters: EmployeeFilters,
+        export_format: str,
+        batch_size: int,
+) -> AsyncIterator[bytes]:
+    stmt = (
+        select(*READ_COLUMNS)
+        .where(*filters.clauses())
+        .order_by(Employee.id)
+        .execution_options(yield_per = batch_size)
+    )
+    result = await db.stream(stmt)
+
+    if export_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(READ_FIELDS)
+        async for partition in result.partitions(batch_size):
+            writer.writerows(partition)
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+        return
+
+    async for partition in result.partitions(batch_size):
+        yield b"".join(dumps(_read_dict(row)) + b"\n" for row in partition)
+
+@router.get("/export")
+async def export_employees(
+    db: DBSession,
+    current_user: CurrentAdminOrManager,
+    filters: Filters,
+    config: AppConfig,
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias = "format"),
+) -> StreamingResponse:
+    """
+    Exporta todos los empleados que cumplen los filtros, en streaming
+    (memoria constante sin importar el tamaño de la tabla).
+    """
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        _export_rows(db, filters, export_format, config.export_batch_size),
+        media_type = media_type,
+        headers = {"Content-Disposition": f'attachment; filename="employees.{export_format}"'},
+    )
+
+@router.post("/lookup", response_model = EmployeeLookupResponse)
+async def lookup_employees(
+    payload: EmployeeLookupRequest,
+    db: DBSession,
+    current_user: CurrentAdminOrManager,
+    config: AppConfig,
+) -> Response:
+    """
+    Varios empleados por id en una sola llamada (en vez de un GET /{id} por id).
+    Devuelve los encontrados en el orden pedido y los ids que no existen.
+    """
+    # sin repetidos, respetando el orden del primer pedido
+    ids = list(dict.fromkeys(payload.ids))
+    if len(ids) > config.lookup_max_ids:
+        raise HTTPException(
+            status_code = status.HTTP_413_CONTENT_TOO_LARGE,
+            detail = f"Too many ids (max {config.lookup_max_ids})",
+        )
+
+    found: dict[int, dict] = {}
+    chunk_size = max(1, config.lookup_chunk_size)
+    for start in range(0, len(ids), chunk_size):
+        rows = await db.execute(
+            select(*READ_COLUMNS).where(Employee.id.in_(ids[start:start + chunk_size]))
+        )
+        for row in rows.all():
+            found[row.id] = _read_dict(row)
+
+    return Response(
+        content = dumps({
+            "items": [found[employee_id] for employee_id in ids if employee_id in found],
+            "missing": [employee_id for employee_id in ids if employee_id not in found],
+        }),
+        media_type = "application/json",
+    )
 
-def _get_employee_or_404(employee_id: int, db: Session) -> Employee:
+def _bulk_filter_clauses(target: EmployeeBulkFilter, config: Settings) -> list:
+    criteria = target.model_dump(exclude = {"ids", "is_active"}, exclude_none = True)
+    if target.ids is None and not criteria:
+        # sin filtro seria "todos los activos": tiene que pedirse explicitamente
+        raise HTTPException(
+            status_code = status.HTTP_400_BAD_REQUEST,
+            detail = "filter needs ids or at least one of: department, position, hired_from, hired_to, created_by_id, q",
+        )
+    if target.ids is not None and len(target.ids) > config.lookup_max_ids:
+        raise HTTPException(
+            status_code = status.HTTP_413_CONTENT_TOO_LARGE,
+            detail = f"Too many ids (max {config.lookup_max_ids})",
+        )
+
+    clauses = EmployeeFilters(**target.model_dump(exclude = {"ids"})).clauses()
+    if target.ids is not None:
+        clauses.append(Employee.id.in_(target.ids))
+    return clauses
+
+async def _bulk_update(
+    db: AsyncDB,
+    current_user: User,
+    clauses: list,
+    values: dict,
+    action: str,
+    details: str,
+) -> EmployeeBulkUpdateResponse:
+    """
+    Un UPDATE ... WHERE para todos los empleados del filtro, en una transaccion:
+    SELECT agrupado (delta de employee_stats), UPDATE ... RETURNING, una sola
+    entrada de actividad y commit.
+    """
+    # solo las filas que cambian: las que ya tienen esos valores no tocan version (ni su ETag)
+    clauses = [*clauses, or_(*(getattr(Employee, field).is_distinct_from(value) for field, value in values.items()))]
+
+    before = await count_keys(db, *clauses)
+    if not before:
+        return EmployeeBulkUpdateResponse(updated = 0)
+
+    rows = (await db.execute(
+        update(Employee)
+        .where(*clauses)
+        .values(**values, version = Employee.version + 1)
+        .returning(Employee.id, Employee.department, Employee.hired_at, Employee.is_active)
+        .execution_options(synchronize_session = False)
+    )).all()
+    after = Counter(stats_key(row.department, row.hired_at, row.is_active) for row in rows)
+
+    # otra transaccion cambio empleados del filtro entre el SELECT y el UPDATE:
+    # el delta ya no seria exacto
+    expected = Counter()
+    for (department, hired_at, is_active), count in before:
+        expected[stats_key(
+            values.get("department", department),
+            values.get("hired_at", hired_at),
+            values.get("is_active", is_active),
+        )] += count
+    if after != expected:
+        await db.rollback()
+        raise HTTPException(
+            status_code = status.HTTP_409_CONFLICT,
+            detail = "Employees were modified by another request, retry",
+        )
+
+    await apply_stats_deltas(db, count_deltas(before = before, after = after.items()))
+    create_activity(
+        db = db,
+        user = current_user,
+        action = action,
+        resource_type = "employee",
+        details = f"{details}: {len(rows)} employees",
+    )
+    await response_cache.invalidate_employees(db)
+    await db.commit()
+    return EmployeeBulkUpdateResponse(updated = len(rows))
+
+@router.patch("/bulk", response_model = EmployeeBulkUpdateResponse)
+async def bulk_update_employees(
+    payload: EmployeeBulkUpdateRequest,
+    db: DBSession,
+    current_user: CurrentAdminOrManager,
+    config: AppConfig,
+) -> EmployeeBulkUpdateResponse:
+    """
+    Aplica el mismo patch a todos los empleados del filtro (p. ej. una
+    reorganizacion de departamento) con un UPDATE ... WHERE, no uno por empleado.
+    """
+    values = payload.patch.model_dump(exclude_unset = True)
+    # is_active no admite NULL: null equivale a no mandarlo
+    if values.get("is_active", False) is None:
+        del values["is_active"]
+    if not values:
+        raise HTTPException(
+            status_code = status.HTTP_400_BAD_REQUEST,
+            detail = "patch has no fields to update",
+        )
+
+    return await _bulk_update(
+        db,
+        current_user,
+        _bulk_filter_clauses(payload.filter, config),
+        values,
+        action = "bulk_update_employees",
+        details = f"Bulk update ({', '.join(values)})",
+    )
+
+@router.post("/bulk-deactivate", response_model = EmployeeBulkUpdateResponse)
+async def bulk_deactivate_employees(
+    payload: EmployeeBulkDeactivateRequest,
+    db: DBSession,
+    current_user: CurrentAdminOrManager,
+    config: AppConfig,
+) -> EmployeeBulkUpdateResponse:
+    """Soft delete (is_active = False) de todos los empleados del filtro."""
+    return await _bulk_update(
+        db,
+        current_user,
+        _bulk_filter_clauses(payload.filter, config),
+        {"is_active": False},
+        action = "bulk_deactivate_employees",
+        details = "Bulk soft delete (is_active = False)",
+    )
+
+@router.get("/stats", response_model = EmployeeStats)
+async def employee_stats(
+    db: DBSession,
+    current_user: CurrentAdminOrManager,
+) -> dict:
+    """
+    Headcount por departamento, activos / inactivos y contrataciones por mes.
+    Se lee de employee_stats (una fila por departamento y por mes): el costo no
+    depende de la cantidad de empleados.
+    """
+    return await read_stats(db)
+
+async def _get_employee_or_404(employee_id: int, db: AsyncDB) -> Employee:
     stmt = select(Employee).where(Employee.id == employee_id)
-    employee = db.scalar(stmt)
+    employee = await db.scalar(stmt)
     if employee is None:
         raise HTTPException(
             status_code = status.HTTP_404_NOT_FOUND,
@@ -96,28 +653,69 @@ def _get_employee_or_404(employee_id: int, db: Session) -> Employee:
     return employee
 
 @router.get("/{employee_id}", response_model = EmployeeRead)
-def get_employee(
+async def get_employee(
     employee_id: int,
     db: DBSession,
     current_user: CurrentAdminOrManager,
+    if_none_match_header: Optional[str] = Header(None, alias = "If-None-Match"),
 ) -> Employee:
-    return _get_employee_or_404(employee_id, db)
+    cached, cache_key = await response_cache.get_employee(db, employee_id)
+    if cached is not None:
+        return _json_response(cached, if_none_match_header)
+
+    stmt = select(*READ_COLUMNS, Employee.version).where(Employee.id == employee_id)
+    employee = (await db.execute(stmt)).first()
+    if employee is None:
+        raise HTTPException(
+            status_code = status.HTTP_404_NOT_FOUND,
+            detail = "Employee not found",
+        )
+
+    etag = resource_etag(employee.id, employee.version)
+    if if_none_match(if_none_match_header, etag):
+        return Response(status_code = status.HTTP_304_NOT_MODIFIED, headers = {"ETag": etag})
+
+    entry = CachedResponse(body = dumps(_read_dict(employee)), headers = {"ETag": etag})
+    await response_cache.store(cache_key, entry)
+    return _json_response(entry, None)
 
 @router.put("/{employee_id}", response_model = EmployeeRead)
-def update_employee(
+async def update_employee(
     employee_id: int,
     payload: EmployeeUpdate,
+    response: Response,
     db: DBSession,
     current_user: CurrentAdminOrManager,
+    if_match_header: Optional[str] = Header(None, alias = "If-Match"),
 ) -> Employee:
-    employee = _get_employee_or_404(employee_id, db)
+    employee = await _get_employee_or_404(employee_id, db)
+
+    # concurrencia optimista: solo se actualiza si el cliente tiene la ultima version
+    # (el UPDATE lleva WHERE version = <version leida>: si otro request escribe en el
+    # medio no se pisa, StaleDataError -> 412)
+    if not if_match(if_match_header, resource_etag(employee.id, employee.version)):
+        raise HTTPException(
+            status_code = status.HTTP_412_PRECONDITION_FAILED,
+            detail = "Employee was modified by another request",
+        )
 
     update_data = payload.model_dump(exclude_unset = True)
 
+    before = employee_key(employee)
     for field, value in update_data.items():
         setattr(employee, field, value)
 
     db.add(employee)
+    try:
+        # UPDATE ... WHERE id = :id AND version = :version leida
+        await db.flush()
+    except StaleDataError:
+        await db.rollback()
+        raise HTTPException(
+            status_code = status.HTTP_412_PRECONDITION_FAILED,
+            detail = "Employee was modified by another request",
+        )
+    await apply_stats_deltas(db, stats_deltas(before = [before], after = [employee_key(employee)]))
     create_activity(
         db = db,
         user = current_user,
@@ -126,25 +724,38 @@ def update_employee(
         resource_id = str(employee.id),
         details = f"Updated employee: {', '.join(update_data.keys())} "
     )
-    db.commit()
-    db.refresh(employee)
+    await response_cache.invalidate_employees(db)
+    await db.commit()
+    await db.refresh(employee)
+    response.headers["ETag"] = resource_etag(employee.id, employee.version)
     return employee
 
 @router.delete(
     "/{employee_id}",
     status_code = status.HTTP_204_NO_CONTENT,
 )
-def delete_employee(
+async def delete_employee(
     employee_id: int,
     db: DBSession,
     current_user: CurrentAdminOrManager,
 ) -> None:
-    employee = _get_employee_or_404(employee_id, db)
+    employee = await _get_employee_or_404(employee_id, db)
 
     # soft delete
+    before = employee_key(employee)
     employee.is_active = False
 
     db.add(employee)
+    try:
+        # UPDATE ... WHERE id = :id AND version = :version leida
+        await db.flush()
+    except StaleDataError:
+        await db.rollback()
+        raise HTTPException(
+            status_code = status.HTTP_409_CONFLICT,
+            detail = "Employee was modified by another request, retry",
+        )
+    await apply_stats_deltas(db, stats_deltas(before = [before], after = [employee_key(employee)]))
     create_activity(
         db = db,
         user = current_user,
@@ -153,5 +764,6 @@ def delete_employee(
         resource_id = str(employee.id),
         details = f"Soft deleted (is_active = False)"
     )
-    db.commit()
+    await response_cache.invalidate_employees(db)
+    await db.commit()
     # 204 -> sin body
\ No newline at end of file
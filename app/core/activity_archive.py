@@ -0,0 +1,204 @@
+"""
+Archivo del activity log: las filas anteriores a un cutoff se copian a archivos
+gzip NDJSON (uno por mes de created_at, solo append) y se borran de la tabla por
+lotes. Cada lote se escribe como un miembro gzip nuevo y se hace fsync antes del
+DELETE: si el proceso muere en el medio, una fila puede quedar archivada dos
+veces, pero nunca se pierde.
+"""
+
+import gzip
+import json
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.engine import Engine
+
+from app.core.pagination import keyset_order, keyset_predicate
+from app.core.serialization import dumps
+from app.db import partitions
+from app.models.activity_log import ActivityLog
+
+TABLE = ActivityLog.__tablename__
+ARCHIVE_FIELDS = ["id", "user_id", "action", "resource_type", "resource_id", "details", "created_at"]
+ARCHIVE_COLUMNS = [getattr(ActivityLog, name) for name in ARCHIVE_FIELDS]
+
+
+@dataclass
+class ArchiveResult:
+    cutoff: datetime
+    archived_rows: int = 0
+    deleted_rows: int = 0
+    batches: int = 0
+    bytes_written: int = 0
+    files: list[str] = field(default_factory = list)
+    dropped_partitions: list[str] = field(default_factory = list)
+
+
+def archive_path(archive_dir: Path, month: date) -> Path:
+    return archive_dir / f"{TABLE}-{month.year:04d}-{month.month:02d}.ndjson.gz"
+
+
+def _month_of(path: Path) -> Optional[date]:
+    stem = path.name[len(TABLE) + 1:].split(".", 1)[0]
+    try:
+        return date.fromisoformat(f"{stem}-01")
+    except ValueError:
+        return None
+
+
+def _utc_month(value: datetime) -> date:
+    # archivos y particiones van por mes en UTC, sin importar el timezone de la sesion
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return partitions.month_start(value)
+
+
+def _write_batch(archive_dir: Path, rows: list, compresslevel: int) -> tuple[int, list[str]]:
+    by_month: dict[date, list[bytes]] = {}
+    for row in rows:
+        month = _utc_month(row.created_at)
+        by_month.setdefault(month, []).append(dumps(dict(zip(ARCHIVE_FIELDS, row))) + b"\n")
+
+    written = 0
+    paths = []
+    for month, lines in sorted(by_month.items()):
+        path = archive_path(archive_dir, month)
+        # "ab": cada lote es un miembro gzip nuevo; gzip.open lee todos los miembros seguidos
+        with open(path, "ab") as raw:
+            start = raw.tell()
+            with gzip.GzipFile(fileobj = raw, mode = "ab", compresslevel = compresslevel) as archive:
+                archive.write(b"".join(lines))
+            raw.flush()
+            os.fsync(raw.fileno())
+            written += raw.tell() - start
+        paths.append(str(path))
+    return written, paths
+
+
+def archive_before(
+        engine: Engine,
+        cutoff: datetime,
+        archive_dir: str,
+        batch_size: int = 5000,
+        compresslevel: int = 6,
+) -> ArchiveResult:
+    """
+    Archiva y borra las filas con created_at < cutoff, en lotes de batch_size
+    (una transaccion corta por lote). Con la tabla particionada, los meses
+    completos se borran con DROP de la particion en vez de DELETE.
+    """
+    directory = Path(archive_dir)
+    directory.mkdir(parents = True, exist_ok = True)
+    result = ArchiveResult(cutoff = cutoff)
+
+    with engine.connect() as connection:
+        partitioned = partitions.is_partitioned(connection, TABLE)
+        expired = partitions.expired_partitions(TABLE, partitions.list_partitions(connection, TABLE), cutoff) if partitioned else []
+    # las filas de estos meses no se borran una por una: se hace DROP de la particion al final
+    expired_months = {partitions.partition_month(TABLE, name) for name in expired}
+
+    files: set[str] = set()
+    last: Optional[tuple[Any, int]] = None
+    while True:
+        # keyset sobre (created_at, id): usa ix_activity_logs_created_at_id y no relee lo ya borrado
+        stmt = select(*ARCHIVE_COLUMNS).where(ActivityLog.created_at < cutoff)
+        if last is not None:
+            stmt = stmt.where(keyset_predicate(ActivityLog.created_at, ActivityLog.id, *last))
+        stmt = stmt.order_by(*keyset_order(ActivityLog.created_at, ActivityLog.id)).limit(batch_size)
+
+        with engine.connect() as connection:
+            rows = connection.execute(stmt).all()
+        if not rows:
+            break
+
+        written, paths = _write_batch(directory, rows, compresslevel)
+        result.bytes_written += written
+        result.archived_rows += len(rows)
+        result.batches += 1
+        files.update(paths)
+        last = (rows[-1].created_at, rows[-1].id)
+
+        to_delete = [row.id for row in rows if _utc_month(row.created_at) not in expired_months]
+        if to_delete:
+            with engine.begin() as connection:
+                result.deleted_rows += connection.execute(
+                    delete(ActivityLog).where(ActivityLog.id.in_(to_delete), ActivityLog.created_at < cutoff)
+                ).rowcount
+        if len(rows) < batch_size:
+            break
+
+    if expired:
+        # todas sus filas ya estan archivadas
+        with engine.begin() as connection:
+            partitions.drop_partitions(connection, expired)
+        result.dropped_partitions = expired
+
+    result.files = sorted(files)
+    return result
+
+
+def vacuum(engine: Engine) -> None:
+    """Despues de un borrado grande: el espacio queda reutilizable y las estadisticas al dia."""
+    with engine.connect().execution_options(isolation_level = "AUTOCOMMIT") as connection:
+        if connection.dialect.name == "postgresql":
+            connection.execute(text(f"VACUUM (ANALYZE) {TABLE}"))
+        elif connection.dialect.name == "sqlite":
+            connection.execute(text("VACUUM"))
+
+
+def iter_archive(
+        archive_dir: str,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        user_id: Optional[int] = None,
+        action: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        resource_id: Optional[str] = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Lee las filas archivadas (mas viejo primero) con los mismos filtros que
+    GET /activity. Solo se abren los archivos de los meses del rango.
+    """
+    # los archivos son por mes en UTC: 2026-03-01T00:30-03:00 cae en el archivo de marzo
+    first_month = _utc_month(created_from) if created_from else None
+    last_month = _utc_month(created_to) if created_to else None
+
+    for path in sorted(Path(archive_dir).glob(f"{TABLE}-*.ndjson.gz")):
+        month = _month_of(path)
+        if month is None:
+            continue
+        if (first_month and month < first_month) or (last_month and month > last_month):
+            continue
+
+        with gzip.open(path, "rb") as archive:
+            for line in archive:
+                row = json.loads(line)
+                if user_id is not None and row["user_id"] != user_id:
+                    continue
+                if action is not None and row["action"] != action:
+                    continue
+                if resource_type is not None and row["resource_type"] != resource_type:
+                    continue
+                if resource_id is not None and row["resource_id"] != resource_id:
+                    continue
+                if created_from is not None or created_to is not None:
+                    created_at = datetime.fromisoformat(row["created_at"])
+                    if created_from is not None and created_at < _comparable(created_from, created_at):
+                        continue
+                    if created_to is not None and created_at >= _comparable(created_to, created_at):
+                        continue
+                yield row
+
+
+def _comparable(bound: datetime, value: datetime) -> datetime:
+    # SQLite devuelve datetimes sin zona (guardados en UTC)
+    if value.tzinfo is None and bound.tzinfo is not None:
+        return bound.astimezone(timezone.utc).replace(tzinfo = None)
+    if value.tzinfo is not None and bound.tzinfo is None:
+        return bound.replace(tzinfo = timezone.utc)
+    return bound
@@ -0,0 +1,109 @@
+"""
+Retencion del activity log. Con la tabla particionada por mes (Postgres) se
+borran particiones enteras y se crean las de los proximos meses; si no, se
+borra por lotes de ids (transacciones cortas, sin un DELETE gigante).
+
+El mismo job borra los refresh tokens vencidos (revocados o no).
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.engine import Engine
+
+from app.db import partitions
+from app.models.activity_log import ActivityLog
+from app.models.refresh_token import RefreshToken
+
+TABLE = ActivityLog.__tablename__
+
+
+@dataclass
+class RetentionResult:
+    cutoff: Optional[datetime]
+    partitioned: bool
+    dry_run: bool = False
+    created_partitions: list[str] = field(default_factory = list)
+    dropped_partitions: list[str] = field(default_factory = list)
+    deleted_rows: int = 0
+    deleted_refresh_tokens: int = 0
+
+
+def retention_cutoff(days: int, now: Optional[datetime] = None) -> Optional[datetime]:
+    if days <= 0:
+        return None
+    return (now or datetime.now(timezone.utc)) - timedelta(days = days)
+
+
+def _delete_in_batches(engine: Engine, model, condition, batch_size: int) -> int:
+    """Borra las filas de model que cumplen condition en lotes de batch_size (una transaccion por lote)."""
+    total = 0
+    while True:
+        batch = (
+            select(model.id)
+            .where(condition)
+            .order_by(model.id)
+            .limit(batch_size)
+        )
+        with engine.begin() as connection:
+            deleted = connection.execute(
+                delete(model).where(model.id.in_(batch.scalar_subquery()))
+            ).rowcount
+        total += deleted
+        if deleted < batch_size:
+            return total
+
+
+def delete_before(engine: Engine, cutoff: datetime, batch_size: int) -> int:
+    """Borra las filas con created_at < cutoff en lotes de batch_size (una transaccion por lote)."""
+    return _delete_in_batches(engine, ActivityLog, ActivityLog.created_at < cutoff, batch_size)
+
+
+def delete_expired_refresh_tokens(engine: Engine, now: datetime, batch_size: int) -> int:
+    """
+    Borra los refresh tokens con expires_at <= now. Los revocados se conservan hasta
+    que vencen: /auth/refresh los necesita para detectar el reuso de un token rotado.
+    """
+    return _delete_in_batches(engine, RefreshToken, RefreshToken.expires_at <= now, batch_size)
+
+
+def apply_retention(
+        engine: Engine,
+        retention_days: int,
+        months_ahead: int = 3,
+        batch_size: int = 5000,
+        now: Optional[datetime] = None,
+        dry_run: bool = False,
+) -> RetentionResult:
+    now = now or datetime.now(timezone.utc)
+    cutoff = retention_cutoff(retention_days, now)
+
+    with engine.begin() as connection:
+        partitioned = partitions.is_partitioned(connection, TABLE)
+        result = RetentionResult(cutoff = cutoff, partitioned = partitioned, dry_run = dry_run)
+
+        if dry_run:
+            result.deleted_refresh_tokens = connection.scalar(
+                select(func.count()).select_from(RefreshToken).where(RefreshToken.expires_at <= now)
+            )
+
+        if partitioned:
+            # solo meses completos antes del cutoff: el mes del cutoff se borra cuando termine
+            existing = partitions.list_partitions(connection, TABLE)
+            if cutoff is not None:
+                result.dropped_partitions = partitions.expired_partitions(TABLE, existing, cutoff)
+            if not dry_run:
+                result.created_partitions = partitions.ensure_partitions(connection, TABLE, now.date(), months_ahead)
+                partitions.drop_partitions(connection, result.dropped_partitions)
+        elif cutoff is not None and dry_run:
+            result.deleted_rows = connection.scalar(
+                select(func.count()).select_from(ActivityLog).where(ActivityLog.created_at < cutoff)
+            )
+
+    if not dry_run:
+        if cutoff is not None and not partitioned:
+            result.deleted_rows = delete_before(engine, cutoff, batch_size)
+        result.deleted_refresh_tokens = delete_expired_refresh_tokens(engine, now, batch_size)
+    return result
@@ -0,0 +1,257 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from sqlalchemy import insert
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.db.session import database
+from app.models.activity_log import ActivityLog
+
+logger = logging.getLogger("uvicorn.error")
+
+_SPOOL_GLOB = "activity-*.ndjson"
+
+
+class ActivityWriter:
+    """
+    Buffer en memoria para los eventos de actividad (ACTIVITY_LOG_MODE=buffered).
+    Los eventos se insertan por lotes (INSERT multi-fila) desde una tarea en
+    background, cuando se juntan flush_size eventos o cada flush_interval segundos.
+
+    Durabilidad opcional: con spool_dir cada evento se agrega tambien a un archivo
+    NDJSON (un segmento por lote); el segmento se borra cuando su lote ya esta en
+    la BD y al arrancar se reinsertan los segmentos pendientes (at-least-once).
+    """
+
+    def __init__(
+            self,
+            engine = None,
+            flush_size: int = 100,
+            flush_interval: float = 1.0,
+            max_queue: int = 10000,
+            spool_dir: Optional[str] = None,
+            fsync: bool = False,
+    ):
+        self.engine = engine
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.spool_dir = Path(spool_dir) if spool_dir else None
+        self.fsync = fsync
+
+        self._lock = threading.Lock()
+        self._events: list[dict[str, Any]] = []
+        # lotes que fallaron al insertar: (segmento, eventos)
+        self._pending: list[tuple[Optional[Path], list[dict[str, Any]]]] = []
+        self._segment = 0
+        self._spool_file = None
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.flushed = 0
+        self.flush_failures = 0
+        self.flush_seconds_last = 0.0
+        self.flush_seconds_max = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def _depth(self) -> int:
+        # llamar con self._lock tomado; incluye los lotes que fallaron y esperan reintento
+        return len(self._events) + sum(len(events) for _, events in self._pending)
+
+    @property
+    def full(self) -> bool:
+        return self.queue_depth >= self.max_queue
+
+    @property
+    def queue_depth(self) -> int:
+        with self._lock:
+            return self._depth()
+
+    # --- spool -----------------------------------------------------------
+
+    def _segment_path(self, number: int) -> Path:
+        return self.spool_dir / f"activity-{number:012d}.ndjson"
+
+    def _open_segment(self) -> None:
+        if self.spool_dir is None:
+            return
+        self._segment += 1
+        self._spool_file = open(self._segment_path(self._segment), "a", encoding = "utf-8")
+
+    def _load_spool(self) -> None:
+        """Segmentos que quedaron de una ejecucion anterior (crash o stop sin flush)."""
+        if self.spool_dir is None:
+            return
+        self.spool_dir.mkdir(parents = True, exist_ok = True)
+        segments = sorted(self.spool_dir.glob(_SPOOL_GLOB))
+        for path in segments:
+            events = []
+            with open(path, encoding = "utf-8") as fh:
+                for line in fh:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        events.append(json.loads(line))
+                    except ValueError:
+                        # ultima linea a medio escribir durante un crash
+                        logger.warning("Skipping corrupt activity spool line in %s", path)
+            self._pending.append((path, events))
+        if segments:
+            self._segment = int(segments[-1].stem.split("-")[-1])
+
+    # --- API ------------------------------------------------------------
+
+    def enqueue(self, event: dict[str, Any], force: bool = False) -> bool:
+        """
+        Agrega un evento al buffer. Devuelve False si el buffer esta lleno, salvo con
+        force (eventos de transacciones ya confirmadas, que no se pueden rechazar).
+        """
+        with self._lock:
+            if self._depth() >= self.max_queue and not force:
+                return False
+            self._events.append(event)
+            if self._spool_file is not None:
+                self._spool_file.write(json.dumps(event, default = str) + "\n")
+                self._spool_file.flush()
+                if self.fsync:
+                    os.fsync(self._spool_file.fileno())
+            should_wake = len(self._events) >= self.flush_size
+
+        if should_wake and self._loop is not None and self._wake is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+        return True
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        with self._lock:
+            self._load_spool()
+            self._open_segment()
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+        with self._lock:
+            if self._spool_file is not None:
+                self._spool_file.close()
+                path = Path(self._spool_file.name)
+                if not self._events and path.stat().st_size == 0:
+                    path.unlink()
+                self._spool_file = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout = self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Inserta todo lo pendiente. Devuelve la cantidad de eventos escritos."""
+        with self._lock:
+            if self._events:
+                segment = None
+                if self._spool_file is not None:
+                    self._spool_file.close()
+                    segment = self._segment_path(self._segment)
+                    self._open_segment()
+                self._pending.append((segment, self._events))
+                self._events = []
+            batches, self._pending = self._pending, []
+
+        written = 0
+        for index, (segment, events) in enumerate(batches):
+            start = time.perf_counter()
+            try:
+                await run_in_threadpool(self._insert, events)
+            except Exception:
+                logger.exception("Activity log flush failed, %d events kept for retry", len(events))
+                self.flush_failures += 1
+                with self._lock:
+                    self._pending = batches[index:] + self._pending
+                break
+            elapsed = time.perf_counter() - start
+            self.flush_seconds_last = elapsed
+            self.flush_seconds_max = max(self.flush_seconds_max, elapsed)
+            self.flushed += len(events)
+            written += len(events)
+            if segment is not None:
+                segment.unlink(missing_ok = True)
+        return written
+
+    def _insert(self, events: list[dict[str, Any]]) -> None:
+        if not events:
+            return
+        rows = [
+            {**event, "created_at": _parse_ts(event["created_at"]), "updated_at": _parse_ts(event["created_at"])}
+            for event in events
+        ]
+        # sin engine explicito se usa el de la app (creado en el primer uso)
+        with (self.engine or database.engine).begin() as connection:
+            for start in range(0, len(rows), self.flush_size):
+                connection.execute(insert(ActivityLog), rows[start:start + self.flush_size])
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "running": self.running,
+            "queue_depth": self.queue_depth,
+            "flushed": self.flushed,
+            "flush_failures": self.flush_failures,
+            "flush_seconds_last": round(self.flush_seconds_last, 6),
+            "flush_seconds_max": round(self.flush_seconds_max, 6),
+        }
+
+
+def _parse_ts(value) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
+def activity_event(
+        user_id: Optional[int],
+        action: str,
+        resource_type: Optional[str],
+        resource_id: Optional[str],
+        details: Optional[str],
+) -> dict[str, Any]:
+    return {
+        "user_id": user_id,
+        "action": action,
+        "resource_type": resource_type,
+        "resource_id": resource_id,
+        "details": details,
+        # hora del evento, no la del flush
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+activity_writer = ActivityWriter(
+    flush_size = settings.activity_flush_size,
+    flush_interval = settings.activity_flush_interval_seconds,
+    max_queue = settings.activity_max_queue,
+    spool_dir = settings.activity_spool_dir or None,
+    fsync = settings.activity_spool_fsync,
+)
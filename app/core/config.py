@@ -6,14 +6,96 @@ from dotenv import load_dotenv
 # Carga las variables desde .env
 load_dotenv()
 
+def _env_bool(name: str, default: str = "false") -> bool:
+    return os.getenv(name, default).strip().lower() in ("1", "true", "yes", "on")
+
 @dataclass
 class Settings:
     app_name: str = "Employee Management API"
     environment: str = os.getenv("ENVIRONMENT", "dev")
     database_url: str = os.getenv("DATABASE_URL")
 
+    # Handlers con AsyncSession (asyncpg / aiosqlite) en vez de Session en el threadpool
+    db_async: bool = _env_bool("DB_ASYNC")
+
+    # Pool de conexiones de SQLAlchemy (por worker de uvicorn)
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    db_pool_timeout: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    db_pool_pre_ping: bool = _env_bool("DB_POOL_PRE_PING", "true")
+    # NullPool: usar cuando hay un pooler externo (PgBouncer)
+    db_null_pool: bool = _env_bool("DB_NULL_POOL")
+
     secret_key: str = os.getenv("SECRET_KEY", "dev-secret-key")
     algorithm: str = os.getenv("ALGORITHM", "HS256")
-    access_token_expire_minutes: int = int (os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+    # access tokens cortos y sin estado (llevan id, rol y token_version); se renuevan con /auth/refresh
+    access_token_expire_minutes: int = int (os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "15"))
+    refresh_token_expire_days: int = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "14"))
+
+    # Carga masiva de empleados (POST /employees/bulk)
+    bulk_max_rows: int = int(os.getenv("BULK_MAX_ROWS", "50000"))
+    bulk_chunk_size: int = int(os.getenv("BULK_CHUNK_SIZE", "1000"))
+
+    # Busqueda por lista de ids (POST /employees/lookup)
+    lookup_max_ids: int = int(os.getenv("LOOKUP_MAX_IDS", "1000"))
+    # ids por WHERE id IN (...): listas largas se parten en varias queries
+    lookup_chunk_size: int = int(os.getenv("LOOKUP_CHUNK_SIZE", "500"))
+
+    # Filas por lote al exportar (GET /employees/export)
+    export_batch_size: int = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+    # Activity log: "inline" (en la misma transaccion) o "buffered" (lotes en background)
+    activity_log_mode: str = os.getenv("ACTIVITY_LOG_MODE", "inline")
+    activity_flush_size: int = int(os.getenv("ACTIVITY_FLUSH_SIZE", "100"))
+    activity_flush_interval_seconds: float = float(os.getenv("ACTIVITY_FLUSH_INTERVAL_SECONDS", "1.0"))
+    activity_max_queue: int = int(os.getenv("ACTIVITY_MAX_QUEUE", "10000"))
+    # directorio del spool NDJSON (vacio = sin spool, se pierden eventos si el proceso muere)
+    activity_spool_dir: str = os.getenv("ACTIVITY_SPOOL_DIR", "")
+    activity_spool_fsync: bool = _env_bool("ACTIVITY_SPOOL_FSYNC")
+    # GET /activity: tamaño de pagina maximo
+    activity_page_max: int = int(os.getenv("ACTIVITY_PAGE_MAX", "200"))
+    # retencion (scripts/activity_retention.py): dias a conservar (0 = sin limite)
+    activity_retention_days: int = int(os.getenv("ACTIVITY_RETENTION_DAYS", "365"))
+    # particiones mensuales creadas por adelantado (solo con la tabla particionada en Postgres)
+    activity_partition_months_ahead: int = int(os.getenv("ACTIVITY_PARTITION_MONTHS_AHEAD", "3"))
+    # filas por DELETE cuando la tabla no esta particionada
+    activity_delete_batch_size: int = int(os.getenv("ACTIVITY_DELETE_BATCH_SIZE", "5000"))
+    # archivo (scripts/activity_archive.py): gzip NDJSON por mes en este directorio
+    activity_archive_dir: str = os.getenv("ACTIVITY_ARCHIVE_DIR", "archive/activity")
+    # filas con mas de estos dias se archivan y se borran de la tabla
+    activity_archive_after_days: int = int(os.getenv("ACTIVITY_ARCHIVE_AFTER_DAYS", "90"))
+
+    # Cache de respuestas de GET /employees: "memory" (default, LRU por proceso),
+    # "redis" (entradas compartidas entre workers) o "none". Las versiones estan en
+    # la BD (cache_versions), asi que cualquier backend es correcto con varios workers
+    response_cache_backend: str = os.getenv("RESPONSE_CACHE_BACKEND", "memory")
+    response_cache_url: str = os.getenv("RESPONSE_CACHE_URL", "redis://localhost:6379/0")
+    response_cache_size: int = int(os.getenv("RESPONSE_CACHE_SIZE", "10000"))
+    response_cache_ttl_seconds: float = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "30"))
+
+    # /metrics (formato Prometheus) + middleware de latencia y conteo de queries
+    metrics_enabled: bool = _env_bool("METRICS_ENABLED", "true")
+    # statements mas lentos que esto se loguean, con los parametros ocultos (0 = deshabilitado)
+    slow_query_ms: float = float(os.getenv("SLOW_QUERY_MS", "200"))
+    # el mismo statement N veces en un request se loguea como posible N+1 (0 = deshabilitado)
+    n_plus_one_threshold: int = int(os.getenv("N_PLUS_ONE_THRESHOLD", "5"))
+    # headers X-DB-Queries / X-DB-Time; por defecto en todo entorno menos production
+    db_query_headers: bool = _env_bool(
+        "DB_QUERY_HEADERS", "false" if os.getenv("ENVIRONMENT", "dev") == "production" else "true"
+    )
+
+    # Hash de passwords (pbkdf2_sha256): cambiar los rounds re-hashea cada password en su proximo login
+    password_hash_rounds: int = int(os.getenv("PASSWORD_HASH_ROUNDS", "29000"))
+    # threads dedicados a hashear/verificar passwords (maximo de hashes en paralelo)
+    password_hash_workers: int = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+
+    # Cache de usuarios autenticados (0 = deshabilitado)
+    principal_cache_size: int = int(os.getenv("PRINCIPAL_CACHE_SIZE", "1024"))
+    principal_cache_ttl_seconds: float = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "30"))
+
+    # Cache de payloads JWT ya verificados (0 = deshabilitado)
+    token_cache_size: int = int(os.getenv("TOKEN_CACHE_SIZE", "4096"))
+    token_cache_ttl_seconds: float = float(os.getenv("TOKEN_CACHE_TTL_SECONDS", "300"))
 
 settings = Settings()
\ No newline at end of file
@@ -0,0 +1,199 @@
+"""
+Estadisticas de empleados (GET /employees/stats) desde la tabla employee_stats.
+Cada handler que cambia empleados calcula el delta entre el estado anterior y el
+nuevo (departamento, mes de ingreso, activo) y lo aplica con un upsert en la
+misma transaccion; recompute_stats() la reconstruye desde employees.
+"""
+
+from collections import Counter
+from collections.abc import Iterable
+from datetime import date
+from typing import Any, Optional
+
+from sqlalchemy import delete, func, select, text, update
+from sqlalchemy import insert as generic_insert
+
+from app.db.deps import AsyncDB
+from app.models.employee import Employee
+from app.models.employee_stat import EmployeeStat
+
+DEPARTMENT = "department"
+HIRE_MONTH = "hire_month"
+
+# (department, hired_at, is_active) de un empleado
+StatsKey = tuple[Optional[str], Optional[date], bool]
+Deltas = dict[tuple[str, str], tuple[int, int]]
+
+
+def stats_key(department: Optional[str], hired_at: Optional[date], is_active: bool) -> StatsKey:
+    return (department, hired_at, bool(is_active))
+
+
+def employee_key(employee: Any) -> StatsKey:
+    return stats_key(employee.department, employee.hired_at, employee.is_active)
+
+
+def _buckets(key: StatsKey) -> list[tuple[str, str]]:
+    department, hired_at, _ = key
+    month = hired_at.strftime("%Y-%m") if hired_at else ""
+    return [(DEPARTMENT, department or ""), (HIRE_MONTH, month)]
+
+
+def _count(weighted: Iterable[tuple[StatsKey, int]]) -> Deltas:
+    active: Counter = Counter()
+    inactive: Counter = Counter()
+    for key, weight in weighted:
+        counter = active if key[2] else inactive
+        for bucket in _buckets(key):
+            counter[bucket] += weight
+    return {
+        bucket: (active[bucket], inactive[bucket])
+        for bucket in sorted(set(active) | set(inactive))
+        if active[bucket] or inactive[bucket]
+    }
+
+
+def stats_deltas(before: Iterable[StatsKey] = (), after: Iterable[StatsKey] = ()) -> Deltas:
+    """Delta de (active, inactive) por (dimension, bucket); sin entradas en cero."""
+    return _count([(key, -1) for key in before] + [(key, 1) for key in after])
+
+
+def count_deltas(
+    before: Iterable[tuple[StatsKey, int]] = (),
+    after: Iterable[tuple[StatsKey, int]] = (),
+) -> Deltas:
+    """Como stats_deltas, con las claves ya agrupadas: (clave, cantidad de empleados)."""
+    return _count([(key, -count) for key, count in before] + [(key, count) for key, count in after])
+
+
+def _grouped_keys(*clauses):
+    return (
+        select(Employee.department, Employee.hired_at, Employee.is_active, func.count())
+        .where(*clauses)
+        .group_by(Employee.department, Employee.hired_at, Employee.is_active)
+    )
+
+
+async def count_keys(db: AsyncDB, *clauses) -> list[tuple[StatsKey, int]]:
+    """(clave, cantidad) de los empleados que cumplen clauses, en un solo SELECT agrupado."""
+    rows = await db.execute(_grouped_keys(*clauses))
+    return [(stats_key(department, hired_at, is_active), count) for department, hired_at, is_active, count in rows.all()]
+
+
+def _upsert(dialect_name: str, deltas: Deltas):
+    rows = [
+        {"dimension": dimension, "bucket": bucket, "active": active, "inactive": inactive}
+        for (dimension, bucket), (active, inactive) in deltas.items()
+    ]
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+
+    stmt = insert(EmployeeStat).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements = [EmployeeStat.dimension, EmployeeStat.bucket],
+        set_ = {
+            "active": EmployeeStat.active + stmt.excluded.active,
+            "inactive": EmployeeStat.inactive + stmt.excluded.inactive,
+        },
+    )
+
+
+async def apply_stats_deltas(db: AsyncDB, deltas: Deltas) -> None:
+    """Aplica el delta en la transaccion actual (se confirma con el commit del handler)."""
+    if not deltas:
+        return
+    # un solo statement, con las claves ordenadas: dos requests concurrentes
+    # bloquean las filas en el mismo orden (sin deadlocks)
+    stmt = _upsert(db.get_bind().dialect.name, deltas)
+    if stmt is not None:
+        await db.execute(stmt)
+        return
+
+    for (dimension, bucket), (active, inactive) in deltas.items():
+        result = await db.execute(
+            update(EmployeeStat)
+            .where(EmployeeStat.dimension == dimension, EmployeeStat.bucket == bucket)
+            .values(active = EmployeeStat.active + active, inactive = EmployeeStat.inactive + inactive)
+        )
+        if result.rowcount == 0:
+            await db.execute(generic_insert(EmployeeStat).values(
+                dimension = dimension, bucket = bucket, active = active, inactive = inactive,
+            ))
+
+
+def build_stats(rows: Iterable[tuple[str, str, int, int]]) -> dict[str, Any]:
+    """Respuesta de GET /employees/stats a partir de las filas de employee_stats."""
+    by_department = []
+    hires_by_month = []
+    for dimension, bucket, active, inactive in rows:
+        if not active and not inactive:
+            continue
+        entry = {"active": active, "inactive": inactive, "total": active + inactive}
+        if dimension == DEPARTMENT:
+            by_department.append({"department": bucket or None, **entry})
+        elif dimension == HIRE_MONTH and bucket:
+            # sin fecha de ingreso: cuenta en los totales pero no es una contratacion de un mes
+            hires_by_month.append({"month": bucket, **entry})
+
+    active = sum(entry["active"] for entry in by_department)
+    inactive = sum(entry["inactive"] for entry in by_department)
+    by_department.sort(key = lambda entry: (entry["department"] is None, entry["department"] or ""))
+    hires_by_month.sort(key = lambda entry: entry["month"])
+    return {
+        "total": active + inactive,
+        "active": active,
+        "inactive": inactive,
+        "by_department": by_department,
+        "hires_by_month": hires_by_month,
+    }
+
+
+async def read_stats(db: AsyncDB) -> dict[str, Any]:
+    rows = await db.execute(
+        select(EmployeeStat.dimension, EmployeeStat.bucket, EmployeeStat.active, EmployeeStat.inactive)
+    )
+    return build_stats(rows.all())
+
+
+def compute_deltas(connection) -> Deltas:
+    """Contadores completos desde employees (agrupado por fecha, no por fila)."""
+    rows = connection.execute(_grouped_keys())
+    return _count((stats_key(department, hired_at, is_active), count) for department, hired_at, is_active, count in rows)
+
+
+def recompute_stats(connection, dry_run: bool = False) -> dict[tuple[str, str], dict[str, tuple[int, int]]]:
+    """
+    Reconstruye employee_stats desde employees (reparacion). Devuelve las
+    diferencias encontradas: {(dimension, bucket): {"stored": ..., "actual": ...}}.
+    En Postgres toma un lock EXCLUSIVE sobre employee_stats: los handlers que
+    escriben en paralelo esperan y aplican su delta sobre el valor recalculado.
+    """
+    if connection.dialect.name == "postgresql" and not dry_run:
+        connection.execute(text(f"LOCK TABLE {EmployeeStat.__tablename__} IN EXCLUSIVE MODE"))
+
+    actual = compute_deltas(connection)
+    stored = {
+        (dimension, bucket): (active, inactive)
+        for dimension, bucket, active, inactive in connection.execute(
+            select(EmployeeStat.dimension, EmployeeStat.bucket, EmployeeStat.active, EmployeeStat.inactive)
+        )
+        if active or inactive
+    }
+    drift = {
+        bucket: {"stored": stored.get(bucket, (0, 0)), "actual": actual.get(bucket, (0, 0))}
+        for bucket in sorted(set(stored) | set(actual))
+        if stored.get(bucket, (0, 0)) != actual.get(bucket, (0, 0))
+    }
+
+    if not dry_run:
+        connection.execute(delete(EmployeeStat))
+        if actual:
+            connection.execute(generic_insert(EmployeeStat), [
+                {"dimension": dimension, "bucket": bucket, "active": active, "inactive": inactive}
+                for (dimension, bucket), (active, inactive) in actual.items()
+            ])
+    return drift
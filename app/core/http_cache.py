@@ -0,0 +1,38 @@
+import hashlib
+from typing import Iterable, Optional
+
+
+def _etag(raw: str) -> str:
+    return '"' + hashlib.blake2b(raw.encode(), digest_size = 16).hexdigest() + '"'
+
+
+def resource_etag(resource_id: int, version: int) -> str:
+    """ETag fuerte de un recurso: cambia con cada escritura (columna version)."""
+    return _etag(f"{resource_id}:{version}")
+
+
+def collection_etag(items: Iterable[tuple[int, int]]) -> str:
+    """Validador de una pagina: depende de los ids y la version de cada fila."""
+    return _etag("|".join(f"{resource_id}:{version}" for resource_id, version in items))
+
+
+def _parse(header: str) -> list[str]:
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def if_none_match(header: Optional[str], etag: str) -> bool:
+    """True si el cliente ya tiene esta version (comparacion debil, RFC 9110)."""
+    if not header:
+        return False
+    tags = _parse(header)
+    if "*" in tags:
+        return True
+    return etag in (tag.removeprefix("W/") for tag in tags)
+
+
+def if_match(header: Optional[str], etag: str) -> bool:
+    """True si la precondicion If-Match se cumple (comparacion fuerte)."""
+    if header is None:
+        return True
+    tags = _parse(header)
+    return "*" in tags or etag in tags
@@ -1,10 +1,17 @@
+from datetime import datetime, timezone
 from typing import Optional
-from sqlalchemy.orm import Session # <- Correcto, no de sqlalchemy
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.core.activity_writer import activity_event, activity_writer
+from app.db.deps import AsyncDB
 from app.models.activity_log import ActivityLog
 from app.models.user import User
 
+# eventos de la transaccion en curso, en session.info (se encolan recien con el commit)
+_PENDING_KEY = "pending_activity"
+
 def create_activity(
-        db: Session,
+        db: AsyncDB,
         user: Optional[User],
         action: str,
         resource_type: Optional[str] = None,
@@ -17,6 +24,34 @@ def create_activity(
         resource_type = resource_type,
         resource_id = str(resource_id) if resource_id is not None else None,
         details = details,
+        # hora del evento desde la app, como en modo buffered (mismo formato en
+        # todas las filas: GET /activity pagina por created_at)
+        created_at = datetime.now(timezone.utc),
     )
+    # modo buffered: se inserta por lotes fuera de la transaccion del request, pero
+    # solo si esa transaccion hace commit (si hace rollback el evento se descarta).
+    # Con el buffer lleno se escribe inline como siempre
+    if activity_writer.running and not activity_writer.full:
+        # ThreadedSession / AsyncSession envuelven una Session sync
+        session = getattr(db, "sync_session", db)
+        session.info.setdefault(_PENDING_KEY, []).append(activity_event(
+            user_id = entry.user_id,
+            action = entry.action,
+            resource_type = entry.resource_type,
+            resource_id = entry.resource_id,
+            details = entry.details,
+        ))
+        return entry
+
     db.add(entry)
-    return entry
\ No newline at end of file
+    return entry
+
+@event.listens_for(Session, "after_commit")
+def _enqueue_committed_activity(session: Session) -> None:
+    for pending in session.info.pop(_PENDING_KEY, ()):
+        # la transaccion ya se confirmo: no se puede rechazar aunque el buffer se haya llenado
+        activity_writer.enqueue(pending, force = True)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_activity(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
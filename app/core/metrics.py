@@ -0,0 +1,383 @@
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter as StatementCounter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger("uvicorn.error")
+
+# buckets de latencia HTTP / SQL (segundos), los mismos que usa prometheus_client
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# queries por request: mas de ~20 suele ser un N+1
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+
+LabelValues = tuple[str, ...]
+Sample = tuple[dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """Contador monotono con labels (formato de exposicion de Prometheus)."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(tuple(str(labels[name]) for name in self.labelnames), 0.0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(dict(zip(self.labelnames, key)))} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram:
+    """Histograma acumulado (_bucket / _sum / _count) con labels."""
+
+    kind = "histogram"
+
+    def __init__(
+            self,
+            name: str,
+            documentation: str,
+            labelnames: Iterable[str] = (),
+            buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # por cada combinacion de labels: [conteo por bucket..., +Inf], suma
+        self._values: dict[LabelValues, tuple[list[int], float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.get(key) or ([0] * (len(self.buckets) + 1), 0.0)
+            counts[index] += 1
+            self._values[key] = (counts, total + value)
+
+    def count(self, **labels: str) -> int:
+        entry = self._values.get(tuple(str(labels[name]) for name in self.labelnames))
+        return sum(entry[0]) if entry else 0
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted((key, (list(counts), total)) for key, (counts, total) in self._values.items())
+        lines = []
+        for key, (counts, total) in items:
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                bucket_labels = {**labels, "le": _format_value(bound)}
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+@dataclass
+class _Collector:
+    """Metrica calculada al momento del scrape (p. ej. estado del pool)."""
+    name: str
+    kind: str
+    documentation: str
+    collect: Callable[[], Iterable[Sample]]
+
+    def render(self) -> list[str]:
+        return [f"{self.name}{_format_labels(labels)} {_format_value(value)}" for labels, value in self.collect()]
+
+
+class MetricsRegistry:
+
+    def __init__(self):
+        self._metrics: list = []
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(
+            self,
+            name: str,
+            documentation: str,
+            labelnames: Iterable[str] = (),
+            buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(
+            self,
+            name: str,
+            kind: str,
+            documentation: str,
+            collect: Callable[[], Iterable[Sample]],
+    ) -> None:
+        self._metrics = [metric for metric in self._metrics if metric.name != name]
+        self._metrics.append(_Collector(name, kind, documentation, collect))
+
+    def reset(self) -> None:
+        for metric in self._metrics:
+            if hasattr(metric, "reset"):
+                metric.reset()
+
+    def render(self) -> str:
+        """Formato de texto de Prometheus (version 0.0.4)."""
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.counter(
+    "http_requests_total", "HTTP requests by method, route template and status", ("method", "route", "status"),
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency in seconds", ("method", "route", "status"),
+)
+http_request_db_queries = registry.histogram(
+    "http_request_db_queries", "SQL statements executed per HTTP request", ("route",), QUERY_COUNT_BUCKETS,
+)
+http_request_db_seconds = registry.histogram(
+    "http_request_db_seconds", "Time spent in SQL statements per HTTP request", ("route",),
+)
+db_queries_total = registry.counter("db_queries_total", "SQL statements executed")
+db_query_duration_seconds = registry.histogram("db_query_duration_seconds", "SQL statement latency in seconds")
+db_slow_queries_total = registry.counter("db_slow_queries_total", "SQL statements slower than SLOW_QUERY_MS")
+db_n_plus_one_total = registry.counter(
+    "db_n_plus_one_total", "Requests that repeated one SQL statement N_PLUS_ONE_THRESHOLD times or more", ("route",),
+)
+
+
+# --- estadisticas por request ----------------------------------------------
+
+@dataclass
+class RequestStats:
+    """Queries del request actual; los eventos de SQLAlchemy la actualizan via contextvar."""
+    # scope ASGI del request (metodo y ruta para los logs)
+    scope: Optional[dict] = None
+    queries: int = 0
+    db_seconds: float = 0.0
+    # veces que se ejecuto cada SELECT (mismo SQL, distintos parametros)
+    statements: StatementCounter = field(default_factory = StatementCounter)
+    # SLOW_QUERY_MS de la app que atiende el request (create_app(config))
+    slow_query_ms: Optional[float] = None
+
+    def where(self) -> str:
+        if self.scope is None:
+            return ""
+        return f" on {self.scope['method']} {_route_template(self.scope)}"
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statements ejecutados threshold veces o mas (posible N+1)."""
+        if threshold <= 0:
+            return []
+        return [(statement, count) for statement, count in self.statements.most_common() if count >= threshold]
+
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default = None)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    return _request_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """Reemplaza los valores de los parametros por su tipo (no se loguean datos)."""
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            # executemany: solo la forma de la primera fila
+            return [redact_parameters(parameters[0]), f"... {len(parameters)} rows"]
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def _is_select(statement: str) -> bool:
+    # los INSERT / UPDATE repetidos no son N+1: p. ej. insertmanyvalues con
+    # sort_by_parameter_order en SQLite ejecuta un INSERT ... RETURNING por fila
+    return statement.lstrip()[:6].upper() in ("SELECT", "WITH")
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    db_queries_total.inc()
+    db_query_duration_seconds.observe(elapsed)
+    # run_in_threadpool copia el contexto, asi que el objeto del request es el mismo
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+        if _is_select(statement):
+            stats.statements[statement] += 1
+
+    # fuera de un request (scripts, lifespan) vale el settings global
+    slow_query_ms = settings.slow_query_ms
+    if stats is not None and stats.slow_query_ms is not None:
+        slow_query_ms = stats.slow_query_ms
+    if slow_query_ms > 0 and elapsed * 1000 >= slow_query_ms:
+        db_slow_queries_total.inc()
+        logger.warning(
+            "Slow query (%.1f ms)%s: %s params = %s",
+            elapsed * 1000,
+            stats.where() if stats is not None else "",
+            " ".join(statement.split()),
+            redact_parameters(parameters),
+        )
+
+
+def _handle_error(exception_context):
+    starts = exception_context.connection.info.get("query_start") if exception_context.connection else None
+    if starts:
+        starts.pop()
+
+
+def instrument_queries() -> None:
+    """Registra los hooks de SQL sobre todos los Engine (sync y el sync_engine de los async)."""
+    if event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+
+
+# --- middleware ------------------------------------------------------------
+
+def _route_template(scope) -> str:
+    """
+    Template de la ruta matcheada (/api/v1/employees/{employee_id}). El path crudo
+    no se usa como label para no explotar la cardinalidad.
+    """
+    route = scope.get("route")
+    if route is None or not hasattr(route, "path_regex"):
+        return "unmatched"
+    path = scope["path"]
+    if route.path_regex.match(path):
+        return route.path
+    # algunas versiones de FastAPI dejan la ruta sin el prefijo de include_router
+    for index, char in enumerate(path):
+        if char == "/" and index and route.path_regex.match(path[index:]):
+            return path[:index] + route.path
+    return route.path
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI: latencia por template de ruta y status, y queries/tiempo de BD
+    por request. Se mide hasta el ultimo chunk del body (incluye respuestas en streaming).
+    Con DB_QUERY_HEADERS agrega X-DB-Queries / X-DB-Time (queries hechas hasta que
+    empieza la respuesta) y al final loguea los statements repetidos (N+1).
+    """
+
+    def __init__(self, app, config = settings):
+        self.app = app
+        self.config = config
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        stats = RequestStats(scope = scope, slow_query_ms = self.config.slow_query_ms)
+        token = _request_stats.set(stats)
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.config.db_query_headers:
+                    message = {
+                        **message,
+                        "headers": [
+                            *message.get("headers", []),
+                            (b"x-db-queries", str(stats.queries).encode()),
+                            (b"x-db-time", f"{stats.db_seconds * 1000:.2f}".encode()),
+                        ],
+                    }
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _request_stats.reset(token)
+            route = _route_template(scope)
+            labels = {"method": scope["method"], "route": route, "status": str(status_code)}
+            http_requests_total.inc(**labels)
+            http_request_duration_seconds.observe(elapsed, **labels)
+            http_request_db_queries.observe(stats.queries, route = route)
+            http_request_db_seconds.observe(stats.db_seconds, route = route)
+
+            repeated = stats.repeated(self.config.n_plus_one_threshold)
+            if repeated:
+                db_n_plus_one_total.inc(route = route)
+                for statement, count in repeated:
+                    logger.warning(
+                        "Possible N+1 on %s %s: statement executed %d times: %s",
+                        scope["method"],
+                        route,
+                        count,
+                        " ".join(statement.split()),
+                    )
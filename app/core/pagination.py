@@ -0,0 +1,103 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, Optional
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+class InvalidCursor(ValueError):
+    """El cursor recibido no se puede decodificar o no corresponde al orden pedido."""
+
+
+def _dump_value(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _load_value(column, value: Any) -> Any:
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return python_type(value)
+
+
+def encode_cursor(sort: str, value: Any, last_id: int) -> str:
+    """
+    Genera un cursor opaco con la ultima posicion vista (valor de orden + id).
+    """
+    raw = json.dumps(
+        {"s": sort, "v": _dump_value(value), "id": last_id},
+        separators = (",", ":"),
+    ).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, column) -> tuple[Any, int]:
+    """
+    Decodifica un cursor generado por encode_cursor.
+    El cursor solo es valido para el mismo orden (sort) con el que se genero.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if data["s"] != sort:
+            raise InvalidCursor("Cursor does not match sort order")
+        return _load_value(column, data["v"]), int(data["id"])
+    except InvalidCursor:
+        raise
+    except (binascii.Error, ValueError, KeyError, TypeError) as exc:
+        raise InvalidCursor("Malformed cursor") from exc
+
+
+def keyset_order(column, id_column, descending: bool = False) -> list:
+    """ORDER BY estable: columna de orden + id como desempate (NULLs al final)."""
+    if column is id_column:
+        return [id_column.desc() if descending else id_column.asc()]
+
+    ordered = column.desc() if descending else column.asc()
+    if column.nullable:
+        ordered = ordered.nulls_last()
+    return [ordered, id_column.desc() if descending else id_column.asc()]
+
+
+def keyset_predicate(
+        column,
+        id_column,
+        value: Any,
+        last_id: int,
+        descending: bool = False,
+) -> ColumnElement:
+    """
+    Condicion WHERE para "buscar" la siguiente pagina despues de (value, last_id).
+    Equivale a la comparacion de tuplas (column, id) > (value, last_id) respetando
+    la direccion del orden y que los NULLs van al final.
+    """
+    id_after = id_column < last_id if descending else id_column > last_id
+    if column is id_column:
+        return id_after
+
+    if value is None:
+        # ya estamos dentro del grupo de NULLs (siempre al final)
+        return and_(column.is_(None), id_after)
+
+    value_after = column < value if descending else column > value
+    predicate = or_(value_after, and_(column == value, id_after))
+    if column.nullable:
+        predicate = or_(predicate, column.is_(None))
+    return predicate
+
+
+def next_cursor(items: list, limit: int, sort: str, sort_attr: str) -> Optional[str]:
+    """Devuelve el cursor de la siguiente pagina, o None si esta fue la ultima."""
+    if len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(sort, getattr(last, sort_attr), last.id)
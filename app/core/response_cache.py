@@ -0,0 +1,213 @@
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy import insert, select, update
+
+from app.core.cache import TTLCache
+from app.core.config import Settings, settings
+from app.db.deps import AsyncDB
+from app.models.cache_version import CacheVersion
+from app.models.employee import Employee
+
+
+@dataclass
+class CachedResponse:
+    """Body JSON ya serializado + headers (ETag, X-Next-Cursor)."""
+    body: bytes
+    headers: dict[str, str] = field(default_factory = dict)
+
+    def encode(self) -> bytes:
+        return json.dumps(self.headers).encode() + b"\n" + self.body
+
+    @classmethod
+    def decode(cls, raw: bytes) -> "CachedResponse":
+        headers, body = raw.split(b"\n", 1)
+        return cls(body = body, headers = json.loads(headers))
+
+
+class CacheBackend(ABC):
+    """
+    Interfaz minima tipo Redis (GET / SET con TTL / DEL) para las respuestas.
+    Las versiones no viven aca sino en la BD (cache_versions / employees.version),
+    asi un cache por proceso sigue siendo correcto con varios workers.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    async def clear(self) -> None:
+        ...
+
+
+class InMemoryBackend(CacheBackend):
+    """LRU por proceso (default): cada worker tiene sus entradas, las versiones son comunes."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._values = TTLCache(maxsize = maxsize, ttl = ttl)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._values.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._values.set(key, value, ttl = ttl)
+
+    async def delete(self, key: str) -> None:
+        self._values.delete(key)
+
+    async def clear(self) -> None:
+        self._values.clear()
+
+
+class RedisBackend(CacheBackend):
+    """
+    Backend sobre un cliente redis.asyncio (o cualquier servidor compatible): las
+    entradas se comparten entre workers e instancias (mas hits que un LRU por proceso).
+    """
+
+    def __init__(self, client, prefix: str = "ema:"):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisBackend":
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as exc:
+            raise RuntimeError("RESPONSE_CACHE_BACKEND=redis requires the 'redis' package") from exc
+        return cls(redis_asyncio.from_url(url))
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(self.prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self.client.set(self.prefix + key, value, px = max(1, int(ttl * 1000)))
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self.prefix + key)
+
+    async def clear(self) -> None:
+        async for key in self.client.scan_iter(match = self.prefix + "*"):
+            await self.client.delete(key)
+
+
+class EmployeeResponseCache:
+    """
+    Cache de respuestas de GET /employees y GET /employees/{id}.
+    Las claves llevan un numero de version leido de la BD: employees.version para el
+    detalle (el ORM y los endpoints bulk ya lo incrementan) y el contador
+    cache_versions["employees:list"] para los listados, que cada escritura incrementa
+    en su misma transaccion. Las entradas viejas simplemente dejan de leerse, en todos
+    los workers, sin importar en que proceso esta el cache.
+    """
+
+    LIST_VERSION = "employees:list"
+
+    def __init__(self, backend: Optional[CacheBackend], ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.config: Optional[Settings] = None
+
+    def configure(self, config: Settings) -> None:
+        """Backend y TTL de create_app(config); las entradas del backend anterior se descartan."""
+        self.config = config
+        self.backend = _build_backend(config)
+        self.ttl = config.response_cache_ttl_seconds
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None and self.ttl > 0
+
+    async def _get(self, key: str) -> Optional[CachedResponse]:
+        raw = await self.backend.get(key)
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return CachedResponse.decode(raw)
+
+    async def get_employee(self, db: AsyncDB, employee_id: int) -> tuple[Optional[CachedResponse], Optional[str]]:
+        """
+        Devuelve (entrada, clave); la clave se usa despues para guardar en un miss.
+        Sin clave si el empleado no existe (la ruta responde 404 sin cachear).
+        """
+        if not self.enabled:
+            return None, None
+        version = await db.scalar(select(Employee.version).where(Employee.id == employee_id))
+        if version is None:
+            return None, None
+        key = f"employees:{employee_id}:{version}"
+        return await self._get(key), key
+
+    async def get_list(self, db: AsyncDB, query: str) -> tuple[Optional[CachedResponse], Optional[str]]:
+        if not self.enabled:
+            return None, None
+        version = await db.scalar(select(CacheVersion.version).where(CacheVersion.name == self.LIST_VERSION))
+        digest = hashlib.blake2b(query.encode(), digest_size = 16).hexdigest()
+        key = f"employees:list:{version or 0}:{digest}"
+        return await self._get(key), key
+
+    async def store(self, key: Optional[str], entry: CachedResponse) -> None:
+        if key is not None:
+            await self.backend.set(key, entry.encode(), self.ttl)
+
+    async def invalidate_employees(self, db: AsyncDB) -> None:
+        """
+        Llamar dentro de la transaccion de cualquier escritura de empleados (antes del
+        commit): la version de los listados cambia junto con los datos. El detalle no
+        necesita nada, employees.version ya cambio con el UPDATE.
+        """
+        if not self.enabled:
+            return
+        result = await db.execute(
+            update(CacheVersion)
+            .where(CacheVersion.name == self.LIST_VERSION)
+            .values(version = CacheVersion.version + 1)
+        )
+        if result.rowcount == 0:
+            # tablas creadas con create_all (sin la fila de la migracion)
+            await db.execute(insert(CacheVersion).values(name = self.LIST_VERSION, version = 1))
+
+    async def clear(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        if self.backend is not None:
+            await self.backend.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__ if self.backend is not None else None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+def _build_backend(config: Settings) -> Optional[CacheBackend]:
+    if config.response_cache_backend == "redis":
+        return RedisBackend.from_url(config.response_cache_url)
+    if config.response_cache_backend == "memory":
+        return InMemoryBackend(
+            maxsize = config.response_cache_size,
+            ttl = config.response_cache_ttl_seconds,
+        )
+    return None
+
+
+response_cache = EmployeeResponseCache(backend = None, ttl = 0)
+response_cache.configure(settings)
@@ -1,45 +1,176 @@
+import asyncio
+import hashlib
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from app.core.cache import TTLCache
+from app.core.config import Settings, settings
 
-from app.core.config import settings
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# passlib y jose (cryptography) se importan en el primer uso, no al arrancar el worker
+
+@lru_cache(maxsize = 1)
+def get_pwd_context() -> "CryptContext":
+    from passlib.context import CryptContext
+
+    # los hashes con otros rounds (o de un esquema deprecado) quedan marcados para re-hash
+    return CryptContext(
+        schemes=["pbkdf2_sha256"],
+        deprecated="auto",
+        pbkdf2_sha256__rounds=settings.password_hash_rounds,
+    )
+
+def __getattr__(name: str):
+    # compatibilidad: security.pwd_context / security.jwt siguen disponibles
+    if name == "pwd_context":
+        return get_pwd_context()
+    if name == "jwt":
+        from jose import jwt
+
+        return jwt
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
+
+
+class PasswordHasher:
+    """
+    Pool de threads propio para el hashing (pbkdf2 libera el GIL dentro de hashlib).
+    Una tormenta de logins espera en la cola de este pool en vez de ocupar
+    el threadpool compartido que usan el resto de los endpoints.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = max(1, workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.completed = 0
+        self.rehashed = 0
+
+    async def _submit(self, func: Callable, *args):
+        with self._lock:
+            # se crea en el primer uso (y de nuevo despues de shutdown)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers = self.workers, thread_name_prefix = "password-hash")
+            self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            with self._lock:
+                self.pending -= 1
+                self.completed += 1
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(get_password_hash, password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+        """
+        (valido, nuevo_hash). nuevo_hash no es None cuando el hash guardado usa
+        parametros viejos (needs_update) y hay que persistir el nuevo.
+        """
+        valid, new_hash = await self._submit(get_pwd_context().verify_and_update, password, hashed_password)
+        if new_hash is not None:
+            self.rehashed += 1
+        return valid, new_hash
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait = True)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "pending": self.pending,
+            "completed": self.completed,
+            "rehashed": self.rehashed,
+        }
+
+
+password_hasher = PasswordHasher(workers = settings.password_hash_workers)
 
 def create_access_token(
         subject: str,
         expires_delta: Optional[timedelta] = None,
+        claims: Optional[dict[str, Any]] = None,
+        config: Settings = settings,
 ) -> str:
+    """
+    claims: datos extra del usuario (uid, role, ver) para autorizar sin ir a la BD.
+    config: la de la app (request.app.state.config); clave, algoritmo y duracion.
+    """
+    from jose import jwt
+
     if expires_delta is None:
-        expires_delta = timedelta(minutes = settings.access_token_expire_minutes)
+        expires_delta = timedelta(minutes = config.access_token_expire_minutes)
 
-        to_encode: dict[str, Any] = {
-            "sub": subject,
-            "exp": datetime.now(timezone.utc) + expires_delta,
-        }
+    to_encode: dict[str, Any] = {
+        **(claims or {}),
+        "sub": subject,
+        "exp": datetime.now(timezone.utc) + expires_delta,
+    }
 
-        encoded_jwt = jwt.encode(
-            to_encode,
-            settings.secret_key,
-            algorithm = settings.algorithm,
-        )
-        return encoded_jwt
+    encoded_jwt = jwt.encode(
+        to_encode,
+        config.secret_key,
+        algorithm = config.algorithm,
+    )
+    return encoded_jwt
+
+def user_claims(user) -> dict[str, Any]:
+    """Claims del access token de un usuario (ver deps_auth.get_token_principal)."""
+    return {"uid": user.id, "role": user.role.value, "ver": user.token_version}
+
+def hash_refresh_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+def create_refresh_token() -> tuple[str, str]:
+    """(token opaco para el cliente, hash que se guarda en refresh_tokens)."""
+    token = secrets.token_urlsafe(32)
+    return token, hash_refresh_token(token)
     
-def decode_access_token(token: str) -> Optional[dict[str, Any]]:
+# Payloads ya verificados, indexados por digest del token (nunca el token en claro)
+token_cache = TTLCache(
+    maxsize = settings.token_cache_size,
+    ttl = settings.token_cache_ttl_seconds,
+)
+
+def decode_access_token(token: str, config: Settings = settings) -> Optional[dict[str, Any]]:
+    from jose import JWTError, jwt
+
+    # la clave de firma entra en el digest: un payload verificado con otra clave
+    # (otra app en el mismo proceso) no se reutiliza
+    key = hashlib.sha256(config.secret_key.encode() + b"\0" + token.encode()).digest()
+    cached = token_cache.get(key)
+    if cached is not None:
+        # el TTL ya respeta exp, pero nunca servimos un token expirado
+        if cached.get("exp", 0) > time.time():
+            return dict(cached)
+        token_cache.delete(key)
+
     try:
         payload = jwt.decode(
             token,
-            settings.secret_key,
-            algorithms=[settings.algorithm],
+            config.secret_key,
+            algorithms=[config.algorithm],
         )
-        return payload
     except JWTError:
-        return None
\ No newline at end of file
+        return None
+
+    exp = payload.get("exp")
+    if exp is not None:
+        token_cache.set(key, dict(payload), ttl = exp - time.time())
+    return payload
@@ -0,0 +1,33 @@
+import json
+from datetime import date, datetime
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional: sin el se usa json de la stdlib
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> bytes:
+    """
+    JSON compacto en bytes. Con orjson (si esta instalado) fechas, datetimes y
+    UUIDs se serializan nativamente en C; el resultado es el mismo que el de Pydantic.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option = orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, default = _default, ensure_ascii = False, separators = (",", ":")).encode()
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse que serializa con dumps() (orjson cuando esta disponible)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1 +1,8 @@
-from .session import Base, SessionLocal, engine
\ No newline at end of file
+from .session import Base, database
+
+
+def __getattr__(name: str):
+    # engine / SessionLocal / async_engine / AsyncSessionLocal se crean en el primer uso
+    from . import session
+
+    return getattr(session, name)
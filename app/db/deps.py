@@ -1,12 +1,118 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from typing import Any, Callable, Optional, Union
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from app.db.session import SessionLocal
+from app.db.session import database
+
+# igual que AsyncSession: los resultados se leen completos antes de volver
+_EXECUTE_OPTIONS = {"prebuffer_rows": True}
 
 def get_db() -> Generator[Session, None, None]:
-    db = SessionLocal()
+    db = database.sessionmaker()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+class ThreadedSession:
+    """
+    Expone la API de AsyncSession sobre una Session sync (modo DB_ASYNC=false).
+    Cada llamada que toca la BD se ejecuta en el threadpool, asi los handlers
+    async son los mismos en los dos modos.
+    """
+
+    def __init__(self, sync_session: Session):
+        self.sync_session = sync_session
+
+    def add(self, instance: Any) -> None:
+        self.sync_session.add(instance)
+
+    def add_all(self, instances) -> None:
+        self.sync_session.add_all(instances)
+
+    def get_bind(self, *args, **kw):
+        return self.sync_session.get_bind(*args, **kw)
+
+    async def execute(self, statement, params = None, **kw):
+        kw["execution_options"] = {**_EXECUTE_OPTIONS, **kw.get("execution_options", {})}
+        return await run_in_threadpool(self.sync_session.execute, statement, params, **kw)
+
+    async def scalar(self, statement, params = None, **kw):
+        return await run_in_threadpool(self.sync_session.scalar, statement, params, **kw)
+
+    async def stream(self, statement, params = None, **kw) -> "ThreadedResult":
+        # cursor del lado del servidor: las filas se leen por partes
+        kw["execution_options"] = {"stream_results": True, **kw.get("execution_options", {})}
+        result = await run_in_threadpool(self.sync_session.execute, statement, params, **kw)
+        return ThreadedResult(result)
+
+    async def scalars(self, statement, params = None, **kw):
+        result = await self.execute(statement, params, **kw)
+        return result.scalars()
+
+    async def get(self, entity, ident, **kw):
+        return await run_in_threadpool(self.sync_session.get, entity, ident, **kw)
+
+    async def delete(self, instance: Any) -> None:
+        await run_in_threadpool(self.sync_session.delete, instance)
+
+    async def flush(self, objects = None) -> None:
+        await run_in_threadpool(self.sync_session.flush, objects)
+
+    async def commit(self) -> None:
+        await run_in_threadpool(self.sync_session.commit)
+
+    async def rollback(self) -> None:
+        await run_in_threadpool(self.sync_session.rollback)
+
+    async def refresh(self, instance: Any, attribute_names = None) -> None:
+        await run_in_threadpool(self.sync_session.refresh, instance, attribute_names)
+
+    async def run_sync(self, fn: Callable[..., Any], *args, **kw) -> Any:
+        return await run_in_threadpool(fn, self.sync_session, *args, **kw)
+
+    async def close(self) -> None:
+        await run_in_threadpool(self.sync_session.close)
+
+
+class ThreadedResult:
+    """Equivalente minimo de AsyncResult: lee cada particion en el threadpool."""
+
+    def __init__(self, result):
+        self._result = result
+
+    async def partitions(self, size: Optional[int] = None) -> AsyncGenerator[list, None]:
+        iterator = self._result.partitions(size)
+        try:
+            while True:
+                partition = await run_in_threadpool(next, iterator, None)
+                if partition is None:
+                    break
+                yield partition
+        finally:
+            self._result.close()
+
+
+AsyncDB = Union[AsyncSession, ThreadedSession]
+
+async def get_async_db() -> AsyncGenerator[AsyncDB, None]:
+    """
+    Sesion para los handlers async.
+    Con DB_ASYNC=true usa AsyncSession (asyncpg / aiosqlite); si no, una
+    Session sync envuelta en ThreadedSession.
+    """
+    async_sessionmaker = database.async_sessionmaker
+    if async_sessionmaker is None:
+        db = database.sessionmaker()
+        try:
+            yield ThreadedSession(db)
+        finally:
+            await run_in_threadpool(db.close)
+        return
+
+    async with async_sessionmaker() as session:
+        yield session
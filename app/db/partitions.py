@@ -0,0 +1,104 @@
+"""
+Particiones mensuales por rango (PARTITION BY RANGE (created_at)) en Postgres.
+La tabla se convierte en la migracion solo si ACTIVITY_LOG_PARTITIONED=true;
+aca estan las operaciones de mantenimiento (crear meses por adelantado y
+borrar meses enteros), que se corren desde scripts/activity_retention.py.
+"""
+
+import re
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+_PARTITION_NAME = re.compile(r"_y(\d{4})m(\d{2})$")
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """activity_logs + 2026-10 -> activity_logs_y2026m10"""
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def partition_month(table: str, name: str) -> Optional[date]:
+    """Mes de una particion creada por partition_name (None para la default u otras)."""
+    if not name.startswith(f"{table}_"):
+        return None
+    match = _PARTITION_NAME.search(name)
+    if match is None:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def is_partitioned(connection: Connection, table: str) -> bool:
+    if connection.dialect.name != "postgresql":
+        return False
+    return bool(connection.scalar(
+        text(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = :table AND pg_table_is_visible(c.oid))"
+        ),
+        {"table": table},
+    ))
+
+
+def list_partitions(connection: Connection, table: str) -> list[str]:
+    return list(connection.scalars(
+        text(
+            "SELECT child.relname FROM pg_inherits i "
+            "JOIN pg_class child ON child.oid = i.inhrelid "
+            "JOIN pg_class parent ON parent.oid = i.inhparent "
+            "WHERE parent.relname = :table AND pg_table_is_visible(parent.oid) "
+            "ORDER BY child.relname"
+        ),
+        {"table": table},
+    ))
+
+
+def create_month_partition(connection: Connection, table: str, month: date) -> str:
+    month = month_start(month)
+    name = partition_name(table, month)
+    # limites en UTC: [primer dia del mes, primer dia del mes siguiente)
+    connection.execute(text(
+        f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table}" '
+        f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+        f"TO ('{add_months(month, 1).isoformat()} 00:00:00+00')"
+    ))
+    return name
+
+
+def ensure_partitions(connection: Connection, table: str, start: date, months_ahead: int) -> list[str]:
+    """Crea (si faltan) las particiones desde el mes de `start` hasta `months_ahead` meses despues."""
+    existing = set(list_partitions(connection, table))
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(month_start(start), offset)
+        if partition_name(table, month) not in existing:
+            created.append(create_month_partition(connection, table, month))
+    return created
+
+
+def expired_partitions(table: str, partitions: list[str], cutoff: datetime) -> list[str]:
+    """Particiones cuyo mes completo es anterior a cutoff (se pueden borrar enteras)."""
+    expired = []
+    for name in partitions:
+        month = partition_month(table, name)
+        if month is not None and add_months(month, 1) <= cutoff.date():
+            expired.append(name)
+    return expired
+
+
+def drop_partitions(connection: Connection, partitions: list[str]) -> None:
+    # DROP de una particion: instantaneo y sin dead tuples, a diferencia de un DELETE masivo
+    for name in partitions:
+        connection.execute(text(f'DROP TABLE IF EXISTS "{name}"'))
@@ -0,0 +1,95 @@
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+
+class PoolMetrics:
+    """Contadores de uso del pool (checkouts, espera y timeouts)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_checkout(self) -> None:
+        with self._lock:
+            self.checkouts += 1
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self, pool) -> dict[str, Any]:
+        with self._lock:
+            data: dict[str, Any] = {
+                "pool_class": type(pool).__name__,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
+        if isinstance(pool, QueuePool):
+            data.update(
+                size = pool.size(),
+                checked_in = pool.checkedin(),
+                checked_out = pool.checkedout(),
+                overflow = pool.overflow(),
+            )
+        return data
+
+
+pool_metrics = PoolMetrics()
+
+
+class _InstrumentedGet:
+    """Mide cuanto espera cada checkout (saturacion del pool)."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            pool_metrics.record_timeout()
+            raise
+        finally:
+            pool_metrics.record_wait(time.perf_counter() - start)
+
+
+class InstrumentedQueuePool(_InstrumentedGet, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedGet, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_options(settings, async_mode: bool = False) -> dict[str, Any]:
+    """Argumentos de create_engine / create_async_engine segun la configuracion del pool."""
+    if settings.database_url.startswith("sqlite"):
+        # SQLite usa su propio pool por defecto (tests / desarrollo)
+        return {}
+
+    if settings.db_null_pool:
+        return {"poolclass": NullPool}
+
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if async_mode else InstrumentedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
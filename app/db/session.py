@@ -1,7 +1,9 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from app.core.config import settings
+from app.db.pool import engine_options, pool_metrics
 
 
 class Base(DeclarativeBase):
@@ -9,13 +11,141 @@ class Base(DeclarativeBase):
     pass
 
 
-engine = create_engine(
-    settings.database_url,
-    future=True,
-)
+# drivers async equivalentes a los sync de DATABASE_URL
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
 
-SessionLocal = sessionmaker(
-    bind=engine,
-    autoflush=False,
-    autocommit=False,
-)
+
+def async_database_url(url: str) -> str:
+    """postgresql+psycopg2://... -> postgresql+asyncpg://... (sqlite -> aiosqlite)."""
+    parsed = make_url(url)
+    driver = _ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None or parsed.drivername in _ASYNC_DRIVERS.values():
+        return url
+    return parsed.set(drivername = driver).render_as_string(hide_password = False)
+
+
+class Database:
+    """
+    Engines y session factories, creados en el primer uso (o en el lifespan de la app)
+    y no al importar: importar la app no abre conexiones, no carga el dialecto/driver
+    y no falla si DATABASE_URL todavia no esta definido.
+    """
+
+    def __init__(self, config = None):
+        self.config = config or settings
+        self._engine = None
+        self._sessionmaker = None
+        self._async_engine = None
+        self._async_sessionmaker = None
+
+    def configure(self, config) -> None:
+        """Cambia la configuracion (create_app(settings)); descarta engines ya creados."""
+        self.dispose()
+        self.config = config
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            if not self.config.database_url:
+                raise RuntimeError("DATABASE_URL is not configured")
+            self._engine = create_engine(
+                self.config.database_url,
+                future=True,
+                **engine_options(self.config),
+            )
+            event.listen(self._engine, "checkout", _count_checkout)
+        return self._engine
+
+    @property
+    def sessionmaker(self) -> sessionmaker:
+        if self._sessionmaker is None:
+            self._sessionmaker = sessionmaker(
+                bind=self.engine,
+                autoflush=False,
+                autocommit=False,
+            )
+        return self._sessionmaker
+
+    @property
+    def async_engine(self):
+        """AsyncEngine (solo con DB_ASYNC=true, si no None)."""
+        if self._async_engine is None and self.config.db_async:
+            from sqlalchemy.ext.asyncio import create_async_engine
+
+            if not self.config.database_url:
+                raise RuntimeError("DATABASE_URL is not configured")
+            self._async_engine = create_async_engine(
+                async_database_url(self.config.database_url),
+                **engine_options(self.config, async_mode = True),
+            )
+            event.listen(self._async_engine.sync_engine, "checkout", _count_checkout)
+        return self._async_engine
+
+    @property
+    def async_sessionmaker(self):
+        if self._async_sessionmaker is None and self.async_engine is not None:
+            from sqlalchemy.ext.asyncio import async_sessionmaker
+
+            self._async_sessionmaker = async_sessionmaker(
+                bind=self.async_engine,
+                autoflush=False,
+                expire_on_commit=False,
+            )
+        return self._async_sessionmaker
+
+    @property
+    def pool(self):
+        """
+        Pool que usan los requests: el del AsyncEngine con DB_ASYNC=true, si no el del
+        engine sync. None si ese engine todavia no se creo (reportar metricas no lo crea).
+        """
+        if self.config.db_async:
+            return self._async_engine.sync_engine.pool if self._async_engine is not None else None
+        return self._engine.pool if self._engine is not None else None
+
+    def init(self) -> None:
+        """Crea los engines ahora (arranque de la app) en vez de en el primer request."""
+        self.sessionmaker
+        self.async_sessionmaker
+
+    def dispose(self) -> None:
+        if self._engine is not None:
+            self._engine.dispose()
+        if self._async_engine is not None:
+            # fuera del event loop: se descarta el pool sin cerrar las conexiones async
+            self._async_engine.sync_engine.dispose(close = False)
+        self._engine = self._sessionmaker = None
+        self._async_engine = self._async_sessionmaker = None
+
+    async def aclose(self) -> None:
+        """Cierre ordenado en el shutdown de la app."""
+        if self._async_engine is not None:
+            await self._async_engine.dispose()
+            self._async_engine = self._async_sessionmaker = None
+        self.dispose()
+
+
+def _count_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    pool_metrics.record_checkout()
+
+
+database = Database()
+
+
+# compatibilidad: `from app.db.session import engine / SessionLocal / ...` sigue
+# funcionando, pero resuelve (y crea) el engine recien al importarlo
+_LAZY_ATTRIBUTES = {
+    "engine": "engine",
+    "SessionLocal": "sessionmaker",
+    "async_engine": "async_engine",
+    "AsyncSessionLocal": "async_sessionmaker",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        return getattr(database, _LAZY_ATTRIBUTES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
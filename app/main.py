@@ -1,36 +1,38 @@
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 import logging
-from app.core.config import settings
+from app.core.config import Settings, settings
+from app.api.deps_auth import principal_cache
+from app.core.security import password_hasher, token_cache
+from app.core.activity_writer import activity_writer
+from app.core.response_cache import response_cache
+from app.core.metrics import MetricsMiddleware, instrument_queries, registry
+from app.db.pool import pool_metrics
+from app.db.session import database
 from app.api.v1.routes_auth import router as auth_router
+from app.api.v1.routes_activity import router as activity_router
 
 from app.api.v1.routes_employees import router as employees_router # nuevo import
 
 # from app.db.session import Base, engine # Importa tu base y enginge
 # from app.models import user, employee, activity_log # No se usan directo, pero registran los modelos
 
-app = FastAPI (
-    title = "Employee Management API",
-    version = "0.1.0",
-)
-
 # Centralized exception hadlers
 logger = logging.getLogger("uvicorn.error")
 
-@app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     logger.warning("HTTPException: %s path = %s", exc.detail, request.url.path)
     return JSONResponse({"detail": exc.detail}, status_code = exc.status_code)
 
-@app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     # Return validation errors in a consistent JSON shape
     logger.info("Request validation error on %s: %s", request.url.path, exc.errors())
     return JSONResponse({"detail": exc.errors()}, status_code = 422)
 
-@app.exception_handler(Exception)
 async def unhandled_exception_handler(request: Request, exc: Exception):
     # Catch-all for unexpected exceptions (avoid exposing internals in responses)
     logger.error("Unhandled exception at %s: %s", request.url.path, exc, exc_info = exc)
@@ -41,10 +43,101 @@ async def unhandled_exception_handler(request: Request, exc: Exception):
 #     # Temporalmente, hasta usar Alembic:
 #     Base.metadata.create_all(bind = engine)
 
-@app.get("/health", tags=["Health"])
-def health_check():
-    return {"status": "ok", "environment": settings.environment}
+def health_check(request: Request):
+    return {"status": "ok", "environment": request.app.state.config.environment}
+
+def health_stats():
+    pool = database.pool
+    # contadores internos para dimensionar caches
+    return {
+        "caches": {
+            "principals": principal_cache.stats(),
+            "tokens": token_cache.stats(),
+            "responses": response_cache.stats(),
+        },
+        "pool": pool_metrics.snapshot(pool) if pool is not None else None,
+        "activity_writer": activity_writer.stats(),
+        "password_hashing": password_hasher.stats(),
+    }
+
+def _cache_samples():
+    caches = {"principals": principal_cache, "tokens": token_cache, "responses": response_cache}
+    for name, cache in caches.items():
+        stats = cache.stats()
+        yield {"cache": name, "result": "hit"}, stats["hits"]
+        yield {"cache": name, "result": "miss"}, stats["misses"]
+
+def _pool_samples(*keys):
+    def collect():
+        pool = database.pool
+        if pool is None:
+            # engine sin crear todavia (p. ej. antes del startup): nada que reportar
+            return []
+        snapshot = pool_metrics.snapshot(pool)
+        return [({}, snapshot[key]) for key in keys if key in snapshot]
+    return collect
+
+registry.register_collector("cache_requests_total", "counter", "Cache lookups by cache and result", _cache_samples)
+registry.register_collector("db_pool_checkouts_total", "counter", "Connections checked out from the pool", _pool_samples("checkouts"))
+registry.register_collector("db_pool_timeouts_total", "counter", "Pool checkouts that timed out", _pool_samples("timeouts"))
+registry.register_collector("db_pool_wait_seconds_total", "counter", "Time spent waiting for a pool connection", _pool_samples("wait_seconds_total"))
+registry.register_collector("db_pool_checked_out", "gauge", "Connections currently checked out", _pool_samples("checked_out"))
+registry.register_collector("db_pool_overflow", "gauge", "Overflow connections currently open", _pool_samples("overflow"))
+
+def metrics():
+    return PlainTextResponse(registry.render(), media_type = "text/plain; version=0.0.4; charset=utf-8")
+
+def create_app(config: Settings = settings) -> FastAPI:
+    """
+    Arma la aplicacion sin tocar la BD: el engine (y el dialecto / driver) se crea
+    en el lifespan, asi importar la app es barato y no requiere DATABASE_URL.
+
+    config queda en app.state.config y las rutas / dependencias lo leen de ahi (ver
+    app/api/deps_config.py). El engine y el cache de respuestas son uno por proceso:
+    toman la config de la ultima app creada. Hashing de passwords, caches de
+    principals / tokens y el activity writer se arman al importar con el settings global.
+    """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        if database.config is not config:
+            database.configure(config)
+        database.init()
+        if config.activity_log_mode == "buffered":
+            await activity_writer.start()
+        yield
+        # flush final de lo que quede en el buffer
+        await activity_writer.stop()
+        password_hasher.shutdown()
+        await database.aclose()
+
+    app = FastAPI (
+        title = "Employee Management API",
+        version = "0.1.0",
+        lifespan = lifespan,
+    )
+
+    app.state.config = config
+    if response_cache.config is not config:
+        response_cache.configure(config)
+
+    if config.metrics_enabled:
+        instrument_queries()
+        app.add_middleware(MetricsMiddleware, config = config)
+
+    app.add_exception_handler(StarletteHTTPException, http_exception_handler)
+    app.add_exception_handler(RequestValidationError, validation_exception_handler)
+    app.add_exception_handler(Exception, unhandled_exception_handler)
+
+    app.add_api_route("/health", health_check, methods = ["GET"], tags = ["Health"])
+    app.add_api_route("/health/stats", health_stats, methods = ["GET"], tags = ["Health"])
+    if config.metrics_enabled:
+        app.add_api_route("/metrics", metrics, methods = ["GET"], include_in_schema = False)
+
+    # API v1 routers
+    app.include_router(auth_router, prefix = "/api/v1")
+    app.include_router(employees_router, prefix = "/api/v1")
+    app.include_router(activity_router, prefix = "/api/v1")
+    return app
 
-# API v1 routers
-app.include_router(auth_router, prefix = "/api/v1")
-app.include_router(employees_router, prefix = "/api/v1")
\ No newline at end of file
+app = create_app()
@@ -1,4 +1,6 @@
-from datetime import datetime
+import importlib
+import pkgutil
+from datetime import datetime, timezone
 
 from sqlalchemy import DateTime, func
 from sqlalchemy.orm import Mapped, mapped_column
@@ -6,18 +8,37 @@ from sqlalchemy.orm import Mapped, mapped_column
 from app.db.session import Base  # IMPORTANTE: usamos el mismo Base
 
 
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class TimestampMixin:
+    # el valor lo pone la app (default/onupdate de Python, con microsegundos): en
+    # SQLite func.now() guarda 'YYYY-MM-DD HH:MM:SS' y no compara bien con el valor
+    # del cursor (keyset), que se enlaza con '.ffffff'. El server_default queda para
+    # los INSERT que no pasan por SQLAlchemy.
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        default=utcnow,
         server_default=func.now(),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        default=utcnow,
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=utcnow,
         nullable=False,
     )
 
 
-__all__ = ["Base", "TimestampMixin"]
+def load_models() -> None:
+    """
+    Importa todos los modulos de app.models: registra todas las tablas en
+    Base.metadata (create_all fuera de la app, p. ej. benchmarks).
+    """
+    for module in pkgutil.iter_modules(__path__):
+        importlib.import_module(f"{__name__}.{module.name}")
+
+
+__all__ = ["Base", "TimestampMixin", "load_models", "utcnow"]
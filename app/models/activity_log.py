@@ -1,6 +1,6 @@
 from typing import Optional
 
-from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy import ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models import Base, TimestampMixin
@@ -8,6 +8,20 @@ from app.models import Base, TimestampMixin
 
 class ActivityLog(TimestampMixin, Base):
     __tablename__ = "activity_logs"
+    __table_args__ = (
+        # GET /activity ordena por (created_at, id) DESC; cada filtro tiene su indice
+        # con el orden al final para paginar con keyset sin ordenar en memoria
+        Index("ix_activity_logs_created_at_id", "created_at", "id"),
+        Index("ix_activity_logs_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_activity_logs_action_created_at_id", "action", "created_at", "id"),
+        Index(
+            "ix_activity_logs_resource_created_at_id",
+            "resource_type",
+            "resource_id",
+            "created_at",
+            "id",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
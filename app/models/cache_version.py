@@ -0,0 +1,16 @@
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models import Base
+
+
+class CacheVersion(Base):
+    """
+    Contadores de version del cache de respuestas (app/core/response_cache.py).
+    Viven en la BD para que todos los workers vean la misma version: cada escritura
+    la incrementa en su propia transaccion y las entradas viejas dejan de leerse.
+    """
+    __tablename__ = "cache_versions"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
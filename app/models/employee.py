@@ -1,6 +1,6 @@
 from typing import Optional
 
-from sqlalchemy import Boolean, Date, ForeignKey, Integer, String
+from sqlalchemy import DDL, Boolean, Date, ForeignKey, Index, Integer, String, event, literal_column, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models import Base, TimestampMixin
@@ -8,6 +8,32 @@ from app.models import Base, TimestampMixin
 
 class Employee(TimestampMixin, Base):
     __tablename__ = "employees"
+    __table_args__ = (
+        # listado: WHERE is_active = ? ORDER BY id LIMIT ?
+        Index("ix_employees_is_active_id", "is_active", "id"),
+        # reportes por departamento
+        Index("ix_employees_department_is_active_id", "department", "is_active", "id"),
+        Index("ix_employees_hired_at", "hired_at"),
+        # sort=last_name sobre activos (parcial: los inactivos no ocupan espacio)
+        Index(
+            "ix_employees_active_last_name_id",
+            "last_name",
+            "id",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active = 1"),
+        ),
+        # busqueda ?q= por nombre / email (ILIKE '%...%') con pg_trgm; solo Postgres
+        Index(
+            "ix_employees_full_name_trgm",
+            text("(first_name || ' ' || last_name) gin_trgm_ops"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_employees_email_trgm",
+            text("email gin_trgm_ops"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     first_name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -17,6 +43,9 @@ class Employee(TimestampMixin, Base):
     position: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     hired_at: Mapped[Optional[Date]] = mapped_column(Date, nullable=True)
+    # contador de versiones (ETag / If-Match): el ORM hace UPDATE ... WHERE version = :v
+    # y lo incrementa; updated_at no sirve (resolucion de 1 s en SQLite)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("1"))
 
     created_by_id: Mapped[Optional[int]] = mapped_column(
         Integer,
@@ -24,3 +53,15 @@ class Employee(TimestampMixin, Base):
         nullable=True,
     )
     created_by = relationship("User", backref="created_employees")
+
+    __mapper_args__ = {"version_id_col": version}
+
+
+# misma expresion que ix_employees_full_name_trgm (debe coincidir para usar el indice)
+EMPLOYEE_FULL_NAME = Employee.first_name + literal_column("' '") + Employee.last_name
+
+event.listen(
+    Employee.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,19 @@
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models import Base
+
+
+class EmployeeStat(Base):
+    """
+    Contadores de empleados por dimension, mantenidos en la misma transaccion
+    que cada alta / cambio / baja (GET /employees/stats no recorre employees).
+    dimension = "department" (bucket = departamento) o "hire_month" (bucket = YYYY-MM);
+    bucket "" = sin departamento / sin fecha de ingreso.
+    """
+    __tablename__ = "employee_stats"
+
+    dimension: Mapped[str] = mapped_column(String(20), primary_key=True)
+    bucket: Mapped[str] = mapped_column(String(100), primary_key=True)
+    active: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    inactive: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
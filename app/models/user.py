@@ -26,3 +26,5 @@ class User(TimestampMixin, Base):
         default=UserRole.EMPLOYEE,
     )
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    # se incrementa al cambiar rol o is_active: invalida los refresh tokens emitidos antes
+    token_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
@@ -0,0 +1,16 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+class ActivityLogRead(BaseModel):
+    id: int
+    user_id: Optional[int] = None
+    action: str
+    resource_type: Optional[str] = None
+    resource_id: Optional[str] = None
+    details: Optional[str] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -1,7 +1,7 @@
 from datetime import date
-from typing import Optional
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 
 class EmployeeBase(BaseModel):
     first_name: str
@@ -30,4 +30,72 @@ class EmployeeRead(EmployeeBase):
     created_by_id: Optional[int] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class EmployeeLookupRequest(BaseModel):
+    ids: List[int] = Field(min_length = 1)
+
+class EmployeeLookupResponse(BaseModel):
+    # en el orden pedido (sin repetidos)
+    items: List[EmployeeRead]
+    missing: List[int]
+
+class EmployeeBulkResult(BaseModel):
+    index: int
+    status: Literal["created", "updated", "duplicate", "invalid", "error"]
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+class EmployeeBulkResponse(BaseModel):
+    created: int = 0
+    updated: int = 0
+    failed: int = 0
+    results: List[EmployeeBulkResult]
+
+class EmployeeBulkFilter(BaseModel):
+    # mismos filtros que el listado (is_active = True por defecto), mas una lista de ids
+    ids: Optional[List[int]] = Field(None, min_length = 1)
+    is_active: bool = True
+    department: Optional[str] = None
+    position: Optional[str] = None
+    hired_from: Optional[date] = None
+    hired_to: Optional[date] = None
+    created_by_id: Optional[int] = None
+    q: Optional[str] = Field(None, min_length = 1, max_length = 100)
+
+class EmployeeBulkPatch(BaseModel):
+    # solo campos que tiene sentido poner igual a muchos empleados (sin email ni nombre)
+    department: Optional[str] = None
+    position: Optional[str] = None
+    is_active: Optional[bool] = None
+    hired_at: Optional[date] = None
+
+class EmployeeBulkUpdateRequest(BaseModel):
+    filter: EmployeeBulkFilter
+    patch: EmployeeBulkPatch
+
+class EmployeeBulkDeactivateRequest(BaseModel):
+    filter: EmployeeBulkFilter
+
+class EmployeeBulkUpdateResponse(BaseModel):
+    # empleados modificados (los que ya tenian esos valores no cuentan)
+    updated: int
+
+class DepartmentStats(BaseModel):
+    department: Optional[str] = None
+    active: int
+    inactive: int
+    total: int
+
+class HireMonthStats(BaseModel):
+    month: str  # YYYY-MM
+    active: int
+    inactive: int
+    total: int
+
+class EmployeeStats(BaseModel):
+    total: int
+    active: int
+    inactive: int
+    by_department: List[DepartmentStats]
+    hires_by_month: List[HireMonthStats]
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark: archivo del activity log. Siembra N filas con details de texto libre,
+archiva (gzip NDJSON + DELETE por lotes) las que superan el cutoff y las vuelve
+a leer con un filtro de auditoria. Reporta filas/s de cada fase y bytes por fila
+del archivo comprimido.
+
+Uso:
+    python -m benchmarks.bench_archive [--rows 1000000] [--batch-size 5000]
+                                       [--database-url postgresql+psycopg2://...]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.pool import StaticPool
+
+from app.core.activity_archive import archive_before, iter_archive
+from app.db.session import Base
+from app.models.activity_log import ActivityLog
+from app.models.user import User  # noqa: F401  FK activity_logs.user_id
+
+NOW = datetime(2026, 10, 1, tzinfo = timezone.utc)
+SEED_CHUNK = 50000
+
+
+def _engine(database_url: str):
+    if database_url.startswith("sqlite"):
+        return create_engine(database_url, connect_args = {"check_same_thread": False}, poolclass = StaticPool)
+    return create_engine(database_url)
+
+
+def _seed(engine, rows: int) -> None:
+    Base.metadata.create_all(bind = engine)
+    for start in range(0, rows, SEED_CHUNK):
+        with engine.begin() as connection:
+            connection.execute(insert(ActivityLog), [
+                {
+                    "user_id": None,
+                    "action": ("create_employee", "update_employee", "delete_employee")[i % 3],
+                    "resource_type": "employee",
+                    "resource_id": str(i % 10000),
+                    "details": f"Updated employee {i % 10000}: position Level {i % 7} -> Level {i % 7 + 1}, department Engineering",
+                    # repartidas en un año hacia atras: ~75% queda del lado viejo del cutoff
+                    "created_at": NOW - timedelta(days = 365 * i / rows),
+                }
+                for i in range(start, min(rows, start + SEED_CHUNK))
+            ])
+
+
+def run(rows: int = 100000, batch_size: int = 5000, database_url: str = "sqlite://") -> dict:
+    engine = _engine(database_url)
+    _seed(engine, rows)
+    cutoff = NOW - timedelta(days = 90)
+
+    with tempfile.TemporaryDirectory() as archive_dir:
+        start = time.perf_counter()
+        result = archive_before(engine, cutoff, archive_dir, batch_size = batch_size)
+        archive_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        read_all = sum(1 for _ in iter_archive(archive_dir))
+        read_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        audit = sum(1 for _ in iter_archive(
+            archive_dir,
+            created_from = cutoff - timedelta(days = 30),
+            created_to = cutoff,
+            resource_type = "employee",
+            resource_id = "42",
+        ))
+        audit_seconds = time.perf_counter() - start
+
+    with engine.connect() as connection:
+        remaining = connection.scalar(select(func.count()).select_from(ActivityLog))
+    engine.dispose()
+
+    return {
+        "rows": rows,
+        "archived_rows": result.archived_rows,
+        "remaining_rows": remaining,
+        "batches": result.batches,
+        "files": len(result.files),
+        "archive_rows_per_sec": round(result.archived_rows / archive_seconds, 1),
+        "archive_bytes_per_row": round(result.bytes_written / max(result.archived_rows, 1), 1),
+        "read_rows_per_sec": round(read_all / read_seconds, 1) if read_seconds else None,
+        "audit_month_rows": audit,
+        "audit_month_ms": round(audit_seconds * 1000, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type = int, default = 1000000)
+    parser.add_argument("--batch-size", type = int, default = 5000)
+    parser.add_argument("--database-url", default = None, help = "default: temporary SQLite file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database_url = args.database_url or f"sqlite:///{tmpdir}/archive.db"
+        results = run(args.rows, args.batch_size, database_url)
+
+    print(
+        f"{results['archived_rows']} filas archivadas a {results['archive_rows_per_sec']} filas/s "
+        f"({results['archive_bytes_per_row']} bytes/fila comprimido), "
+        f"lectura {results['read_rows_per_sec']} filas/s",
+        file = sys.stderr,
+    )
+    print(json.dumps(results, indent = 2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark de carga: handlers con Session sync en el threadpool (DB_ASYNC=false)
+vs AsyncSession (DB_ASYNC=true). Cada modo corre en su propio proceso porque
+la configuracion se lee al importar la app.
+
+Uso:
+    python -m benchmarks.bench_db_modes [--requests 2000] [--concurrency 64]
+                                        [--database-url postgresql+psycopg2://...]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _seed(employees: int) -> str:
+    from sqlalchemy import func, select
+
+    from app.core.security import create_access_token, get_password_hash
+    from app.db.session import Base, SessionLocal, engine
+    from app.models import load_models
+    from app.models.employee import Employee
+    from app.models.user import User, UserRole
+
+    # todas las tablas (refresh_tokens, employee_stats, ...): la app las usa aunque el seed no
+    load_models()
+    Base.metadata.create_all(bind = engine)
+    with SessionLocal() as db:
+        admin = db.scalar(select(User).where(User.email == "bench@example.com"))
+        if admin is None:
+            admin = User(
+                email = "bench@example.com",
+                hashed_password = get_password_hash("bench"),
+                role = UserRole.ADMIN,
+            )
+            db.add(admin)
+            db.flush()
+        existing = db.scalar(select(func.count()).select_from(Employee))
+        db.add_all(
+            Employee(first_name = f"Bench{i}", last_name = "Load", created_by_id = admin.id)
+            for i in range(existing, employees)
+        )
+        db.commit()
+    return create_access_token(subject = "bench@example.com")
+
+
+async def _drive(requests: int, concurrency: int, token: str) -> dict:
+    import httpx
+
+    from app.main import app
+
+    latencies: list[float] = []
+    headers = {"Authorization": f"Bearer {token}"}
+    queue: asyncio.Queue = asyncio.Queue()
+    for i in range(requests):
+        queue.put_nowait(i)
+
+    async with httpx.AsyncClient(
+        transport = httpx.ASGITransport(app = app),
+        base_url = "http://bench",
+    ) as client:
+        async def worker():
+            while not queue.empty():
+                i = queue.get_nowait()
+                url = "/api/v1/employees?limit=20" if i % 2 else f"/api/v1/employees/{i % 100 + 1}"
+                start = time.perf_counter()
+                response = await client.get(url, headers = headers)
+                latencies.append(time.perf_counter() - start)
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "req_per_sec": round(requests / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p99_ms": round(_percentile(latencies, 99) * 1000, 2),
+    }
+
+
+def _run_worker(args) -> None:
+    token = _seed(args.employees)
+    result = asyncio.run(_drive(args.requests, args.concurrency, token))
+    print(json.dumps(result))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__)
+    parser.add_argument("--requests", type = int, default = 2000)
+    parser.add_argument("--concurrency", type = int, default = 64)
+    parser.add_argument("--employees", type = int, default = 200)
+    parser.add_argument("--database-url", default = None)
+    parser.add_argument("--worker", action = "store_true", help = argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        _run_worker(args)
+        return
+
+    database_url = args.database_url
+    tmpdir = None
+    if database_url is None:
+        tmpdir = tempfile.TemporaryDirectory()
+        database_url = f"sqlite:///{tmpdir.name}/bench.db"
+
+    results = {}
+    for mode, db_async in (("sync", "false"), ("async", "true")):
+        env = {**os.environ, "DATABASE_URL": database_url, "DB_ASYNC": db_async}
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_db_modes", "--worker",
+             "--requests", str(args.requests),
+             "--concurrency", str(args.concurrency),
+             "--employees", str(args.employees)],
+            env = env,
+            capture_output = True,
+            text = True,
+        )
+        if output.returncode != 0:
+            sys.exit(f"{mode} run failed:\n{output.stderr}")
+        results[mode] = json.loads(output.stdout.strip().splitlines()[-1])
+
+    print(json.dumps(results, indent = 2))
+    if tmpdir is not None:
+        tmpdir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: costo de decode_access_token con y sin cache de payloads.
+Uso: python -m benchmarks.bench_jwt_decode [iteraciones]
+"""
+
+import sys
+import timeit
+
+from app.core.security import create_access_token, decode_access_token, token_cache
+
+
+def run(iterations: int = 20000) -> dict[str, float]:
+    token = create_access_token(subject = "bench@example.com")
+
+    def uncached():
+        token_cache.clear()
+        decode_access_token(token)
+
+    def cached():
+        decode_access_token(token)
+
+    decode_access_token(token)  # calentar el cache
+    results = {
+        "uncached_us": timeit.timeit(uncached, number = iterations) / iterations * 1e6,
+        "cached_us": timeit.timeit(cached, number = iterations) / iterations * 1e6,
+    }
+    results["speedup"] = results["uncached_us"] / results["cached_us"]
+    return results
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    results = run(iterations)
+    print(f"decode_access_token x{iterations}")
+    print(f"  sin cache: {results['uncached_us']:.2f} us/op")
+    print(f"  con cache: {results['cached_us']:.2f} us/op")
+    print(f"  speedup:   {results['speedup']:.1f}x")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark: throughput de login bajo concurrencia y su efecto sobre el resto de
+los endpoints. Corre una tormenta de logins (--logins a --concurrency) mientras
+unos pocos clientes leen GET /employees/{id}, para cada tamaño del pool de hashing.
+
+Uso:
+    python -m benchmarks.bench_login [--logins 200] [--concurrency 32] [--workers 1,2,4]
+                                     [--database-url postgresql+psycopg2://...]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.load import BENCH_EMAIL, BENCH_PASSWORD, drive, seed, summarize
+
+READERS = 4
+
+
+async def _storm(client, logins: int, concurrency: int, headers: dict, employee_ids: list[int]) -> dict:
+    async def login(client, i):
+        return await client.post("/api/v1/auth/login", data = {"username": BENCH_EMAIL, "password": BENCH_PASSWORD})
+
+    read_latencies: list[float] = []
+    read_errors = 0
+    done = asyncio.Event()
+
+    async def reader(offset: int):
+        nonlocal read_errors
+        i = offset
+        while not done.is_set():
+            start = time.perf_counter()
+            response = await client.get(f"/api/v1/employees/{employee_ids[i % len(employee_ids)]}", headers = headers)
+            read_latencies.append(time.perf_counter() - start)
+            read_errors += response.status_code >= 400
+            i += READERS
+
+    async def logins_then_stop():
+        try:
+            return await drive(client, login, logins, concurrency)
+        finally:
+            done.set()
+
+    started = time.perf_counter()
+    login_result, *_ = await asyncio.gather(logins_then_stop(), *(reader(n) for n in range(READERS)))
+    return {"login": login_result, "reads": summarize(read_latencies, read_errors, time.perf_counter() - started)}
+
+
+async def _run(args, employee_ids: list[int]) -> dict:
+    import httpx
+
+    from app.core.security import password_hasher
+    from app.main import app
+
+    async with httpx.AsyncClient(transport = httpx.ASGITransport(app = app), base_url = "http://bench") as client:
+        response = await client.post("/api/v1/auth/login", data = {"username": BENCH_EMAIL, "password": BENCH_PASSWORD})
+        response.raise_for_status()
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        async def read(client, i):
+            return await client.get(f"/api/v1/employees/{employee_ids[i % len(employee_ids)]}", headers = headers)
+
+        results = {"reads_baseline": await drive(client, read, args.logins, READERS)}
+        for workers in args.workers:
+            # el pool se recrea con el nuevo tamaño en el siguiente hash
+            password_hasher.shutdown()
+            password_hasher.workers = workers
+            results[f"hash_workers_{workers}"] = await _storm(client, args.logins, args.concurrency, headers, employee_ids)
+        return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type = int, default = 200)
+    parser.add_argument("--concurrency", type = int, default = 32)
+    parser.add_argument("--workers", type = lambda value: [int(n) for n in value.split(",")], default = [1, 2, 4])
+    parser.add_argument("--database-url", default = None)
+    args = parser.parse_args()
+
+    tmpdir = None
+    database_url = args.database_url
+    if database_url is None:
+        tmpdir = tempfile.TemporaryDirectory()
+        database_url = f"sqlite:///{tmpdir.name}/login.db"
+    os.environ["DATABASE_URL"] = database_url
+
+    try:
+        employee_ids = seed(users = 1, employees = 100, activity = 0)
+        results = asyncio.run(_run(args, employee_ids))
+    finally:
+        if tmpdir is not None:
+            tmpdir.cleanup()
+
+    baseline = results["reads_baseline"]
+    print(f"lecturas sin logins: p50 {baseline['p50_ms']} ms  p99 {baseline['p99_ms']} ms", file = sys.stderr)
+    for workers in args.workers:
+        run = results[f"hash_workers_{workers}"]
+        print(
+            f"{workers} hash workers: login {run['login']['req_per_sec']} req/s (p99 {run['login']['p99_ms']} ms), "
+            f"lecturas durante la tormenta p50 {run['reads']['p50_ms']} ms  p99 {run['reads']['p99_ms']} ms",
+            file = sys.stderr,
+        )
+    print(json.dumps(results, indent = 2))
+
+
+if __name__ == "__main__":
+    main()
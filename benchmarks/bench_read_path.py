@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark: lectura de N empleados como instancias ORM (select(Employee)) vs
+solo las columnas de EmployeeRead como filas (el camino del listado).
+Mide tiempo por lectura y pico de memoria (tracemalloc) de cada camino.
+
+Uso:
+    python -m benchmarks.bench_read_path [--rows 10000] [--repeat 5]
+                                         [--database-url postgresql+psycopg2://...]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1.routes_employees import READ_COLUMNS, _read_dict
+from app.core.serialization import dumps
+from app.db.session import Base
+from app.models.employee import Employee
+
+
+def _engine(database_url: str):
+    if database_url.startswith("sqlite"):
+        return create_engine(database_url, connect_args = {"check_same_thread": False}, poolclass = StaticPool)
+    return create_engine(database_url)
+
+
+def _seed(engine, rows: int) -> None:
+    Base.metadata.create_all(bind = engine)
+    with engine.begin() as connection:
+        existing = connection.scalar(select(func.count()).select_from(Employee))
+        if existing >= rows:
+            return
+        connection.execute(
+            insert(Employee),
+            [
+                {
+                    "first_name": f"Read{i}",
+                    "last_name": "Path",
+                    "email": f"read{i}@example.com",
+                    "department": "Engineering",
+                    "position": "Developer",
+                    "is_active": True,
+                }
+                for i in range(existing, rows)
+            ],
+        )
+
+
+def read_orm(session: Session, rows: int) -> list:
+    return session.scalars(select(Employee).order_by(Employee.id).limit(rows)).all()
+
+
+def read_rows(session: Session, rows: int) -> list:
+    return session.execute(select(*READ_COLUMNS).order_by(Employee.id).limit(rows)).all()
+
+
+def _measure(engine, reader, rows: int, repeat: int) -> dict[str, float]:
+    timings = []
+    for _ in range(repeat):
+        with Session(engine) as session:
+            start = time.perf_counter()
+            result = reader(session, rows)
+            timings.append(time.perf_counter() - start)
+            assert len(result) == rows
+        del result
+
+    # memoria: todo lo que sigue vivo mientras la pagina esta en memoria
+    gc.collect()
+    with Session(engine) as session:
+        tracemalloc.start()
+        result = reader(session, rows)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    del result
+
+    return {"ms": min(timings) * 1000, "peak_mb": peak / 1024 / 1024}
+
+
+def run(rows: int = 10000, repeat: int = 5, database_url: str = "sqlite://") -> dict[str, dict[str, float]]:
+    engine = _engine(database_url)
+    _seed(engine, rows)
+    results = {
+        "orm": _measure(engine, read_orm, rows, repeat),
+        "rows": _measure(engine, read_rows, rows, repeat),
+    }
+    # camino completo del listado: filas -> JSON
+    with Session(engine) as session:
+        page = read_rows(session, rows)
+        start = time.perf_counter()
+        dumps([_read_dict(row) for row in page])
+        results["rows"]["serialize_ms"] = (time.perf_counter() - start) * 1000
+    engine.dispose()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type = int, default = 10000)
+    parser.add_argument("--repeat", type = int, default = 5)
+    parser.add_argument("--database-url", default = "sqlite://")
+    args = parser.parse_args()
+
+    results = run(args.rows, args.repeat, args.database_url)
+    print(f"lectura de {args.rows} empleados ({args.database_url.split(':')[0]}, mejor de {args.repeat})")
+    for name, label in (("orm", "select(Employee)     "), ("rows", "columnas EmployeeRead")):
+        print(f"  {label}: {results[name]['ms']:8.1f} ms  pico {results[name]['peak_mb']:6.1f} MB")
+    print(f"  speedup: {results['orm']['ms'] / results['rows']['ms']:.1f}x, "
+          f"memoria: {results['orm']['peak_mb'] / results['rows']['peak_mb']:.1f}x menos")
+    print(f"  filas -> JSON: {results['rows']['serialize_ms']:.1f} ms")
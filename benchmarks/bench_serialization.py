@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: costo de serializar una pagina del listado de empleados, por item.
+  - orm_pydantic: instancias ORM -> EmployeeRead (from_attributes) -> jsonable_encoder -> json.dumps
+    (camino anterior de FastAPI con response_model)
+  - rows_fast:    filas de columnas -> dict -> dumps() (orjson si esta instalado)
+Uso: python -m benchmarks.bench_serialization [items] [iteraciones]
+"""
+
+import json
+import sys
+import timeit
+from datetime import date
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.api.v1.routes_employees import READ_FIELDS, _read_dict
+from app.core.serialization import dumps, orjson
+from app.models.employee import Employee
+from app.schemas.employee import EmployeeRead
+
+_ADAPTER = TypeAdapter(List[EmployeeRead])
+
+
+def _values(index: int) -> dict:
+    return {
+        "first_name": f"First{index}",
+        "last_name": f"Last{index}",
+        "email": f"employee{index}@example.com",
+        "department": "Engineering",
+        "position": "Developer",
+        "is_active": True,
+        "hired_at": date(2020, 1, 1 + index % 28),
+        "id": index + 1,
+        "created_by_id": 1,
+    }
+
+
+def orm_pydantic(employees: list) -> bytes:
+    return json.dumps(jsonable_encoder(_ADAPTER.validate_python(employees, from_attributes = True))).encode()
+
+
+def rows_fast(rows: list) -> bytes:
+    return dumps([_read_dict(row) for row in rows])
+
+
+def run(items: int = 100, iterations: int = 200) -> dict[str, float]:
+    values = [_values(index) for index in range(items)]
+    employees = [Employee(**row) for row in values]
+    rows = [tuple(row[name] for name in READ_FIELDS) for row in values]
+
+    per_item = iterations * items
+    results = {
+        "orm_pydantic_us": timeit.timeit(lambda: orm_pydantic(employees), number = iterations) / per_item * 1e6,
+        "rows_fast_us": timeit.timeit(lambda: rows_fast(rows), number = iterations) / per_item * 1e6,
+    }
+    results["speedup"] = results["orm_pydantic_us"] / results["rows_fast_us"]
+    return results
+
+
+if __name__ == "__main__":
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    results = run(items, iterations)
+    print(f"serializacion de paginas de {items} empleados x{iterations} (encoder: {'orjson' if orjson else 'json'})")
+    print(f"  ORM + Pydantic: {results['orm_pydantic_us']:.2f} us/item")
+    print(f"  filas + dumps:  {results['rows_fast_us']:.2f} us/item")
+    print(f"  speedup:        {results['speedup']:.1f}x")
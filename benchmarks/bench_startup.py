@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark: costo de importar la app (arranque de cada worker de uvicorn / gunicorn).
+Corre `python -X importtime -c "import app.main"` en procesos nuevos y reporta el
+tiempo total (mediana), los modulos mas caros y si se cargaron modulos pesados
+que deberian importarse recien en el primer uso (jose, passlib, drivers de BD).
+
+Uso:
+    python -m benchmarks.bench_startup [--runs 5] [--top 15] [--module app.main]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# no deberian cargarse al importar la app (solo en el primer login / en el lifespan)
+DEFERRED_MODULES = (
+    "jose",
+    "passlib.context",
+    "psycopg2",
+    "asyncpg",
+    "aiosqlite",
+)
+
+
+def import_times(module: str = "app.main", env: dict = None) -> dict[str, tuple[int, int]]:
+    """{modulo: (self_us, cumulative_us)} de un import en un proceso nuevo."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output = True,
+        text = True,
+        env = env if env is not None else os.environ.copy(),
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def run(runs: int = 5, top: int = 15, module: str = "app.main") -> dict:
+    # sin DATABASE_URL: importar la app no deberia necesitarlo
+    env = {key: value for key, value in os.environ.items() if key != "DATABASE_URL"}
+    samples = [import_times(module, env) for _ in range(runs)]
+    last = samples[-1]
+
+    slowest = sorted(last.items(), key = lambda item: item[1][0], reverse = True)[:top]
+    return {
+        "module": module,
+        "runs": runs,
+        "total_ms": round(statistics.median(sample[module][1] for sample in samples) / 1000, 1),
+        "modules_loaded": len(last),
+        "deferred_loaded": [name for name in DEFERRED_MODULES if name in last],
+        "slowest_self_ms": {name: round(self_us / 1000, 2) for name, (self_us, _) in slowest},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type = int, default = 5)
+    parser.add_argument("--top", type = int, default = 15)
+    parser.add_argument("--module", default = "app.main")
+    args = parser.parse_args()
+
+    results = run(args.runs, args.top, args.module)
+    print(f"import {results['module']}: {results['total_ms']} ms (mediana de {results['runs']}), "
+          f"{results['modules_loaded']} modulos", file = sys.stderr)
+    print(json.dumps(results, indent = 2))
+
+
+if __name__ == "__main__":
+    main()
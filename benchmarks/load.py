@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Suite de carga de la API: siembra usuarios / empleados / actividad y corre cada
+escenario (login, list, get, create, update, delete) con concurrencia fija,
+en proceso (httpx + ASGITransport) o contra un uvicorn real. El resultado
+(req/s, p50/p95/p99 por escenario) se guarda en JSON para comparar commits.
+
+Uso:
+    python -m benchmarks.load run [--mode inprocess|uvicorn] [--requests 500] [--concurrency 32]
+                                  [--users 10] [--employees 1000] [--activity 10000]
+                                  [--database-url postgresql+psycopg2://...] [--output results.json]
+    python -m benchmarks.load compare before.json after.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional
+
+BENCH_EMAIL = "load@example.com"
+BENCH_PASSWORD = "load-bench"
+SCENARIOS = ("login", "list", "get", "create", "update", "delete")
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    requests = len(latencies)
+    return {
+        "requests": requests,
+        "errors": errors,
+        "req_per_sec": round(requests / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(statistics.median(latencies) * 1000, 2) if latencies else None,
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2) if latencies else None,
+    }
+
+
+# --- datos -----------------------------------------------------------------
+
+def seed(users: int, employees: int, activity: int) -> list[int]:
+    """Crea las tablas y completa hasta la cantidad pedida. Devuelve ids de empleados."""
+    from sqlalchemy import func, insert, select
+
+    from app.core.security import get_password_hash
+    from app.db.session import Base, SessionLocal, engine
+    from app.models import load_models
+    from app.models.activity_log import ActivityLog
+    from app.models.employee import Employee
+    from app.models.user import User, UserRole
+
+    # todas las tablas (refresh_tokens, employee_stats, ...): la app las usa aunque el seed no
+    load_models()
+    Base.metadata.create_all(bind = engine)
+    with SessionLocal() as db:
+        admin = db.scalar(select(User).where(User.email == BENCH_EMAIL))
+        if admin is None:
+            admin = User(email = BENCH_EMAIL, hashed_password = get_password_hash(BENCH_PASSWORD), role = UserRole.ADMIN)
+            db.add(admin)
+            db.flush()
+
+        existing = db.scalar(select(func.count()).select_from(User))
+        if existing < users:
+            hashed = get_password_hash(BENCH_PASSWORD)
+            db.execute(insert(User), [
+                {"email": f"load-user{i}@example.com", "hashed_password": hashed, "role": UserRole.EMPLOYEE}
+                for i in range(existing, users)
+            ])
+
+        existing = db.scalar(select(func.count()).select_from(Employee))
+        if existing < employees:
+            db.execute(insert(Employee), [
+                {
+                    "first_name": f"Load{i}",
+                    "last_name": f"Employee{i % 97}",
+                    "email": f"load{i}@example.com",
+                    "department": ("Engineering", "Sales", "HR", "Finance")[i % 4],
+                    "position": "Staff",
+                    "is_active": True,
+                    "created_by_id": admin.id,
+                }
+                for i in range(existing, employees)
+            ])
+
+        existing = db.scalar(select(func.count()).select_from(ActivityLog))
+        if existing < activity:
+            db.execute(insert(ActivityLog), [
+                {
+                    "user_id": admin.id,
+                    "action": ("create_employee", "update_employee", "delete_employee")[i % 3],
+                    "resource_type": "employee",
+                    "resource_id": str(i % max(employees, 1) + 1),
+                    "details": "seeded by benchmarks.load",
+                }
+                for i in range(existing, activity)
+            ])
+        db.commit()
+        return list(db.scalars(select(Employee.id).order_by(Employee.id).limit(employees)))
+
+
+# --- escenarios ----------------------------------------------------------------
+
+Scenario = Callable[["httpx.AsyncClient", int], Awaitable["httpx.Response"]]
+
+
+def scenarios(headers: dict, employee_ids: list[int]) -> dict[str, Scenario]:
+    def employee_id(i: int) -> int:
+        return employee_ids[i % len(employee_ids)]
+
+    async def login(client, i):
+        return await client.post("/api/v1/auth/login", data = {"username": BENCH_EMAIL, "password": BENCH_PASSWORD})
+
+    async def list_(client, i):
+        return await client.get(f"/api/v1/employees?limit=20&skip={(i * 20) % max(len(employee_ids), 1)}", headers = headers)
+
+    async def get(client, i):
+        return await client.get(f"/api/v1/employees/{employee_id(i)}", headers = headers)
+
+    async def create(client, i):
+        payload = {"first_name": "Bench", "last_name": f"Create{i}", "department": "Engineering"}
+        return await client.post("/api/v1/employees", json = payload, headers = headers)
+
+    async def update(client, i):
+        payload = {"position": f"Level {i % 5}"}
+        return await client.put(f"/api/v1/employees/{employee_id(i)}", json = payload, headers = headers)
+
+    async def delete(client, i):
+        # soft delete: repetirlo sobre el mismo empleado sigue devolviendo 204
+        return await client.delete(f"/api/v1/employees/{employee_id(i)}", headers = headers)
+
+    return {"login": login, "list": list_, "get": get, "create": create, "update": update, "delete": delete}
+
+
+async def drive(client, scenario: Scenario, requests: int, concurrency: int) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            start = time.perf_counter()
+            response = await scenario(client, i)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+
+async def run_all(client, names: list[str], requests: int, concurrency: int, employee_ids: list[int]) -> dict:
+    response = await client.post("/api/v1/auth/login", data = {"username": BENCH_EMAIL, "password": BENCH_PASSWORD})
+    response.raise_for_status()
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    available = scenarios(headers, employee_ids)
+    results = {}
+    for name in names:
+        # calentamiento corto (caches, pool, imports perezosos)
+        await drive(client, available[name], min(concurrency, requests), concurrency)
+        results[name] = await drive(client, available[name], requests, concurrency)
+        print(f"  {name:<7} {results[name]['req_per_sec']:>8} req/s  p50 {results[name]['p50_ms']} ms  "
+              f"p95 {results[name]['p95_ms']} ms  p99 {results[name]['p99_ms']} ms", file = sys.stderr)
+    return results
+
+
+# --- modos ----------------------------------------------------------------------
+
+async def run_inprocess(args, employee_ids: list[int]) -> dict:
+    import httpx
+
+    from app.main import app
+
+    transport = httpx.ASGITransport(app = app)
+    async with httpx.AsyncClient(transport = transport, base_url = "http://bench") as client:
+        return await run_all(client, args.scenarios, args.requests, args.concurrency, employee_ids)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def run_uvicorn(args, employee_ids: list[int]) -> dict:
+    import httpx
+
+    port = _free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app",
+         "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(args.workers), "--log-level", "warning"],
+        env = os.environ.copy(),
+    )
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        limits = httpx.Limits(max_connections = args.concurrency)
+        async with httpx.AsyncClient(base_url = base_url, limits = limits, timeout = 30) as client:
+            deadline = time.monotonic() + 30
+            while True:
+                try:
+                    if (await client.get("/health")).status_code == 200:
+                        break
+                except httpx.TransportError:
+                    pass
+                if server.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("uvicorn did not start")
+                await asyncio.sleep(0.2)
+            return await run_all(client, args.scenarios, args.requests, args.concurrency, employee_ids)
+    finally:
+        server.terminate()
+        server.wait(timeout = 10)
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output = True, text = True, check = True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args) -> dict:
+    tmpdir = None
+    database_url = args.database_url
+    if args.database_url is None:
+        tmpdir = tempfile.TemporaryDirectory()
+        database_url = f"sqlite:///{tmpdir.name}/load.db"
+    # la configuracion se lee al importar la app, antes de cualquier import de app.*
+    os.environ["DATABASE_URL"] = database_url
+
+    try:
+        employee_ids = seed(args.users, args.employees, args.activity)
+        print(f"{args.mode}: {args.requests} requests x {args.concurrency} concurrent per scenario", file = sys.stderr)
+        runner = run_uvicorn if args.mode == "uvicorn" else run_inprocess
+        results = asyncio.run(runner(args, employee_ids))
+    finally:
+        if tmpdir is not None:
+            tmpdir.cleanup()
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec = "seconds"),
+            "mode": args.mode,
+            "database": database_url.split(":", 1)[0],
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "users": args.users,
+            "employees": args.employees,
+            "activity": args.activity,
+            "python": platform.python_version(),
+        },
+        "scenarios": results,
+    }
+
+
+def compare(before: dict, after: dict) -> dict[str, dict[str, Optional[float]]]:
+    """Diferencia porcentual por escenario y metrica (positivo = mas alto en `after`)."""
+    changes = {}
+    for name, old in before["scenarios"].items():
+        new = after["scenarios"].get(name)
+        if new is None:
+            continue
+        changes[name] = {
+            metric: round((new[metric] - old[metric]) / old[metric] * 100, 1) if old.get(metric) else None
+            for metric in ("req_per_sec", "p50_ms", "p95_ms", "p99_ms")
+        }
+    return changes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest = "command", required = True)
+
+    run_parser = commands.add_parser("run", help = "run the load scenarios")
+    run_parser.add_argument("--mode", choices = ("inprocess", "uvicorn"), default = "inprocess")
+    run_parser.add_argument("--requests", type = int, default = 500, help = "requests per scenario")
+    run_parser.add_argument("--concurrency", type = int, default = 32)
+    run_parser.add_argument("--users", type = int, default = 10)
+    run_parser.add_argument("--employees", type = int, default = 1000)
+    run_parser.add_argument("--activity", type = int, default = 10000)
+    run_parser.add_argument("--workers", type = int, default = 1, help = "uvicorn workers (uvicorn mode)")
+    run_parser.add_argument("--scenarios", type = lambda value: value.split(","), default = list(SCENARIOS),
+                            help = "comma separated subset of " + ",".join(SCENARIOS))
+    run_parser.add_argument("--database-url", default = None, help = "default: temporary SQLite file")
+    run_parser.add_argument("--output", default = None, help = "write the JSON result to this file")
+
+    compare_parser = commands.add_parser("compare", help = "percent change between two result files")
+    compare_parser.add_argument("before")
+    compare_parser.add_argument("after")
+
+    args = parser.parse_args()
+    if args.command == "compare":
+        with open(args.before) as before, open(args.after) as after:
+            print(json.dumps(compare(json.load(before), json.load(after)), indent = 2))
+        return
+
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    result = run(args)
+    output = json.dumps(result, indent = 2)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ from sqlalchemy import engine_from_config, pool
 
 from app.core.config import settings
 from app.db.session import Base
-from app.models import user, employee, activity_log  # noqa: F401  important!
+from app.models import user, employee, employee_stat, activity_log, refresh_token, cache_version  # noqa: F401  important!
 
 config = context.config
 
@@ -0,0 +1,54 @@
+"""add employee search indexes
+
+Revision ID: 5f0c2a9e7b41
+Revises: dcb1525f2e6a
+Create Date: 2026-10-18 11:03:27.540918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f0c2a9e7b41'
+down_revision: Union[str, Sequence[str], None] = 'dcb1525f2e6a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Indices trigram para ?q= (ILIKE '%texto%'); en SQLite se usa LIKE sin indice
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_employees_full_name_trgm',
+            'employees',
+            [sa.text("(first_name || ' ' || last_name) gin_trgm_ops")],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_employees_email_trgm',
+            'employees',
+            [sa.text('email gin_trgm_ops')],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_employees_email_trgm', table_name='employees', postgresql_concurrently=True)
+        op.drop_index('ix_employees_full_name_trgm', table_name='employees', postgresql_concurrently=True)
@@ -0,0 +1,141 @@
+"""add activity log indexes and optional monthly partitioning
+
+Revision ID: b7e4a9c1d2f6
+Revises: 8c3d71e5a0b2
+Create Date: 2026-10-18 15:22:08.913457
+
+"""
+import os
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4a9c1d2f6'
+down_revision: Union[str, Sequence[str], None] = '8c3d71e5a0b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_activity_logs_created_at_id', ['created_at', 'id']),
+    ('ix_activity_logs_user_id_created_at_id', ['user_id', 'created_at', 'id']),
+    ('ix_activity_logs_action_created_at_id', ['action', 'created_at', 'id']),
+    ('ix_activity_logs_resource_created_at_id', ['resource_type', 'resource_id', 'created_at', 'id']),
+]
+
+COLUMNS = 'id, user_id, action, resource_type, resource_id, details, created_at, updated_at'
+
+
+def _partitioning_requested() -> bool:
+    return os.getenv('ACTIVITY_LOG_PARTITIONED', 'false').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def _add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _partition_activity_logs() -> None:
+    # conversion unica: tabla nueva particionada por mes + copia de las filas.
+    # En tablas grandes correrla en una ventana de mantenimiento.
+    bind = op.get_bind()
+    op.execute('ALTER TABLE activity_logs RENAME TO activity_logs_unpartitioned')
+    op.execute('ALTER TABLE activity_logs_unpartitioned RENAME CONSTRAINT activity_logs_pkey TO activity_logs_unpartitioned_pkey')
+    op.execute('ALTER INDEX ix_activity_logs_id RENAME TO ix_activity_logs_unpartitioned_id')
+    op.execute(
+        """
+        CREATE TABLE activity_logs (
+            id integer NOT NULL DEFAULT nextval('activity_logs_id_seq'),
+            user_id integer REFERENCES users (id) ON DELETE SET NULL,
+            action varchar(100) NOT NULL,
+            resource_type varchar(100),
+            resource_id varchar(100),
+            details text,
+            created_at timestamptz NOT NULL DEFAULT now(),
+            updated_at timestamptz NOT NULL DEFAULT now(),
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    # filas fuera de los meses creados (no deberia haber: el job de retencion crea los proximos)
+    op.execute('CREATE TABLE activity_logs_default PARTITION OF activity_logs DEFAULT')
+
+    oldest = bind.scalar(sa.text('SELECT min(created_at) FROM activity_logs_unpartitioned'))
+    now = datetime.now(timezone.utc).date()
+    month = date((oldest or now).year, (oldest or now).month, 1)
+    last = _add_months(date(now.year, now.month, 1), 3)
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE activity_logs_y{month.year:04d}m{month.month:02d} PARTITION OF activity_logs "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{_add_months(month, 1).isoformat()} 00:00:00+00')"
+        )
+        month = _add_months(month, 1)
+
+    op.execute(f'INSERT INTO activity_logs ({COLUMNS}) SELECT {COLUMNS} FROM activity_logs_unpartitioned')
+    op.execute('ALTER SEQUENCE activity_logs_id_seq OWNED BY activity_logs.id')
+    op.drop_table('activity_logs_unpartitioned')
+
+    op.create_index(op.f('ix_activity_logs_id'), 'activity_logs', ['id'], unique=False)
+    for name, columns in INDEXES:
+        op.create_index(name, 'activity_logs', columns, unique=False)
+
+
+def _unpartition_activity_logs() -> None:
+    op.execute('ALTER TABLE activity_logs RENAME TO activity_logs_partitioned')
+    op.execute('ALTER TABLE activity_logs_partitioned RENAME CONSTRAINT activity_logs_pkey TO activity_logs_partitioned_pkey')
+    op.execute('ALTER INDEX ix_activity_logs_id RENAME TO ix_activity_logs_partitioned_id')
+    for name, _ in INDEXES:
+        op.execute(f'ALTER INDEX {name} RENAME TO {name}_partitioned')
+    op.execute(
+        """
+        CREATE TABLE activity_logs (
+            id integer NOT NULL DEFAULT nextval('activity_logs_id_seq') PRIMARY KEY,
+            user_id integer REFERENCES users (id) ON DELETE SET NULL,
+            action varchar(100) NOT NULL,
+            resource_type varchar(100),
+            resource_id varchar(100),
+            details text,
+            created_at timestamptz NOT NULL DEFAULT now(),
+            updated_at timestamptz NOT NULL DEFAULT now()
+        )
+        """
+    )
+    op.execute(f'INSERT INTO activity_logs ({COLUMNS}) SELECT {COLUMNS} FROM activity_logs_partitioned')
+    op.execute('ALTER SEQUENCE activity_logs_id_seq OWNED BY activity_logs.id')
+    op.drop_table('activity_logs_partitioned')
+    op.create_index(op.f('ix_activity_logs_id'), 'activity_logs', ['id'], unique=False)
+
+
+def _is_partitioned() -> bool:
+    return bool(op.get_bind().scalar(sa.text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table pt "
+        "JOIN pg_class c ON c.oid = pt.partrelid "
+        "WHERE c.relname = 'activity_logs' AND pg_table_is_visible(c.oid))"
+    )))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Postgres + ACTIVITY_LOG_PARTITIONED=true: particiones mensuales por created_at
+    # (la retencion borra particiones enteras en vez de hacer DELETE masivos)
+    if op.get_bind().dialect.name == 'postgresql' and _partitioning_requested():
+        _partition_activity_logs()
+        return
+
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(name, 'activity_logs', columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql' and _is_partitioned():
+        _unpartition_activity_logs()
+        return
+
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.drop_index(name, table_name='activity_logs', postgresql_concurrently=True)
@@ -0,0 +1,60 @@
+"""add employee_stats summary table
+
+Revision ID: c5a8e2f7d104
+Revises: b7e4a9c1d2f6
+Create Date: 2026-10-18 16:40:51.207734
+
+"""
+from collections import Counter
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5a8e2f7d104'
+down_revision: Union[str, Sequence[str], None] = 'b7e4a9c1d2f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    employee_stats = op.create_table(
+        'employee_stats',
+        sa.Column('dimension', sa.String(length=20), nullable=False),
+        sa.Column('bucket', sa.String(length=100), nullable=False),
+        sa.Column('active', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('inactive', sa.Integer(), server_default='0', nullable=False),
+        sa.PrimaryKeyConstraint('dimension', 'bucket'),
+    )
+
+    # carga inicial (lo mismo que scripts/recompute_employee_stats.py)
+    rows = op.get_bind().execute(sa.text(
+        'SELECT department, hired_at, is_active, count(*) FROM employees GROUP BY department, hired_at, is_active'
+    ))
+    counts = Counter()
+    for department, hired_at, is_active, count in rows:
+        column = 'active' if is_active else 'inactive'
+        # SQLite devuelve la fecha como texto 'YYYY-MM-DD'
+        month = str(hired_at)[:7] if hired_at else ''
+        counts[('department', department or '', column)] += count
+        counts[('hire_month', month, column)] += count
+
+    buckets = sorted({(dimension, bucket) for dimension, bucket, _ in counts})
+    if buckets:
+        op.bulk_insert(employee_stats, [
+            {
+                'dimension': dimension,
+                'bucket': bucket,
+                'active': counts[(dimension, bucket, 'active')],
+                'inactive': counts[(dimension, bucket, 'inactive')],
+            }
+            for dimension, bucket in buckets
+        ])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('employee_stats')
@@ -0,0 +1,46 @@
+"""add employee listing indexes
+
+Revision ID: dcb1525f2e6a
+Revises: 196ecedee9ff
+Create Date: 2026-10-18 10:12:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'dcb1525f2e6a'
+down_revision: Union[str, Sequence[str], None] = '196ecedee9ff'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY en Postgres para no bloquear escrituras en tablas grandes
+    # (requiere correr fuera de la transaccion de la migracion)
+    with op.get_context().autocommit_block():
+        op.create_index('ix_employees_is_active_id', 'employees', ['is_active', 'id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_employees_department_is_active_id', 'employees', ['department', 'is_active', 'id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_employees_hired_at', 'employees', ['hired_at'], unique=False, postgresql_concurrently=True)
+        op.create_index(
+            'ix_employees_active_last_name_id',
+            'employees',
+            ['last_name', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+            postgresql_where=sa.text('is_active'),
+            sqlite_where=sa.text('is_active = 1'),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_employees_active_last_name_id', table_name='employees', postgresql_concurrently=True)
+        op.drop_index('ix_employees_hired_at', table_name='employees', postgresql_concurrently=True)
+        op.drop_index('ix_employees_department_is_active_id', table_name='employees', postgresql_concurrently=True)
+        op.drop_index('ix_employees_is_active_id', table_name='employees', postgresql_concurrently=True)
@@ -0,0 +1,28 @@
+"""add employees.version (optimistic concurrency / ETag)
+
+Revision ID: e3b9d4a6f215
+Revises: c5a8e2f7d104
+Create Date: 2026-10-18 18:12:40.318502
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b9d4a6f215'
+down_revision: Union[str, Sequence[str], None] = 'c5a8e2f7d104'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('employees', sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('employees', 'version')
@@ -0,0 +1,35 @@
+"""add cache_versions (response cache versions shared by all workers)
+
+Revision ID: f1c7a3d9b508
+Revises: e3b9d4a6f215
+Create Date: 2026-10-18 21:05:12.604118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c7a3d9b508'
+down_revision: Union[str, Sequence[str], None] = 'e3b9d4a6f215'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    cache_versions = op.create_table(
+        'cache_versions',
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('version', sa.Integer(), server_default='0', nullable=False),
+        sa.PrimaryKeyConstraint('name'),
+    )
+    # la fila existe desde el principio: dos escrituras concurrentes no compiten por el INSERT
+    op.bulk_insert(cache_versions, [{'name': 'employees:list', 'version': 0}])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('cache_versions')
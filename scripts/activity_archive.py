@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Archivo del activity log en archivos gzip NDJSON (uno por mes, solo append).
+
+    archive: copia las filas con mas de --older-than-days dias al directorio de
+             archivo y las borra de la tabla por lotes (DROP de particiones
+             enteras si la tabla esta particionada). --vacuum al final.
+    read:    escribe en stdout (NDJSON) las filas archivadas que cumplen los
+             filtros, para auditorias.
+
+Uso:
+    python -m scripts.activity_archive archive [--older-than-days 90] [--dir archive/activity]
+                                               [--batch-size 5000] [--vacuum]
+    python -m scripts.activity_archive read [--dir archive/activity] [--from 2026-01-01] [--to 2026-02-01]
+                                            [--user-id 1] [--action update_employee]
+                                            [--resource-type employee] [--resource-id 42]
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from app.core.activity_archive import archive_before, iter_archive, vacuum
+from app.core.config import settings
+from app.db.session import database
+from app.models import activity_log, user  # noqa: F401  registra los modelos (FK activity_logs.user_id)
+
+
+def _timestamp(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo = timezone.utc)
+
+
+def _archive(args) -> None:
+    cutoff = datetime.now(timezone.utc) - timedelta(days = args.older_than_days)
+    start = time.perf_counter()
+    try:
+        result = archive_before(database.engine, cutoff, args.dir, batch_size = args.batch_size)
+        if args.vacuum:
+            vacuum(database.engine)
+    finally:
+        database.dispose()
+    elapsed = time.perf_counter() - start
+
+    print(json.dumps({
+        "cutoff": result.cutoff.isoformat(),
+        "archived_rows": result.archived_rows,
+        "deleted_rows": result.deleted_rows,
+        "dropped_partitions": result.dropped_partitions,
+        "batches": result.batches,
+        "bytes_written": result.bytes_written,
+        "files": result.files,
+        "seconds": round(elapsed, 2),
+        "rows_per_sec": round(result.archived_rows / elapsed, 1) if elapsed else None,
+    }, indent = 2))
+
+
+def _read(args) -> None:
+    rows = iter_archive(
+        args.dir,
+        created_from = args.created_from,
+        created_to = args.created_to,
+        user_id = args.user_id,
+        action = args.action,
+        resource_type = args.resource_type,
+        resource_id = args.resource_id,
+    )
+    for row in rows:
+        sys.stdout.write(json.dumps(row, ensure_ascii = False) + "\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest = "command", required = True)
+
+    archive_parser = commands.add_parser("archive", help = "archive and delete old rows")
+    archive_parser.add_argument("--older-than-days", type = int, default = settings.activity_archive_after_days)
+    archive_parser.add_argument("--dir", default = settings.activity_archive_dir)
+    archive_parser.add_argument("--batch-size", type = int, default = settings.activity_delete_batch_size)
+    archive_parser.add_argument("--vacuum", action = "store_true", help = "VACUUM (ANALYZE) after deleting")
+
+    read_parser = commands.add_parser("read", help = "stream archived rows as NDJSON")
+    read_parser.add_argument("--dir", default = settings.activity_archive_dir)
+    read_parser.add_argument("--from", dest = "created_from", type = _timestamp, default = None)
+    read_parser.add_argument("--to", dest = "created_to", type = _timestamp, default = None)
+    read_parser.add_argument("--user-id", type = int, default = None)
+    read_parser.add_argument("--action", default = None)
+    read_parser.add_argument("--resource-type", default = None)
+    read_parser.add_argument("--resource-id", default = None)
+
+    args = parser.parse_args()
+    if args.command == "archive":
+        if args.older_than_days <= 0:
+            parser.error("--older-than-days must be positive")
+        _archive(args)
+    else:
+        _read(args)
+
+
+if __name__ == "__main__":
+    main()
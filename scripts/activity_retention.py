@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Job de retencion del activity log (correr desde cron, p. ej. una vez por dia).
+Con la tabla particionada: crea las particiones de los proximos meses y borra
+las de meses anteriores al cutoff. Sin particiones: DELETE por lotes.
+Tambien borra los refresh tokens vencidos.
+
+Uso:
+    python -m scripts.activity_retention [--days 365] [--months-ahead 3] [--batch-size 5000] [--dry-run]
+"""
+
+import argparse
+import json
+
+from app.core.activity_retention import apply_retention
+from app.core.config import settings
+from app.db.session import database
+from app.models import activity_log, refresh_token, user  # noqa: F401  registra los modelos (FK a users.id)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type = int, default = settings.activity_retention_days,
+                        help = "days of activity to keep (0 = keep everything)")
+    parser.add_argument("--months-ahead", type = int, default = settings.activity_partition_months_ahead)
+    parser.add_argument("--batch-size", type = int, default = settings.activity_delete_batch_size)
+    parser.add_argument("--dry-run", action = "store_true", help = "report what would be dropped / deleted")
+    args = parser.parse_args()
+
+    try:
+        result = apply_retention(
+            database.engine,
+            retention_days = args.days,
+            months_ahead = args.months_ahead,
+            batch_size = args.batch_size,
+            dry_run = args.dry_run,
+        )
+    finally:
+        database.dispose()
+
+    print(json.dumps({
+        "cutoff": result.cutoff.isoformat() if result.cutoff else None,
+        "partitioned": result.partitioned,
+        "dry_run": result.dry_run,
+        "created_partitions": result.created_partitions,
+        "dropped_partitions": result.dropped_partitions,
+        "deleted_rows": result.deleted_rows,
+        "deleted_refresh_tokens": result.deleted_refresh_tokens,
+    }, indent = 2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Reconstruye employee_stats (GET /employees/stats) desde employees. Usar si los
+contadores se desincronizaron (carga directa en la BD, restore de un backup, etc.).
+--check solo informa las diferencias, sin escribir.
+
+Uso:
+    python -m scripts.recompute_employee_stats [--check]
+"""
+
+import argparse
+import json
+import sys
+
+from app.core.employee_stats import recompute_stats
+from app.db.session import database
+from app.models import employee, employee_stat, user  # noqa: F401  registra los modelos
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action = "store_true", help = "report drift without rewriting the table")
+    args = parser.parse_args()
+
+    try:
+        with database.engine.begin() as connection:
+            drift = recompute_stats(connection, dry_run = args.check)
+    finally:
+        database.dispose()
+
+    print(json.dumps([
+        {"dimension": dimension, "bucket": bucket, "stored": values["stored"], "actual": values["actual"]}
+        for (dimension, bucket), values in drift.items()
+    ], indent = 2))
+    # --check con diferencias: exit 1 (para alertar desde cron)
+    if args.check and drift:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
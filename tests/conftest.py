@@ -1,14 +1,21 @@
+import asyncio
+import dataclasses
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
-from app.main import app
-from app.db.deps import get_db
+from app.main import create_app
+from app.core.config import settings
+from app.db.deps import ThreadedSession, get_async_db, get_db
 from app.db.session import Base
 from app.models.user import User, UserRole
 from app.core.security import get_password_hash
+from app.api.deps_auth import principal_cache
+from app.core.security import token_cache
+from app.core.response_cache import response_cache
 
 # Configurar BD en memoria para tests (SQLite)
 @pytest.fixture(scope="session")
@@ -40,7 +47,49 @@ def db_session(db_engine):
     connection.close()
 
 @pytest.fixture
-def client(db_session):
+def loop_queries(db_engine):
+    """SQL ejecutado en el thread del event loop (p. ej. lazy loads de instancias expiradas)"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return  # threadpool: lo esperado
+        statements.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(db_engine, "before_cursor_execute", record)
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Limpia caches en memoria para que no se compartan datos entre tests"""
+    principal_cache.clear()
+    token_cache.clear()
+    asyncio.run(response_cache.clear())
+    yield
+    principal_cache.clear()
+    token_cache.clear()
+    asyncio.run(response_cache.clear())
+
+@pytest.fixture(scope="session")
+def test_settings():
+    """Configuracion de la app de tests (no depende de DATABASE_URL del entorno)"""
+    return dataclasses.replace(
+        settings,
+        database_url = "sqlite://",
+        metrics_enabled = True,
+        # cache de respuestas en memoria aunque el entorno pida otro backend
+        response_cache_backend = "memory",
+    )
+
+@pytest.fixture(scope="session")
+def app(test_settings):
+    return create_app(test_settings)
+
+@pytest.fixture
+def client(app, db_session):
     """Inyecta la sesion de test en la dependencia get_db de FastAPI"""
     def override_get_db():
         try:
@@ -48,7 +97,11 @@ def client(db_session):
         finally:
             pass
 
+    async def override_get_async_db():
+        yield ThreadedSession(db_session)
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
 
     yield TestClient(app)
 
@@ -77,4 +130,16 @@ def admin_token(client, admin_user):
         "/api/v1/auth/login",
         data = { "username": "admin@example.com", "password": "hola123123"},
     )
-    return response.json()["access_token"] 
\ No newline at end of file
+    return response.json()["access_token"] 
+@pytest.fixture
+def create_employee(client, admin_token):
+    """Crea empleados via POST /employees con el token admin y devuelve su id"""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    def _create(**data):
+        payload = {"first_name": "Test", "last_name": "Employee", **data}
+        response = client.post("/api/v1/employees", json = payload, headers = headers)
+        assert response.status_code == 201, response.text
+        return response.json()["id"]
+
+    return _create
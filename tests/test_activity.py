@@ -0,0 +1,216 @@
+# tests/test_activity.py
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, func, insert, select, text
+from sqlalchemy.pool import StaticPool
+
+from app.core.activity_retention import apply_retention
+from app.core.security import get_password_hash
+from app.db import partitions
+from app.db.session import Base
+from app.models.activity_log import ActivityLog
+from app.models.refresh_token import RefreshToken
+from app.models.user import User, UserRole
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo = timezone.utc)
+
+
+def _add_logs(db_session, count: int, start: datetime = NOW, **values) -> None:
+    db_session.execute(insert(ActivityLog), [
+        {
+            "action": values.get("action", "update_employee"),
+            "resource_type": values.get("resource_type", "employee"),
+            "resource_id": values.get("resource_id", str(i)),
+            "user_id": values.get("user_id"),
+            "created_at": start + timedelta(minutes = i),
+            "updated_at": start + timedelta(minutes = i),
+        }
+        for i in range(count)
+    ])
+    db_session.commit()
+
+
+def test_list_activity_newest_first_with_cursor(client, admin_token, db_session):
+    """
+    Test: GET /activity paginando con X-Next-Cursor
+    Esperado: mas nuevo primero, todas las filas una sola vez, la ultima pagina sin cursor
+    """
+    _add_logs(db_session, 7)
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    seen = []
+    url = "/api/v1/activity?action=update_employee&limit=3"
+    while True:
+        response = client.get(url, headers = headers)
+        assert response.status_code == 200
+        seen.extend(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        url = f"/api/v1/activity?action=update_employee&limit=3&cursor={cursor}"
+
+    assert [entry["resource_id"] for entry in seen] == [str(i) for i in reversed(range(7))]
+    assert list(seen[0]) == ["id", "user_id", "action", "resource_type", "resource_id", "details", "created_at"]
+
+
+def test_activity_filters(client, admin_token, admin_user, db_session):
+    """
+    Test: Filtros por usuario, recurso y rango de created_at
+    Esperado: solo las filas que cumplen; el rango es [created_from, created_to)
+    """
+    _add_logs(db_session, 3, resource_type = "user", resource_id = "42", user_id = admin_user.id)
+    _add_logs(db_session, 5, start = NOW - timedelta(days = 40))
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    by_resource = client.get("/api/v1/activity?resource_type=user&resource_id=42", headers = headers).json()
+    assert len(by_resource) == 3
+    assert all(entry["user_id"] == admin_user.id for entry in by_resource)
+
+    by_user = client.get(f"/api/v1/activity?user_id={admin_user.id}", headers = headers).json()
+    assert {entry["resource_type"] for entry in by_user} >= {"user"}
+
+    created_from = (NOW - timedelta(days = 41)).isoformat()
+    created_to = (NOW - timedelta(days = 40) + timedelta(minutes = 2)).isoformat()
+    in_range = client.get(
+        "/api/v1/activity", params = {"created_from": created_from, "created_to": created_to}, headers = headers,
+    ).json()
+    assert [entry["resource_id"] for entry in in_range] == ["1", "0"]
+
+
+def test_activity_records_mutations(client, admin_token):
+    """
+    Test: Crear un empleado y consultar su actividad
+    Esperado: la entrada create_employee aparece filtrando por el recurso
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    employee_id = client.post(
+        "/api/v1/employees", json = {"first_name": "Audit", "last_name": "Trail"}, headers = headers,
+    ).json()["id"]
+
+    response = client.get(
+        f"/api/v1/activity?resource_type=employee&resource_id={employee_id}", headers = headers,
+    )
+    assert [entry["action"] for entry in response.json()] == ["create_employee"]
+
+
+def test_activity_bad_requests(client, admin_token):
+    """
+    Test: resource_id sin resource_type y cursor invalido
+    Esperado: 400 en ambos casos
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    assert client.get("/api/v1/activity?resource_id=1", headers = headers).status_code == 400
+    assert client.get("/api/v1/activity?cursor=basura", headers = headers).status_code == 400
+
+
+def test_activity_requires_admin(client, db_session):
+    """
+    Test: GET /activity con un manager
+    Esperado: 403
+    """
+    db_session.add(User(
+        email = "manager@example.com",
+        hashed_password = get_password_hash("manager123"),
+        role = UserRole.MANAGER,
+    ))
+    db_session.commit()
+    token = client.post(
+        "/api/v1/auth/login", data = {"username": "manager@example.com", "password": "manager123"},
+    ).json()["access_token"]
+
+    response = client.get("/api/v1/activity", headers = {"Authorization": f"Bearer {token}"})
+    assert response.status_code == 403
+
+
+def test_activity_query_uses_index_sqlite(db_session):
+    """
+    Test: EXPLAIN QUERY PLAN del filtro por usuario ordenado por (created_at, id) DESC
+    Esperado: usa ix_activity_logs_user_id_created_at_id sin sort temporal
+    """
+    stmt = (
+        select(ActivityLog.id)
+        .where(ActivityLog.user_id == 1)
+        .order_by(ActivityLog.created_at.desc(), ActivityLog.id.desc())
+        .limit(50)
+    )
+    compiled = stmt.compile(db_session.connection(), compile_kwargs = {"literal_binds": True})
+    rows = db_session.connection().execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    plan = "\n".join(row[-1] for row in rows)
+
+    assert "ix_activity_logs_user_id_created_at_id" in plan
+    assert "USE TEMP B-TREE FOR ORDER BY" not in plan
+
+
+def test_retention_batched_delete():
+    """
+    Test: Retencion sobre una tabla sin particiones (SQLite)
+    Esperado: dry run solo cuenta; despues borra por lotes solo lo anterior al cutoff
+    """
+    engine = create_engine("sqlite://", connect_args = {"check_same_thread": False}, poolclass = StaticPool)
+    Base.metadata.create_all(bind = engine)
+    with engine.begin() as connection:
+        connection.execute(insert(ActivityLog), [
+            {"action": "old", "created_at": NOW - timedelta(days = 400, minutes = i)} for i in range(25)
+        ] + [
+            {"action": "new", "created_at": NOW - timedelta(days = 10, minutes = i)} for i in range(5)
+        ])
+
+    dry = apply_retention(engine, retention_days = 365, batch_size = 10, now = NOW, dry_run = True)
+    assert dry.partitioned is False
+    assert dry.deleted_rows == 25
+
+    result = apply_retention(engine, retention_days = 365, batch_size = 10, now = NOW)
+    assert result.deleted_rows == 25
+    with engine.connect() as connection:
+        actions = connection.execute(select(ActivityLog.action, func.count()).group_by(ActivityLog.action)).all()
+    assert actions == [("new", 5)]
+    engine.dispose()
+
+
+def test_retention_deletes_expired_refresh_tokens():
+    """
+    Test: Retencion con refresh tokens vencidos, revocados y vigentes
+    Esperado: borra solo los vencidos (revocados o no); los revocados vigentes quedan
+    para detectar reuso
+    """
+    engine = create_engine("sqlite://", connect_args = {"check_same_thread": False}, poolclass = StaticPool)
+    Base.metadata.create_all(bind = engine)
+    with engine.begin() as connection:
+        user_id = connection.execute(insert(User).values(
+            email = "tokens@example.com",
+            hashed_password = "x",
+            role = UserRole.EMPLOYEE,
+        )).inserted_primary_key[0]
+        connection.execute(insert(RefreshToken), [
+            {"user_id": user_id, "token_hash": "expired", "token_version": 0,
+             "expires_at": NOW - timedelta(days = 1)},
+            {"user_id": user_id, "token_hash": "expired-revoked", "token_version": 0,
+             "expires_at": NOW - timedelta(days = 1), "revoked_at": NOW - timedelta(days = 5)},
+            {"user_id": user_id, "token_hash": "revoked", "token_version": 0,
+             "expires_at": NOW + timedelta(days = 1), "revoked_at": NOW - timedelta(days = 5)},
+            {"user_id": user_id, "token_hash": "valid", "token_version": 0,
+             "expires_at": NOW + timedelta(days = 1)},
+        ])
+
+    dry = apply_retention(engine, retention_days = 365, batch_size = 1, now = NOW, dry_run = True)
+    assert dry.deleted_refresh_tokens == 2
+
+    result = apply_retention(engine, retention_days = 365, batch_size = 1, now = NOW)
+    assert result.deleted_refresh_tokens == 2
+    with engine.connect() as connection:
+        hashes = connection.scalars(select(RefreshToken.token_hash).order_by(RefreshToken.token_hash)).all()
+    assert hashes == ["revoked", "valid"]
+    engine.dispose()
+
+
+def test_expired_partitions_whole_months_only():
+    """
+    Test: Particiones a borrar para un cutoff a mitad de mes
+    Esperado: solo meses completos anteriores; la default y el mes del cutoff se conservan
+    """
+    names = [partitions.partition_name("activity_logs", date(2025, month, 1)) for month in (8, 9, 10, 11)]
+    names.append("activity_logs_default")
+
+    expired = partitions.expired_partitions("activity_logs", names, datetime(2025, 10, 18, tzinfo = timezone.utc))
+    assert expired == ["activity_logs_y2025m08", "activity_logs_y2025m09"]
+    assert partitions.add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
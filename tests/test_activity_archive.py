@@ -0,0 +1,126 @@
+# tests/test_activity_archive.py
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.pool import StaticPool
+
+from app.core.activity_archive import archive_before, iter_archive
+from app.db.session import Base
+from app.models.activity_log import ActivityLog
+from benchmarks import bench_archive
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo = timezone.utc)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args = {"check_same_thread": False}, poolclass = StaticPool)
+    Base.metadata.create_all(bind = engine)
+    yield engine
+    engine.dispose()
+
+
+def _add(engine, created_at: list[datetime], **values) -> None:
+    with engine.begin() as connection:
+        connection.execute(insert(ActivityLog), [
+            {
+                "action": values.get("action", "update_employee"),
+                "resource_type": "employee",
+                "resource_id": values.get("resource_id", str(i)),
+                "details": "x" * 200,
+                "created_at": when,
+            }
+            for i, when in enumerate(created_at)
+        ])
+
+
+def test_archive_moves_old_rows_to_monthly_files(engine, tmp_path):
+    """
+    Test: Archivar con lotes chicos filas de dos meses viejos y filas recientes
+    Esperado: un archivo gzip por mes con las filas viejas; en la tabla quedan solo las recientes
+    """
+    old = [datetime(2026, 5, 31, 23, 57, tzinfo = timezone.utc) + timedelta(minutes = i) for i in range(7)]
+    recent = [NOW - timedelta(days = 1, minutes = i) for i in range(3)]
+    _add(engine, old + recent)
+
+    result = archive_before(engine, NOW - timedelta(days = 90), str(tmp_path), batch_size = 3)
+
+    assert result.archived_rows == 7
+    assert result.deleted_rows == 7
+    assert result.batches == 3
+    assert [name.rsplit("/", 1)[-1] for name in result.files] == [
+        "activity_logs-2026-05.ndjson.gz",
+        "activity_logs-2026-06.ndjson.gz",
+    ]
+    with engine.connect() as connection:
+        assert len(connection.execute(select(ActivityLog.id)).all()) == 3
+
+    # cada lote es un miembro gzip: el archivo se lee completo
+    with gzip.open(tmp_path / "activity_logs-2026-06.ndjson.gz") as archive:
+        rows = [json.loads(line) for line in archive]
+    assert len(rows) == 4
+    assert list(rows[0]) == ["id", "user_id", "action", "resource_type", "resource_id", "details", "created_at"]
+
+
+def test_archive_appends_and_reads_back_with_filters(engine, tmp_path):
+    """
+    Test: Dos corridas de archivo sobre el mismo mes y lectura con filtros de auditoria
+    Esperado: la segunda corrida agrega al archivo; iter_archive filtra por recurso y rango
+    """
+    base = datetime(2026, 3, 10, tzinfo = timezone.utc)
+    _add(engine, [base + timedelta(hours = i) for i in range(4)], resource_id = "42")
+    archive_before(engine, NOW, str(tmp_path))
+    _add(engine, [base + timedelta(days = 1, hours = i) for i in range(2)], resource_id = "7", action = "delete_employee")
+    archive_before(engine, NOW, str(tmp_path))
+
+    assert len(list(iter_archive(str(tmp_path)))) == 6
+    assert len(list(iter_archive(str(tmp_path), resource_type = "employee", resource_id = "42"))) == 4
+    assert [row["action"] for row in iter_archive(str(tmp_path), action = "delete_employee")] == ["delete_employee"] * 2
+
+    in_range = list(iter_archive(
+        str(tmp_path),
+        created_from = base + timedelta(hours = 1),
+        created_to = base + timedelta(hours = 3),
+    ))
+    assert len(in_range) == 2
+    assert list(iter_archive(str(tmp_path), created_from = datetime(2026, 4, 1, tzinfo = timezone.utc))) == []
+
+
+def test_read_archive_with_non_utc_bounds(engine, tmp_path):
+    """
+    Test: Leer con created_from = 2026-03-01 00:00 +05:00 (en UTC, 28 de febrero a las 19:00)
+    Esperado: se abre tambien el archivo de febrero y aparece la fila de las 23:00 UTC de ese dia
+    """
+    _add(engine, [datetime(2026, 2, 28, 23, 0, tzinfo = timezone.utc), datetime(2026, 3, 2, tzinfo = timezone.utc)])
+    archive_before(engine, NOW, str(tmp_path))
+
+    plus_five = timezone(timedelta(hours = 5))
+    rows = list(iter_archive(str(tmp_path), created_from = datetime(2026, 3, 1, 0, 0, tzinfo = plus_five)))
+    assert len(rows) == 2
+
+
+def test_archive_nothing_to_do(engine, tmp_path):
+    """
+    Test: Archivar sin filas anteriores al cutoff
+    Esperado: no se crean archivos ni se borra nada
+    """
+    _add(engine, [NOW])
+    result = archive_before(engine, NOW - timedelta(days = 90), str(tmp_path))
+
+    assert result.archived_rows == 0
+    assert result.files == []
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_archive_benchmark():
+    """
+    Test: Benchmark de archivo con pocas filas
+    Esperado: reporta throughput de archivo y lectura; solo quedan las filas recientes
+    """
+    results = bench_archive.run(rows = 2000, batch_size = 500)
+    assert results["archived_rows"] > 0
+    assert results["archived_rows"] + results["remaining_rows"] == 2000
+    assert results["archive_rows_per_sec"] > 0
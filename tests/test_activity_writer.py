@@ -0,0 +1,158 @@
+# tests/test_activity_writer.py
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from app.core import logging as activity_logging
+from app.core.activity_writer import ActivityWriter, activity_event
+from app.db.session import Base
+from app.models.activity_log import ActivityLog
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'activity.db'}")
+    Base.metadata.create_all(bind = engine)
+    yield engine
+    engine.dispose()
+
+
+def _count(engine) -> int:
+    with engine.connect() as conn:
+        return conn.scalar(select(func.count()).select_from(ActivityLog))
+
+
+def _event(i: int) -> dict:
+    return activity_event(user_id = None, action = f"test_{i}", resource_type = "employee", resource_id = str(i), details = None)
+
+
+def test_writer_flushes_in_batches(file_engine):
+    """
+    Test: 5 eventos con flush_size = 2
+    Esperado: todos quedan en activity_logs despues de stop()
+    """
+    writer = ActivityWriter(engine = file_engine, flush_size = 2, flush_interval = 60)
+
+    async def scenario():
+        await writer.start()
+        for i in range(5):
+            assert writer.enqueue(_event(i))
+        await asyncio.sleep(0.05)  # el flush por tamaño corre en background
+        await writer.stop()
+
+    asyncio.run(scenario())
+
+    assert _count(file_engine) == 5
+    assert writer.stats()["flushed"] == 5
+    assert writer.queue_depth == 0
+
+
+def test_writer_replays_spool_after_crash(file_engine, tmp_path):
+    """
+    Test: El proceso "muere" con eventos en el buffer (sin flush)
+    Esperado: al arrancar de nuevo se reinsertan desde el spool y se borra el segmento
+    """
+    spool_dir = tmp_path / "spool"
+    crashed = ActivityWriter(engine = file_engine, flush_size = 100, flush_interval = 60, spool_dir = str(spool_dir))
+
+    async def crash():
+        await crashed.start()
+        for i in range(3):
+            crashed.enqueue(_event(i))
+        crashed._task.cancel()  # sin stop(): nada llega a la BD
+
+    asyncio.run(crash())
+    assert _count(file_engine) == 0
+
+    recovered = ActivityWriter(engine = file_engine, flush_size = 100, flush_interval = 60, spool_dir = str(spool_dir))
+
+    async def restart():
+        await recovered.start()
+        await recovered.stop()
+
+    asyncio.run(restart())
+
+    assert _count(file_engine) == 3
+    assert list(spool_dir.glob("activity-*.ndjson")) == []
+
+
+def test_writer_full_queue_rejects(file_engine):
+    """
+    Test: Buffer lleno (max_queue = 1)
+    Esperado: enqueue devuelve False para que create_activity escriba inline; con force
+    (evento ya confirmado) se acepta igual
+    """
+    writer = ActivityWriter(engine = file_engine, max_queue = 1)
+
+    assert writer.enqueue(_event(1)) is True
+    assert writer.full
+    assert writer.enqueue(_event(2)) is False
+    assert writer.enqueue(_event(3), force = True) is True
+    assert writer.queue_depth == 2
+
+
+def test_writer_full_counts_failed_batches(tmp_path):
+    """
+    Test: Flush que falla (la tabla no existe) con max_queue = 2
+    Esperado: los eventos quedan pendientes para reintento y cuentan para full;
+    enqueue los rechaza aunque el buffer nuevo este vacio
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'empty.db'}")
+    writer = ActivityWriter(engine = engine, max_queue = 2)
+    writer.enqueue(_event(1))
+    writer.enqueue(_event(2))
+
+    assert asyncio.run(writer.flush()) == 0
+    assert writer.flush_failures == 1
+    assert writer.queue_depth == 2
+    assert writer.full
+    assert writer.enqueue(_event(3)) is False
+    engine.dispose()
+
+
+def test_create_activity_uses_running_writer(file_engine, monkeypatch):
+    """
+    Test: create_activity con el writer corriendo
+    Esperado: el evento va al buffer (no a la sesion del request) recien cuando la transaccion hace commit
+    """
+    writer = ActivityWriter(engine = file_engine, flush_interval = 60)
+    monkeypatch.setattr(activity_logging, "activity_writer", writer)
+
+    async def scenario():
+        await writer.start()
+        with Session(file_engine) as session:
+            activity_logging.create_activity(db = session, user = None, action = "buffered")
+            assert not session.new
+            assert writer.queue_depth == 0
+            session.commit()
+        assert writer.queue_depth == 1
+        await writer.stop()
+
+    asyncio.run(scenario())
+
+    assert _count(file_engine) == 1
+
+
+def test_create_activity_discarded_on_rollback(file_engine, monkeypatch):
+    """
+    Test: create_activity con el writer corriendo y la transaccion del request hace rollback
+    Esperado: el evento no llega al buffer ni a la BD (no se audita un cambio que no ocurrio)
+    """
+    writer = ActivityWriter(engine = file_engine, flush_interval = 60)
+    monkeypatch.setattr(activity_logging, "activity_writer", writer)
+
+    async def scenario():
+        await writer.start()
+        with Session(file_engine) as session:
+            session.execute(select(1))  # transaccion abierta, como en un handler
+            activity_logging.create_activity(db = session, user = None, action = "rolled_back")
+            session.rollback()
+            session.commit()
+        assert writer.queue_depth == 0
+        await writer.stop()
+
+    asyncio.run(scenario())
+
+    assert _count(file_engine) == 0
@@ -0,0 +1,84 @@
+# tests/test_async_db.py
+import dataclasses
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.security import get_password_hash
+from app.db.session import Base, async_database_url, database
+from app.main import create_app
+from app.models.user import User, UserRole
+
+
+@pytest.fixture
+def async_client(tmp_path):
+    """Cliente de una app con DB_ASYNC=true: los handlers usan AsyncSession real (aiosqlite)"""
+    db_path = tmp_path / "async.db"
+    sync_engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind = sync_engine)
+    with sessionmaker(bind = sync_engine)() as session:
+        session.add(User(
+            email = "admin@example.com",
+            hashed_password = get_password_hash("hola123123"),
+            full_name = "Admin User",
+            is_active = True,
+            role = UserRole.ADMIN,
+        ))
+        session.commit()
+    sync_engine.dispose()
+
+    config = dataclasses.replace(settings, database_url = f"sqlite:///{db_path}", db_async = True)
+    try:
+        # el lifespan configura `database` con esta config y crea el AsyncEngine
+        with TestClient(create_app(config)) as client:
+            yield client
+    finally:
+        database.configure(settings)
+
+
+def test_async_database_url():
+    """
+    Test: Conversion de DATABASE_URL al driver async
+    Esperado: psycopg2 -> asyncpg, sqlite -> aiosqlite
+    """
+    assert async_database_url("postgresql+psycopg2://u:p@db:5432/app") == "postgresql+asyncpg://u:p@db:5432/app"
+    assert async_database_url("sqlite:///./app.db") == "sqlite+aiosqlite:///./app.db"
+    assert async_database_url("postgresql+asyncpg://u:p@db/app") == "postgresql+asyncpg://u:p@db/app"
+
+
+def test_async_mode_employee_crud(async_client):
+    """
+    Test: Login + CRUD de empleados con AsyncSession
+    Esperado: mismo comportamiento que el modo sync
+    """
+    login = async_client.post(
+        "/api/v1/auth/login",
+        data = {"username": "admin@example.com", "password": "hola123123"},
+    )
+    assert login.status_code == 200
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    created = async_client.post(
+        "/api/v1/employees",
+        json = {"first_name": "Ana", "last_name": "Async", "email": "ana@example.com"},
+        headers = headers,
+    )
+    assert created.status_code == 201
+    employee_id = created.json()["id"]
+
+    updated = async_client.put(
+        f"/api/v1/employees/{employee_id}",
+        json = {"department": "IT"},
+        headers = headers,
+    )
+    assert updated.status_code == 200
+    assert updated.json()["department"] == "IT"
+
+    listed = async_client.get("/api/v1/employees", headers = headers)
+    assert [emp["id"] for emp in listed.json()] == [employee_id]
+
+    assert async_client.delete(f"/api/v1/employees/{employee_id}", headers = headers).status_code == 204
+    assert async_client.get(f"/api/v1/employees/{employee_id}", headers = headers).json()["is_active"] is False
@@ -1,5 +1,9 @@
 #tests/test/auth.py
 import pytest
+from sqlalchemy import event, func, select
+
+from app.models.refresh_token import RefreshToken
+from app.models.user import UserRole
 
 def test_login_success(client, admin_token):
     """
@@ -52,4 +56,175 @@ def test_login_missing_fields(client):
     )
 
     assert response.status_code == 422
-    assert "detail" in response.json()
\ No newline at end of file
+    assert "detail" in response.json()
+
+def test_me_uses_principal_cache(client, admin_token):
+    """
+    Test: Requests repetidos con el mismo token usan el cache de principals
+    Esperado: el segundo request es un hit y devuelve los mismos datos
+    """
+    from app.api.deps_auth import principal_cache
+
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    first = client.get("/api/v1/auth/me", headers = headers)
+    second = client.get("/api/v1/auth/me", headers = headers)
+
+    assert first.status_code == 200
+    assert second.json() == first.json()
+    assert principal_cache.stats()["hits"] >= 1
+
+def test_principal_cache_invalidated_on_deactivation(client, db_session, admin_user, admin_token):
+    """
+    Test: Desactivar un usuario invalida su entrada en el cache
+    Esperado: el siguiente request ve is_active = False (400 Inactive user)
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    assert client.get("/api/v1/auth/me", headers = headers).status_code == 200
+
+    admin_user.is_active = False
+    db_session.commit()
+
+    response = client.get("/api/v1/auth/me", headers = headers)
+    assert response.status_code == 400
+
+def test_principal_cache_invalidated_only_after_commit(client, db_session, admin_user, admin_token):
+    """
+    Test: Cambio de rol con flush y despues commit
+    Esperado: la entrada sigue en el cache tras el flush (UPDATE sin confirmar); se borra con el commit
+    """
+    from app.api.deps_auth import principal_cache
+
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    assert client.get("/api/v1/auth/me", headers = headers).status_code == 200
+    assert principal_cache.get("admin@example.com") is not None
+
+    admin_user.role = UserRole.EMPLOYEE
+    db_session.flush()
+    assert principal_cache.get("admin@example.com") is not None
+
+    db_session.commit()
+    assert principal_cache.get("admin@example.com") is None
+
+def test_login_rehashes_outdated_password_hash(client, db_session, admin_user, loop_queries):
+    """
+    Test: Login de un usuario cuyo hash tiene otros rounds que PASSWORD_HASH_ROUNDS
+    Esperado: 200 OK, el hash guardado se reemplaza por uno con los rounds actuales
+    y ninguna query corre en el event loop
+    """
+    from passlib.hash import pbkdf2_sha256
+    from app.core.config import settings
+
+    admin_user.hashed_password = pbkdf2_sha256.using(rounds = 1000).hash("hola123123")
+    db_session.commit()
+
+    response = client.post(
+        "/api/v1/auth/login",
+        data = {"username": "admin@example.com", "password": "hola123123"},
+    )
+    assert response.status_code == 200
+    assert loop_queries == []
+
+    db_session.refresh(admin_user)
+    assert pbkdf2_sha256.from_string(admin_user.hashed_password).rounds == settings.password_hash_rounds
+    assert pbkdf2_sha256.verify("hola123123", admin_user.hashed_password)
+
+def _login(client):
+    return client.post(
+        "/api/v1/auth/login",
+        data = {"username": "admin@example.com", "password": "hola123123"},
+    ).json()
+
+def test_login_returns_refresh_token_and_claims(client, admin_user):
+    """
+    Test: Login exitoso
+    Esperado: access token con uid / role / ver, refresh token y expires_in
+    """
+    from app.core.security import decode_access_token
+
+    body = _login(client)
+    assert body["refresh_token"]
+    assert body["expires_in"] > 0
+
+    payload = decode_access_token(body["access_token"])
+    assert payload["sub"] == "admin@example.com"
+    assert payload["uid"] == admin_user.id
+    assert payload["role"] == "ADMIN"
+    assert payload["ver"] == admin_user.token_version
+
+def test_refresh_rotates_tokens(client, admin_user):
+    """
+    Test: /auth/refresh con un refresh token valido, y reusar el viejo
+    Esperado: 200 con tokens nuevos; el token viejo (ya rotado) da 401 y revoca el nuevo
+    """
+    first = _login(client)
+    response = client.post("/api/v1/auth/refresh", json = {"refresh_token": first["refresh_token"]})
+    assert response.status_code == 200
+    second = response.json()
+    assert second["refresh_token"] != first["refresh_token"]
+
+    headers = {"Authorization": f"Bearer {second['access_token']}"}
+    assert client.get("/api/v1/employees", headers = headers).status_code == 200
+
+    reused = client.post("/api/v1/auth/refresh", json = {"refresh_token": first["refresh_token"]})
+    assert reused.status_code == 401
+    assert client.post("/api/v1/auth/refresh", json = {"refresh_token": second["refresh_token"]}).status_code == 401
+
+def test_refresh_concurrent_rotation_only_one_wins(client, db_engine, db_session, admin_user):
+    """
+    Test: Otra peticion rota el mismo refresh token entre la lectura y el UPDATE
+    Esperado: 401 (la revocacion condicional no actualiza filas) y no se emite un token nuevo
+    """
+    tokens = _login(client)
+    raced = []
+
+    def concurrent_rotation(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("UPDATE refresh_tokens") and not raced:
+            raced.append(statement)
+            cursor.execute("UPDATE refresh_tokens SET revoked_at = CURRENT_TIMESTAMP WHERE revoked_at IS NULL")
+
+    event.listen(db_engine, "before_cursor_execute", concurrent_rotation)
+    try:
+        response = client.post("/api/v1/auth/refresh", json = {"refresh_token": tokens["refresh_token"]})
+    finally:
+        event.remove(db_engine, "before_cursor_execute", concurrent_rotation)
+
+    assert raced
+    assert response.status_code == 401
+    assert db_session.scalar(select(func.count()).select_from(RefreshToken)) == 1
+
+def test_refresh_rejected_after_role_change(client, db_session, admin_user):
+    """
+    Test: Cambio de rol despues del login
+    Esperado: el access token sigue valido hasta expirar (sin BD), pero el refresh da 401
+    """
+    tokens = _login(client)
+
+    admin_user.role = UserRole.EMPLOYEE
+    db_session.commit()
+    assert admin_user.token_version == 1
+
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    assert client.get("/api/v1/employees", headers = headers).status_code == 200
+
+    response = client.post("/api/v1/auth/refresh", json = {"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 401
+
+def test_refresh_rejected_for_inactive_user(client, db_session, admin_user):
+    """
+    Test: Refresh de un usuario desactivado
+    Esperado: 401
+    """
+    tokens = _login(client)
+    admin_user.is_active = False
+    db_session.commit()
+
+    response = client.post("/api/v1/auth/refresh", json = {"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 401
+
+def test_refresh_unknown_token(client):
+    """
+    Test: Refresh con un token que no existe
+    Esperado: 401
+    """
+    response = client.post("/api/v1/auth/refresh", json = {"refresh_token": "no-existe"})
+    assert response.status_code == 401
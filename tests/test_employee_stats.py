@@ -0,0 +1,112 @@
+# tests/test_employee_stats.py
+from sqlalchemy import insert
+
+from app.core.employee_stats import build_stats, recompute_stats, stats_deltas, stats_key
+from app.models.employee import Employee
+
+
+def _stats(client, headers):
+    response = client.get("/api/v1/employees/stats", headers = headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def _department(stats, name):
+    return next(entry for entry in stats["by_department"] if entry["department"] == name)
+
+
+def test_stats_follow_create_update_delete(client, admin_token, db_session, create_employee):
+    """
+    Test: Alta, cambio de departamento / fecha y baja de empleados
+    Esperado: los contadores se actualizan en cada operacion y coinciden con un recalculo completo
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    first = create_employee(department = "IT", hired_at = "2024-01-15")
+    create_employee(department = "IT", hired_at = "2024-01-20")
+    create_employee()
+
+    stats = _stats(client, headers)
+    assert (stats["total"], stats["active"], stats["inactive"]) == (3, 3, 0)
+    assert _department(stats, "IT") == {"department": "IT", "active": 2, "inactive": 0, "total": 2}
+    assert _department(stats, None)["total"] == 1
+    assert stats["hires_by_month"] == [{"month": "2024-01", "active": 2, "inactive": 0, "total": 2}]
+
+    client.put(f"/api/v1/employees/{first}", json = {"department": "HR", "hired_at": "2024-03-01"}, headers = headers)
+    client.delete(f"/api/v1/employees/{first}", headers = headers)
+
+    stats = _stats(client, headers)
+    assert (stats["total"], stats["active"], stats["inactive"]) == (3, 2, 1)
+    assert _department(stats, "HR") == {"department": "HR", "active": 0, "inactive": 1, "total": 1}
+    assert _department(stats, "IT")["total"] == 1
+    assert [entry["month"] for entry in stats["hires_by_month"]] == ["2024-01", "2024-03"]
+
+    assert recompute_stats(db_session.connection(), dry_run = True) == {}
+
+
+def test_stats_follow_bulk_upsert(client, admin_token, db_session):
+    """
+    Test: Alta masiva y luego upsert que cambia el departamento de un empleado existente
+    Esperado: los contadores reflejan las filas creadas y el cambio del upsert
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    rows = [
+        {"first_name": "Bulk", "last_name": str(i), "email": f"bulk{i}@example.com", "department": "Sales"}
+        for i in range(3)
+    ]
+    client.post("/api/v1/employees/bulk", json = rows, headers = headers)
+    rows[0]["department"] = "Finance"
+    client.post("/api/v1/employees/bulk?upsert=true", json = rows[:1], headers = headers)
+
+    stats = _stats(client, headers)
+    assert _department(stats, "Sales")["active"] == 2
+    assert _department(stats, "Finance")["active"] == 1
+    assert recompute_stats(db_session.connection(), dry_run = True) == {}
+
+
+def test_stats_single_query(client, admin_token, create_employee):
+    """
+    Test: GET /employees/stats
+    Esperado: una sola query (sobre employee_stats), sin recorrer employees
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    create_employee(department = "IT")
+
+    response = client.get("/api/v1/employees/stats", headers = headers)
+    assert response.headers["X-DB-Queries"] == "1"
+
+
+def test_recompute_repairs_drift(client, admin_token, admin_user, db_session):
+    """
+    Test: Empleados insertados directo en la BD (sin pasar por la API)
+    Esperado: --check informa la diferencia; el recalculo la corrige
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    db_session.execute(insert(Employee), [
+        {"first_name": "Direct", "last_name": str(i), "department": "Ops", "created_by_id": admin_user.id}
+        for i in range(4)
+    ])
+    db_session.commit()
+    assert client.get("/api/v1/employees/stats", headers = headers).json()["total"] == 0
+
+    drift = recompute_stats(db_session.connection(), dry_run = True)
+    assert drift[("department", "Ops")] == {"stored": (0, 0), "actual": (4, 0)}
+
+    recompute_stats(db_session.connection())
+    db_session.commit()
+    stats = _stats(client, headers)
+    assert stats["total"] == 4
+    assert _department(stats, "Ops")["active"] == 4
+
+
+def test_stats_deltas_and_build():
+    """
+    Test: Delta de un cambio de departamento y armado de la respuesta
+    Esperado: -1 en el departamento viejo, +1 en el nuevo, sin entradas en cero
+    """
+    deltas = stats_deltas(before = [stats_key("IT", None, True)], after = [stats_key("HR", None, True)])
+    assert deltas == {("department", "HR"): (1, 0), ("department", "IT"): (-1, 0)}
+
+    stats = build_stats([("department", "IT", 0, 0), ("department", "", 1, 2), ("hire_month", "", 1, 2)])
+    assert stats["by_department"] == [{"department": None, "active": 1, "inactive": 2, "total": 3}]
+    assert stats["hires_by_month"] == []
+    assert stats["total"] == 3
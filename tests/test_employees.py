@@ -325,3 +325,181 @@ def test_create_employee_invalid_data(client, admin_token):
     
     assert response.status_code == 422
     assert "detail" in response.json()
+
+
+def _create_employees(client, admin_token, count, prefix = "cursor"):
+    ids = []
+    for i in range(count):
+        response = client.post(
+            "/api/v1/employees",
+            json={
+                "first_name": f"Emp{i}",
+                "last_name": f"{prefix}{count - i:03d}",
+                "email": f"{prefix}{i}@example.com",
+                "department": "IT",
+                "position": "Developer",
+                "is_active": True,
+                "hired_at": "2025-01-01" if i % 2 else None,
+            },
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
+        ids.append(response.json()["id"])
+    return ids
+
+
+def test_list_employees_cursor_pagination(client, admin_token):
+    """
+    Test: Recorrer todas las paginas usando cursor (keyset)
+    Esperado: cada empleado aparece una sola vez y en orden por id
+    """
+    ids = _create_employees(client, admin_token, 7)
+
+    seen = []
+    url = "/api/v1/employees?limit=3"
+    while True:
+        response = client.get(url, headers={"Authorization": f"Bearer {admin_token}"})
+        assert response.status_code == 200
+        seen.extend(emp["id"] for emp in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        url = f"/api/v1/employees?limit=3&cursor={cursor}"
+
+    assert seen == sorted(ids)
+
+
+def test_list_employees_cursor_with_nullable_sort(client, admin_token):
+    """
+    Test: Cursor sobre una columna nullable (hired_at) en orden descendente
+    Esperado: mismo resultado que pedir todo en una sola pagina
+    """
+    _create_employees(client, admin_token, 6, prefix = "hired")
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    full = client.get("/api/v1/employees?limit=100&sort=-hired_at", headers = headers).json()
+
+    seen = []
+    url = "/api/v1/employees?limit=2&sort=-hired_at"
+    while url:
+        response = client.get(url, headers = headers)
+        seen.extend(emp["id"] for emp in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        url = f"/api/v1/employees?limit=2&sort=-hired_at&cursor={cursor}" if cursor else None
+
+    assert seen == [emp["id"] for emp in full]
+
+
+@pytest.mark.parametrize("sort", ["created_at", "-created_at", "updated_at", "-updated_at"])
+def test_list_employees_cursor_on_timestamps(client, admin_token, sort):
+    """
+    Test: Cursor sobre created_at / updated_at con varias filas creadas en el mismo segundo
+    Esperado: cada empleado aparece una sola vez (sin bucles ni saltos) y en el orden
+    de la respuesta sin paginar
+    """
+    ids = _create_employees(client, admin_token, 5, prefix = sort.replace("-", "desc_"))
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    full = client.get(f"/api/v1/employees?limit=100&sort={sort}", headers = headers).json()
+
+    seen = []
+    url = f"/api/v1/employees?limit=2&sort={sort}"
+    for _ in range(len(full)):
+        response = client.get(url, headers = headers)
+        assert response.status_code == 200
+        seen.extend(emp["id"] for emp in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        url = f"/api/v1/employees?limit=2&sort={sort}&cursor={cursor}"
+
+    assert seen == [emp["id"] for emp in full]
+    assert set(ids) <= set(seen)
+
+
+def test_list_employees_invalid_cursor(client, admin_token):
+    """
+    Test: Cursor invalido, o cursor usado con otro sort
+    Esperado: 400 Bad Request
+    """
+    _create_employees(client, admin_token, 2, prefix = "invalid")
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    response = client.get("/api/v1/employees?cursor=no-es-un-cursor", headers = headers)
+    assert response.status_code == 400
+
+    cursor = client.get("/api/v1/employees?limit=1", headers = headers).headers["X-Next-Cursor"]
+    response = client.get(
+        f"/api/v1/employees?limit=1&sort=last_name&cursor={cursor}",
+        headers = headers,
+    )
+    assert response.status_code == 400
+
+
+def test_list_employees_invalid_sort(client, admin_token):
+    """
+    Test: Ordenar por una columna no permitida
+    Esperado: 400 Bad Request
+    """
+    response = client.get(
+        "/api/v1/employees?sort=hashed_password",
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+
+    assert response.status_code == 400
+
+
+def test_list_employees_filters(client, admin_token):
+    """
+    Test: Filtros por departamento, puesto y rango de hired_at
+    Esperado: solo los empleados que cumplen todos los filtros
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    rows = [
+        ("Ana", "IT", "Developer", "2024-01-10"),
+        ("Beto", "IT", "Developer", "2025-03-01"),
+        ("Carla", "IT", "QA", "2025-03-01"),
+        ("Dario", "HR", "Developer", "2025-03-01"),
+    ]
+    ids = {}
+    for name, department, position, hired_at in rows:
+        ids[name] = client.post(
+            "/api/v1/employees",
+            json={"first_name": name, "last_name": "Filtro", "department": department,
+                  "position": position, "hired_at": hired_at},
+            headers=headers,
+        ).json()["id"]
+
+    response = client.get(
+        "/api/v1/employees?department=IT&position=Developer&hired_from=2025-01-01&hired_to=2025-12-31",
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+    assert [emp["id"] for emp in response.json()] == [ids["Beto"]]
+
+
+def test_list_employees_search_and_sort(client, admin_token):
+    """
+    Test: Busqueda ?q= por nombre/email y orden por last_name descendente
+    Esperado: coincidencias parciales sin importar mayusculas, y los comodines se escapan
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    for first, last, email in [
+        ("Juan", "Pérez", "jperez@example.com"),
+        ("Juana", "Arias", "jarias@example.com"),
+        ("Pedro", "Zamora", "pz@example.com"),
+    ]:
+        client.post(
+            "/api/v1/employees",
+            json={"first_name": first, "last_name": last, "email": email},
+            headers=headers,
+        )
+
+    by_name = client.get("/api/v1/employees?q=JUAN&sort=-last_name", headers=headers).json()
+    assert [emp["last_name"] for emp in by_name] == ["Pérez", "Arias"]
+
+    by_email = client.get("/api/v1/employees?q=pz@", headers=headers).json()
+    assert [emp["first_name"] for emp in by_email] == ["Pedro"]
+
+    wildcard = client.get("/api/v1/employees?q=%25", headers=headers).json()
+    assert wildcard == []
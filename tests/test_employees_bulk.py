@@ -0,0 +1,119 @@
+# tests/test_employees_bulk.py
+import json
+
+from sqlalchemy import func, select
+
+from app.models.activity_log import ActivityLog
+from app.models.employee import Employee
+
+
+def test_bulk_create_employees(client, admin_token):
+    """
+    Test: Alta masiva con filas validas, invalidas y emails repetidos
+    Esperado: 200 OK con el resultado de cada fila
+    """
+    response = client.post(
+        "/api/v1/employees/bulk",
+        json=[
+            {"first_name": "Ana", "last_name": "Uno", "email": "ana@example.com"},
+            {"first_name": "Sin apellido"},
+            {"first_name": "Ana", "last_name": "Dos", "email": "ana@example.com"},
+            {"first_name": "Beto", "last_name": "Tres"},
+        ],
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 2
+    assert data["failed"] == 2
+    statuses = [r["status"] for r in data["results"]]
+    assert statuses == ["created", "invalid", "duplicate", "created"]
+    assert "last_name" in data["results"][1]["error"]
+
+
+def test_bulk_create_ndjson_and_existing_email(client, admin_token):
+    """
+    Test: Alta masiva en NDJSON con un email que ya existe en la BD
+    Esperado: la fila existente se reporta como duplicate
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    client.post(
+        "/api/v1/employees",
+        json={"first_name": "Existe", "last_name": "Ya", "email": "existe@example.com"},
+        headers=headers,
+    )
+
+    body = "\n".join(json.dumps(row) for row in [
+        {"first_name": "Nuevo", "last_name": "Uno", "email": "nuevo@example.com"},
+        {"first_name": "Existe", "last_name": "Otra vez", "email": "existe@example.com"},
+    ])
+    response = client.post(
+        "/api/v1/employees/bulk",
+        content=body,
+        headers={**headers, "Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert [r["status"] for r in response.json()["results"]] == ["created", "duplicate"]
+
+
+def test_bulk_upsert_updates_by_email(client, admin_token, db_session):
+    """
+    Test: upsert=true con un email existente
+    Esperado: se actualiza el empleado existente en vez de fallar
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    existing_id = client.post(
+        "/api/v1/employees",
+        json={"first_name": "Viejo", "last_name": "Nombre", "email": "upsert@example.com"},
+        headers=headers,
+    ).json()["id"]
+
+    response = client.post(
+        "/api/v1/employees/bulk?upsert=true",
+        json=[{"first_name": "Nuevo", "last_name": "Nombre", "email": "upsert@example.com", "department": "HR"}],
+        headers=headers,
+    )
+
+    assert response.json()["results"] == [
+        {"index": 0, "status": "updated", "id": existing_id, "error": None}
+    ]
+    updated = client.get(f"/api/v1/employees/{existing_id}", headers=headers).json()
+    assert updated["first_name"] == "Nuevo"
+    assert updated["department"] == "HR"
+
+
+def test_bulk_create_one_activity_per_chunk(client, admin_token, db_session, monkeypatch, test_settings):
+    """
+    Test: 5 filas con chunks de 2
+    Esperado: 3 entradas de actividad (una por chunk), no una por empleado
+    """
+    monkeypatch.setattr(test_settings, "bulk_chunk_size", 2)
+
+    response = client.post(
+        "/api/v1/employees/bulk",
+        json=[{"first_name": f"Chunk{i}", "last_name": "Test"} for i in range(5)],
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+
+    assert response.json()["created"] == 5
+    activities = db_session.scalar(
+        select(func.count()).select_from(ActivityLog).where(ActivityLog.action == "bulk_create_employees")
+    )
+    assert activities == 3
+    assert db_session.scalar(select(func.count()).select_from(Employee)) == 5
+
+
+def test_bulk_create_rejects_non_list(client, admin_token):
+    """
+    Test: Body que no es un array
+    Esperado: 400 Bad Request
+    """
+    response = client.post(
+        "/api/v1/employees/bulk",
+        json={"first_name": "Solo", "last_name": "Uno"},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+
+    assert response.status_code == 400
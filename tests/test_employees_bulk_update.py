@@ -0,0 +1,116 @@
+# tests/test_employees_bulk_update.py
+from sqlalchemy import select
+
+from app.core.employee_stats import recompute_stats
+from app.models.activity_log import ActivityLog
+
+
+def _get(client, headers, employee_id):
+    return client.get(f"/api/v1/employees/{employee_id}", headers = headers).json()
+
+
+def test_bulk_update_by_filter(client, admin_token, db_session, create_employee):
+    """
+    Test: Mover todo un departamento a otro con PATCH /employees/bulk
+    Esperado: solo cambian los del filtro, una sola entrada de actividad y stats consistentes
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    moved = [create_employee(department = "Sales", hired_at = "2024-02-01") for _ in range(3)]
+    other = create_employee(department = "IT")
+
+    response = client.patch(
+        "/api/v1/employees/bulk",
+        json = {"filter": {"department": "Sales"}, "patch": {"department": "Growth", "position": "Rep"}},
+        headers = headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"updated": 3}
+    assert all(_get(client, headers, employee_id)["department"] == "Growth" for employee_id in moved)
+    assert _get(client, headers, other)["department"] == "IT"
+
+    actions = db_session.scalars(select(ActivityLog.action).where(ActivityLog.action.like("bulk_%"))).all()
+    assert actions == ["bulk_update_employees"]
+    assert recompute_stats(db_session.connection(), dry_run = True) == {}
+
+
+def test_bulk_update_skips_unchanged_rows(client, admin_token, create_employee):
+    """
+    Test: PATCH /employees/bulk por ids donde un empleado ya tiene el valor pedido
+    Esperado: updated cuenta solo el que cambia; una segunda corrida no cambia nada
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    first = create_employee(department = "HR")
+    second = create_employee(department = "Ops")
+    body = {"filter": {"ids": [first, second]}, "patch": {"department": "Ops"}}
+
+    assert client.patch("/api/v1/employees/bulk", json = body, headers = headers).json() == {"updated": 1}
+    assert client.patch("/api/v1/employees/bulk", json = body, headers = headers).json() == {"updated": 0}
+
+
+def test_bulk_update_invalidates_cache(client, admin_token, create_employee):
+    """
+    Test: GET de un empleado (queda en cache) y luego PATCH /employees/bulk sobre el
+    Esperado: el siguiente GET devuelve el valor nuevo
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    employee_id = create_employee(department = "HR")
+    assert _get(client, headers, employee_id)["department"] == "HR"
+
+    client.patch(
+        "/api/v1/employees/bulk",
+        json = {"filter": {"ids": [employee_id]}, "patch": {"department": "Legal"}},
+        headers = headers,
+    )
+    assert _get(client, headers, employee_id)["department"] == "Legal"
+
+
+def test_bulk_deactivate(client, admin_token, db_session, create_employee):
+    """
+    Test: POST /employees/bulk-deactivate por rango de fecha de ingreso
+    Esperado: se desactivan solo los del rango; los inactivos quedan fuera del listado y stats consistentes
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    old = [create_employee(hired_at = f"2020-0{i + 1}-01") for i in range(2)]
+    recent = create_employee(hired_at = "2025-01-01")
+
+    response = client.post(
+        "/api/v1/employees/bulk-deactivate",
+        json = {"filter": {"hired_to": "2020-12-31"}},
+        headers = headers,
+    )
+
+    assert response.json() == {"updated": 2}
+    listed = [employee["id"] for employee in client.get("/api/v1/employees", headers = headers).json()]
+    assert listed == [recent]
+    assert all(_get(client, headers, employee_id)["is_active"] is False for employee_id in old)
+
+    stats = client.get("/api/v1/employees/stats", headers = headers).json()
+    assert (stats["active"], stats["inactive"]) == (1, 2)
+    assert recompute_stats(db_session.connection(), dry_run = True) == {}
+
+
+def test_bulk_update_validation(client, admin_token, monkeypatch, test_settings, create_employee):
+    """
+    Test: Filtro vacio, patch vacio y demasiados ids
+    Esperado: 400, 400 y 413 sin modificar nada
+    """
+    monkeypatch.setattr(test_settings, "lookup_max_ids", 2)
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    create_employee(department = "HR")
+
+    response = client.patch(
+        "/api/v1/employees/bulk", json = {"filter": {}, "patch": {"department": "X"}}, headers = headers,
+    )
+    assert response.status_code == 400
+    response = client.patch(
+        "/api/v1/employees/bulk", json = {"filter": {"department": "HR"}, "patch": {}}, headers = headers,
+    )
+    assert response.status_code == 400
+    response = client.post(
+        "/api/v1/employees/bulk-deactivate", json = {"filter": {"ids": [1, 2, 3]}}, headers = headers,
+    )
+    assert response.status_code == 413
+
+    stats = client.get("/api/v1/employees/stats", headers = headers).json()
+    assert stats["by_department"] == [{"department": "HR", "active": 1, "inactive": 0, "total": 1}]
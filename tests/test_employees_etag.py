@@ -0,0 +1,109 @@
+# tests/test_employees_etag.py
+
+def test_get_employee_if_none_match(client, admin_token, create_employee):
+    """
+    Test: GET con If-None-Match igual al ETag recibido
+    Esperado: 304 Not Modified sin body
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    employee_id = create_employee(first_name = "Etag", last_name = "Uno")
+
+    first = client.get(f"/api/v1/employees/{employee_id}", headers = headers)
+    etag = first.headers["ETag"]
+
+    second = client.get(f"/api/v1/employees/{employee_id}", headers = {**headers, "If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+
+    other = client.get(f"/api/v1/employees/{employee_id}", headers = {**headers, "If-None-Match": '"otro"'})
+    assert other.status_code == 200
+
+
+def test_list_employees_if_none_match(client, admin_token, create_employee):
+    """
+    Test: Pagina del listado con If-None-Match
+    Esperado: 304 si la pagina no cambio, 200 con otro ETag si cambio
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    create_employee(first_name = "Lista", last_name = "Uno")
+
+    etag = client.get("/api/v1/employees", headers = headers).headers["ETag"]
+    assert client.get("/api/v1/employees", headers = {**headers, "If-None-Match": etag}).status_code == 304
+
+    create_employee(first_name = "Lista", last_name = "Dos")
+    changed = client.get("/api/v1/employees", headers = {**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_update_employee_if_match(client, admin_token, create_employee):
+    """
+    Test: PUT con If-Match (concurrencia optimista)
+    Esperado: 200 con el ETag actual, 412 con un ETag viejo/incorrecto
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    employee_id = create_employee(first_name = "Match", last_name = "Uno")
+    etag = client.get(f"/api/v1/employees/{employee_id}", headers = headers).headers["ETag"]
+
+    stale = client.put(
+        f"/api/v1/employees/{employee_id}",
+        json = {"department": "HR"},
+        headers = {**headers, "If-Match": '"version-vieja"'},
+    )
+    assert stale.status_code == 412
+
+    ok = client.put(
+        f"/api/v1/employees/{employee_id}",
+        json = {"department": "IT"},
+        headers = {**headers, "If-Match": etag},
+    )
+    assert ok.status_code == 200
+    assert ok.json()["department"] == "IT"
+    assert "ETag" in ok.headers
+
+
+def test_update_changes_etag_and_rejects_stale_if_match(client, admin_token, create_employee):
+    """
+    Test: Dos PUT en el mismo segundo, el segundo con el If-Match de antes del primero
+    Esperado: el ETag cambia con cada PUT y el PUT con ETag viejo recibe 412 (no pisa el primero)
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    employee_id = create_employee(first_name = "Version", last_name = "Uno")
+    etag = client.get(f"/api/v1/employees/{employee_id}", headers = headers).headers["ETag"]
+
+    first = client.put(
+        f"/api/v1/employees/{employee_id}",
+        json = {"department": "IT"},
+        headers = {**headers, "If-Match": etag},
+    )
+    assert first.status_code == 200
+    assert first.headers["ETag"] != etag
+
+    second = client.put(
+        f"/api/v1/employees/{employee_id}",
+        json = {"department": "HR"},
+        headers = {**headers, "If-Match": etag},
+    )
+    assert second.status_code == 412
+    current = client.get(f"/api/v1/employees/{employee_id}", headers = headers)
+    assert current.json()["department"] == "IT"
+    assert current.headers["ETag"] == first.headers["ETag"]
+
+
+def test_stale_if_none_match_after_update(client, admin_token, create_employee):
+    """
+    Test: GET con el If-None-Match de antes de un PUT hecho en el mismo segundo
+    Esperado: 200 con los datos nuevos (no 304)
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    employee_id = create_employee(first_name = "Version", last_name = "Dos")
+    etag = client.get(f"/api/v1/employees/{employee_id}", headers = headers).headers["ETag"]
+    list_etag = client.get("/api/v1/employees", headers = headers).headers["ETag"]
+
+    client.put(f"/api/v1/employees/{employee_id}", json = {"position": "Lead"}, headers = headers)
+
+    response = client.get(f"/api/v1/employees/{employee_id}", headers = {**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["position"] == "Lead"
+    assert client.get("/api/v1/employees", headers = {**headers, "If-None-Match": list_etag}).status_code == 200
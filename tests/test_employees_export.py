@@ -0,0 +1,58 @@
+# tests/test_employees_export.py
+import csv
+import io
+import json
+
+
+def test_export_employees_ndjson(client, admin_token, monkeypatch, test_settings, create_employee):
+    """
+    Test: Exportar empleados activos en NDJSON (lotes de 2 filas)
+    Esperado: una linea JSON por empleado activo, ordenado por id
+    """
+    monkeypatch.setattr(test_settings, "export_batch_size", 2)
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    ids = [
+        create_employee(first_name = f"Exp{i}", last_name = "Nd", hired_at = "2025-01-0" + str(i + 1))
+        for i in range(5)
+    ]
+    client.delete(f"/api/v1/employees/{ids[0]}", headers = headers)
+
+    response = client.get("/api/v1/employees/export?format=ndjson", headers = headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == ids[1:]
+    assert rows[0]["hired_at"] == "2025-01-02"
+
+
+def test_export_employees_csv_inactive(client, admin_token, create_employee):
+    """
+    Test: Exportar empleados inactivos en CSV
+    Esperado: cabecera con las columnas de EmployeeRead + solo los inactivos
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    active_id = create_employee(first_name = "Activo", last_name = "Csv")
+    inactive_id = create_employee(first_name = "Inactivo", last_name = "Csv")
+    client.delete(f"/api/v1/employees/{inactive_id}", headers = headers)
+
+    response = client.get("/api/v1/employees/export?format=csv&is_active=false", headers = headers)
+
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [int(row["id"]) for row in rows] == [inactive_id]
+    assert "first_name" in rows[0] and "created_by_id" in rows[0]
+    assert active_id not in [int(row["id"]) for row in rows]
+
+
+def test_export_employees_invalid_format(client, admin_token):
+    """
+    Test: Formato de export no soportado
+    Esperado: 422 Unprocessable Entity
+    """
+    response = client.get(
+        "/api/v1/employees/export?format=xml",
+        headers = {"Authorization": f"Bearer {admin_token}"},
+    )
+
+    assert response.status_code == 422
@@ -0,0 +1,57 @@
+# tests/test_employees_lookup.py
+
+def test_lookup_preserves_order_and_reports_missing(client, admin_token, create_employee):
+    """
+    Test: Buscar una lista de ids desordenada, con repetidos, un inactivo y un id inexistente
+    Esperado: items en el orden pedido sin repetidos (incluye el inactivo); el inexistente en missing
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    ids = [create_employee(last_name = str(i)) for i in range(3)]
+    client.delete(f"/api/v1/employees/{ids[1]}", headers = headers)
+
+    response = client.post(
+        "/api/v1/employees/lookup",
+        json = {"ids": [ids[2], 999999, ids[0], ids[1], ids[2]]},
+        headers = headers,
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["id"] for item in body["items"]] == [ids[2], ids[0], ids[1]]
+    assert body["items"][2]["is_active"] is False
+    assert body["missing"] == [999999]
+
+
+def test_lookup_chunks_large_lists(client, admin_token, monkeypatch, test_settings, create_employee):
+    """
+    Test: Buscar 5 ids con LOOKUP_CHUNK_SIZE = 2
+    Esperado: 3 queries WHERE id IN (...) y todos los empleados encontrados
+    """
+    monkeypatch.setattr(test_settings, "lookup_chunk_size", 2)
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    ids = [create_employee(last_name = str(i)) for i in range(5)]
+
+    response = client.post("/api/v1/employees/lookup", json = {"ids": ids}, headers = headers)
+
+    assert response.headers["X-DB-Queries"] == "3"
+    assert [item["id"] for item in response.json()["items"]] == ids
+
+
+def test_lookup_rejects_too_many_ids(client, admin_token, monkeypatch, test_settings):
+    """
+    Test: Buscar mas ids que LOOKUP_MAX_IDS, y una lista vacia
+    Esperado: 413 sin tocar la BD; 422 para la lista vacia
+    """
+    monkeypatch.setattr(test_settings, "lookup_max_ids", 3)
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    response = client.post("/api/v1/employees/lookup", json = {"ids": [1, 2, 3, 4]}, headers = headers)
+    assert response.status_code == 413
+
+    # los repetidos no cuentan para el limite
+    response = client.post("/api/v1/employees/lookup", json = {"ids": [1, 1, 2, 3]}, headers = headers)
+    assert response.status_code == 200
+
+    response = client.post("/api/v1/employees/lookup", json = {"ids": []}, headers = headers)
+    assert response.status_code == 422
+
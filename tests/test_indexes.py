@@ -0,0 +1,86 @@
+# tests/test_indexes.py
+import os
+import uuid
+
+import pytest
+from sqlalchemy import create_engine, select, text
+
+from app.db.session import Base
+from app.models.employee import Employee
+
+POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+
+def _listing_query():
+    # la consulta mas frecuente de list_employeess
+    return select(Employee).where(Employee.is_active == True).order_by(Employee.id).limit(20)  # noqa: E712
+
+
+def _department_query():
+    return (
+        select(Employee)
+        .where(Employee.department == "IT", Employee.is_active == True)  # noqa: E712
+        .order_by(Employee.id)
+        .limit(20)
+    )
+
+
+def _sqlite_plan(connection, stmt) -> str:
+    compiled = stmt.compile(connection, compile_kwargs = {"literal_binds": True})
+    rows = connection.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    return "\n".join(row[-1] for row in rows)
+
+
+def test_listing_query_uses_index_sqlite(db_session):
+    """
+    Test: EXPLAIN QUERY PLAN del listado en SQLite
+    Esperado: usa ix_employees_is_active_id (sin SCAN de la tabla ni sort temporal)
+    """
+    plan = _sqlite_plan(db_session.connection(), _listing_query())
+
+    assert "ix_employees_is_active_id" in plan
+    assert "USE TEMP B-TREE FOR ORDER BY" not in plan
+
+
+def test_department_query_uses_index_sqlite(db_session):
+    """
+    Test: EXPLAIN QUERY PLAN del filtro por departamento en SQLite
+    Esperado: usa ix_employees_department_is_active_id
+    """
+    plan = _sqlite_plan(db_session.connection(), _department_query())
+
+    assert "ix_employees_department_is_active_id" in plan
+
+
+@pytest.mark.skipif(POSTGRES_URL is None, reason = "TEST_POSTGRES_URL not set")
+def test_listing_query_uses_index_postgres():
+    """
+    Test: EXPLAIN del listado y del filtro por departamento en Postgres (TEST_POSTGRES_URL)
+    Esperado: cada consulta usa su indice (ix_employees_is_active_id /
+    ix_employees_department_is_active_id), sin Seq Scan
+    """
+    engine = create_engine(POSTGRES_URL)
+    try:
+        with engine.connect() as connection:
+            # tablas en un schema propio y todo en una transaccion que se descarta:
+            # la base del usuario queda como estaba (DDL transaccional en Postgres)
+            transaction = connection.begin()
+            schema = f"test_indexes_{uuid.uuid4().hex[:8]}"
+            connection.execute(text(f"CREATE SCHEMA {schema}"))
+            connection.execute(text(f"SET LOCAL search_path TO {schema}, public"))
+            Base.metadata.create_all(bind = connection)
+            # con tablas chicas el planner prefiere Seq Scan; forzamos que evalue los indices
+            connection.execute(text("SET LOCAL enable_seqscan = off"))
+            try:
+                for stmt, index in (
+                        (_listing_query(), "ix_employees_is_active_id"),
+                        (_department_query(), "ix_employees_department_is_active_id"),
+                ):
+                    compiled = stmt.compile(connection, compile_kwargs = {"literal_binds": True})
+                    plan = "\n".join(connection.execute(text(f"EXPLAIN {compiled}")).scalars())
+                    assert f"using {index}" in plan
+                    assert "Seq Scan" not in plan
+            finally:
+                transaction.rollback()
+    finally:
+        engine.dispose()
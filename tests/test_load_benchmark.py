@@ -0,0 +1,37 @@
+# tests/test_load_benchmark.py
+from benchmarks.load import compare, percentile, summarize
+
+
+def test_summarize_percentiles():
+    """
+    Test: Resumen de 100 latencias de 1..100 ms
+    Esperado: req/s segun el tiempo total y p50/p95/p99 en ms
+    """
+    latencies = [ms / 1000 for ms in range(1, 101)]
+    result = summarize(latencies, errors = 2, elapsed = 2.0)
+
+    assert result["requests"] == 100
+    assert result["errors"] == 2
+    assert result["req_per_sec"] == 50.0
+    assert result["p50_ms"] == 50.5
+    assert result["p95_ms"] == 95.0
+    assert result["p99_ms"] == 99.0
+    assert percentile([0.3], 99) == 0.3
+
+
+def test_compare_results():
+    """
+    Test: Comparar dos archivos de resultados
+    Esperado: cambio porcentual por escenario; escenarios faltantes se ignoran
+    """
+    before = {"scenarios": {
+        "list": {"req_per_sec": 100.0, "p50_ms": 10.0, "p95_ms": 20.0, "p99_ms": 40.0},
+        "login": {"req_per_sec": 10.0, "p50_ms": 100.0, "p95_ms": 200.0, "p99_ms": 400.0},
+    }}
+    after = {"scenarios": {
+        "list": {"req_per_sec": 150.0, "p50_ms": 5.0, "p95_ms": 20.0, "p99_ms": 50.0},
+    }}
+
+    assert compare(before, after) == {
+        "list": {"req_per_sec": 50.0, "p50_ms": -50.0, "p95_ms": 0.0, "p99_ms": 25.0},
+    }
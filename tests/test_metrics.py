@@ -0,0 +1,201 @@
+# tests/test_metrics.py
+import dataclasses
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.metrics import (
+    Histogram,
+    MetricsMiddleware,
+    http_request_db_queries,
+    http_requests_total,
+    redact_parameters,
+    registry,
+)
+
+
+def test_metrics_endpoint_exposition_format(client, admin_token):
+    """
+    Test: GET /metrics despues de listar empleados
+    Esperado: texto Prometheus con la ruta como template y el status
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    client.get("/api/v1/employees", headers = headers)
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+
+    body = response.text
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert 'http_requests_total{method="GET",route="/api/v1/employees",status="200"}' in body
+    assert 'cache_requests_total{cache="tokens",result="hit"}' in body
+
+
+def test_route_template_label(client, admin_token):
+    """
+    Test: GET /employees/{id} con distintos ids y una ruta inexistente
+    Esperado: un solo label con el template; las rutas sin match van a "unmatched"
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    labels = {"method": "GET", "route": "/api/v1/employees/{employee_id}", "status": "404"}
+    before = http_requests_total.value(**labels)
+
+    client.get("/api/v1/employees/9998", headers = headers)
+    client.get("/api/v1/employees/9999", headers = headers)
+    assert http_requests_total.value(**labels) == before + 2
+
+    unmatched = {"method": "GET", "route": "unmatched", "status": "404"}
+    before = http_requests_total.value(**unmatched)
+    client.get("/no-existe")
+    assert http_requests_total.value(**unmatched) == before + 1
+
+
+def test_db_queries_counted_per_request(client, admin_token):
+    """
+    Test: Queries ejecutadas en el threadpool durante un request
+    Esperado: se atribuyen a la ruta del request
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    route = "/api/v1/employees"
+    before = http_request_db_queries.count(route = route)
+
+    client.get("/api/v1/employees?limit=5", headers = headers)
+
+    assert http_request_db_queries.count(route = route) == before + 1
+    key = (route,)
+    counts, total = http_request_db_queries._values[key]
+    assert total >= 1
+
+
+def test_histogram_render_cumulative():
+    """
+    Test: Render de un histograma
+    Esperado: buckets acumulados, +Inf, _sum y _count
+    """
+    histogram = Histogram("demo_seconds", "demo", ("route",), buckets = (0.1, 1.0))
+    histogram.observe(0.05, route = "/a")
+    histogram.observe(0.5, route = "/a")
+    histogram.observe(5, route = "/a")
+
+    lines = histogram.render()
+    assert 'demo_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'demo_seconds_bucket{route="/a",le="1"} 2' in lines
+    assert 'demo_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'demo_seconds_sum{route="/a"} 5.55' in lines
+    assert 'demo_seconds_count{route="/a"} 3' in lines
+
+
+def test_registry_help_and_type_lines():
+    """
+    Test: Render del registry completo
+    Esperado: cada metrica con su # HELP y # TYPE
+    """
+    body = registry.render()
+    assert "# HELP db_queries_total SQL statements executed" in body
+    assert "# TYPE db_pool_checked_out gauge" in body
+
+
+def test_db_query_headers(client, admin_token, test_settings, monkeypatch):
+    """
+    Test: Respuesta con DB_QUERY_HEADERS habilitado / deshabilitado
+    Esperado: X-DB-Queries y X-DB-Time solo cuando esta habilitado
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    response = client.get("/api/v1/employees", headers = headers)
+    assert int(response.headers["X-DB-Queries"]) >= 1
+    assert float(response.headers["X-DB-Time"]) >= 0
+
+    monkeypatch.setattr(test_settings, "db_query_headers", False)
+    response = client.get("/api/v1/employees", headers = headers)
+    assert "X-DB-Queries" not in response.headers
+
+
+def _app_running(db_engine, statements, config = settings):
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, config = config)
+
+    @app.get("/items")
+    def items():
+        with db_engine.connect() as connection:
+            for statement, params in statements:
+                connection.execute(text(statement), params)
+        return []
+
+    return TestClient(app)
+
+
+def test_n_plus_one_detected(db_engine, monkeypatch, caplog):
+    """
+    Test: El mismo SELECT repetido en un request (lazy load por fila)
+    Esperado: se loguea como posible N+1 una sola vez, con la cantidad de ejecuciones
+    """
+    monkeypatch.setattr(settings, "n_plus_one_threshold", 3)
+    repeated = [("SELECT :id", {"id": value}) for value in range(4)]
+    client = _app_running(db_engine, repeated + [("SELECT 1", {})])
+
+    with caplog.at_level(logging.WARNING, logger = "uvicorn.error"):
+        response = client.get("/items")
+
+    assert response.headers["X-DB-Queries"] == "5"
+    messages = [record.getMessage() for record in caplog.records if "N+1" in record.getMessage()]
+    assert messages == ["Possible N+1 on GET /items: statement executed 4 times: SELECT ?"]
+
+
+def test_slow_query_logged_with_redacted_params(db_engine, monkeypatch, caplog):
+    """
+    Test: Statement por encima de SLOW_QUERY_MS
+    Esperado: se loguea el SQL, pero no los valores de los parametros
+    """
+    monkeypatch.setattr(settings, "slow_query_ms", 0.000001)
+    client = _app_running(db_engine, [("SELECT :secret", {"secret": "hunter2"})])
+
+    with caplog.at_level(logging.WARNING, logger = "uvicorn.error"):
+        client.get("/items")
+
+    slow = [record.getMessage() for record in caplog.records if record.getMessage().startswith("Slow query")]
+    assert slow
+    assert " on GET /items: SELECT ?" in slow[0]
+    assert "hunter2" not in slow[0]
+
+
+def test_slow_query_threshold_from_app_config(db_engine, caplog):
+    """
+    Test: SLOW_QUERY_MS minimo en la config de la app y el default (200 ms) en el settings global
+    Esperado: vale el de la app (el statement se loguea como lento)
+    """
+    config = dataclasses.replace(settings, slow_query_ms = 0.000001)
+    client = _app_running(db_engine, [("SELECT 1", {})], config = config)
+
+    with caplog.at_level(logging.WARNING, logger = "uvicorn.error"):
+        client.get("/items")
+
+    assert [record for record in caplog.records if record.getMessage().startswith("Slow query")]
+
+
+def test_bulk_insert_not_reported_as_n_plus_one(client, admin_token, test_settings, monkeypatch, caplog):
+    """
+    Test: Alta masiva de 20 filas (en SQLite un INSERT ... RETURNING por fila)
+    Esperado: no se loguea como posible N+1
+    """
+    monkeypatch.setattr(test_settings, "n_plus_one_threshold", 5)
+    rows = [{"first_name": "N1", "last_name": str(i), "email": f"n1-{i}@example.com"} for i in range(20)]
+
+    with caplog.at_level(logging.WARNING, logger = "uvicorn.error"):
+        response = client.post("/api/v1/employees/bulk", json = rows, headers = {"Authorization": f"Bearer {admin_token}"})
+
+    assert response.json()["created"] == 20
+    assert [record for record in caplog.records if "N+1" in record.getMessage()] == []
+
+
+def test_redact_parameters():
+    """
+    Test: Redaccion de parametros (dict, tupla, executemany)
+    Esperado: solo tipos, nunca valores
+    """
+    assert redact_parameters({"email": "a@b.com", "id": 1}) == {"email": "str", "id": "int"}
+    assert redact_parameters(("a@b.com", 1)) == ["str", "int"]
+    assert redact_parameters([{"id": 1}, {"id": 2}]) == [{"id": "int"}, "... 2 rows"]
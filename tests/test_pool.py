@@ -0,0 +1,96 @@
+# tests/test_pool.py
+from dataclasses import replace
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.db.pool import InstrumentedQueuePool, engine_options, pool_metrics
+
+
+def test_engine_options_queue_pool():
+    """
+    Test: Opciones del engine para Postgres con pool configurado
+    Esperado: usa InstrumentedQueuePool con los valores de Settings
+    """
+    config = replace(
+        settings,
+        database_url = "postgresql+psycopg2://u:p@db/app",
+        db_pool_size = 20,
+        db_max_overflow = 5,
+        db_pool_recycle = 600,
+        db_pool_pre_ping = True,
+        db_null_pool = False,
+    )
+
+    options = engine_options(config)
+
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert options["pool_size"] == 20
+    assert options["max_overflow"] == 5
+    assert options["pool_recycle"] == 600
+    assert options["pool_pre_ping"] is True
+
+
+def test_engine_options_null_pool():
+    """
+    Test: Modo NullPool para usar detras de PgBouncer
+    Esperado: sin argumentos de tamaño de pool
+    """
+    config = replace(
+        settings,
+        database_url = "postgresql+psycopg2://u:p@db/app",
+        db_null_pool = True,
+    )
+
+    assert engine_options(config) == {"poolclass": NullPool}
+
+
+def test_instrumented_pool_records_timeouts(tmp_path):
+    """
+    Test: Pool saturado (1 conexion, sin overflow)
+    Esperado: el segundo checkout hace timeout y queda registrado
+    """
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass = InstrumentedQueuePool,
+        pool_size = 1,
+        max_overflow = 0,
+        pool_timeout = 0.05,
+    )
+    pool_metrics.reset()
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    snapshot = pool_metrics.snapshot(engine.pool)
+    assert snapshot["timeouts"] == 1
+    assert snapshot["wait_seconds_max"] >= 0.05
+    assert snapshot["size"] == 1
+    engine.dispose()
+
+
+@pytest.mark.parametrize("db_async", [False, True])
+def test_database_pool_is_the_one_requests_use(tmp_path, db_async):
+    """
+    Test: Pool reportado por /health/stats y /metrics en modo sync y DB_ASYNC=true
+    Esperado: None antes de crear el engine; despues el del engine sync, o el del
+    AsyncEngine en modo async (aunque el engine sync tambien exista)
+    """
+    from app.db.session import Database
+
+    database = Database(replace(settings, database_url = f"sqlite:///{tmp_path / 'pool.db'}", db_async = db_async))
+    try:
+        assert database.pool is None
+        database.engine
+        if db_async:
+            assert database.pool is None
+            async_engine = database.async_engine
+            assert database.pool is async_engine.sync_engine.pool
+        else:
+            assert database.pool is database.engine.pool
+    finally:
+        database.dispose()
@@ -0,0 +1,236 @@
+# tests/test_response_cache.py
+import asyncio
+import dataclasses
+import sys
+
+import pytest
+
+from app.core.response_cache import CacheBackend, EmployeeResponseCache, InMemoryBackend, RedisBackend, response_cache
+
+
+def test_get_employee_served_from_cache(client, admin_token, create_employee):
+    """
+    Test: Dos GET seguidos del mismo empleado
+    Esperado: el segundo sale del cache con el mismo body y ETag
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    employee_id = create_employee(first_name = "Cache", last_name = "Uno")
+
+    first = client.get(f"/api/v1/employees/{employee_id}", headers = headers)
+    hits = response_cache.hits
+    second = client.get(f"/api/v1/employees/{employee_id}", headers = headers)
+
+    assert second.status_code == 200
+    assert response_cache.hits == hits + 1
+    assert second.json() == first.json()
+    assert second.headers["ETag"] == first.headers["ETag"]
+
+    # el ETag sigue funcionando sobre la entrada cacheada
+    not_modified = client.get(
+        f"/api/v1/employees/{employee_id}",
+        headers = {**headers, "If-None-Match": first.headers["ETag"]},
+    )
+    assert not_modified.status_code == 304
+
+
+def test_update_invalidates_cached_employee(client, admin_token, create_employee):
+    """
+    Test: GET (cacheado) -> PUT -> GET
+    Esperado: el ultimo GET devuelve los datos nuevos, no la entrada vieja
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    employee_id = create_employee(first_name = "Cache", last_name = "Dos", department = "IT")
+    client.get(f"/api/v1/employees/{employee_id}", headers = headers)
+    client.get("/api/v1/employees", headers = headers)
+
+    client.put(f"/api/v1/employees/{employee_id}", json = {"department": "HR"}, headers = headers)
+
+    assert client.get(f"/api/v1/employees/{employee_id}", headers = headers).json()["department"] == "HR"
+    listed = {emp["id"]: emp for emp in client.get("/api/v1/employees", headers = headers).json()}
+    assert listed[employee_id]["department"] == "HR"
+
+
+def test_create_and_delete_invalidate_cached_list(client, admin_token, create_employee):
+    """
+    Test: Listado cacheado y luego POST / DELETE
+    Esperado: el listado refleja el alta y la baja
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    first_id = create_employee(first_name = "Cache", last_name = "Tres")
+    assert [emp["id"] for emp in client.get("/api/v1/employees", headers = headers).json()] == [first_id]
+
+    second_id = create_employee(first_name = "Cache", last_name = "Cuatro")
+    assert [emp["id"] for emp in client.get("/api/v1/employees", headers = headers).json()] == [first_id, second_id]
+
+    client.delete(f"/api/v1/employees/{first_id}", headers = headers)
+    assert [emp["id"] for emp in client.get("/api/v1/employees", headers = headers).json()] == [second_id]
+
+
+def test_list_cache_keeps_next_cursor_header(client, admin_token, create_employee):
+    """
+    Test: Pagina llena servida desde el cache
+    Esperado: conserva X-Next-Cursor y distintos query params no comparten entrada
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    for index in range(3):
+        create_employee(first_name = "Cursor", last_name = f"C{index}")
+
+    first = client.get("/api/v1/employees?limit=2", headers = headers)
+    cached = client.get("/api/v1/employees?limit=2", headers = headers)
+    assert cached.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+
+    page = client.get(f"/api/v1/employees?limit=2&cursor={first.headers['X-Next-Cursor']}", headers = headers)
+    assert len(page.json()) == 1
+
+
+def test_write_invalidates_other_workers(client, admin_token, create_employee):
+    """
+    Test: Dos workers con su propio LRU en memoria; el GET cachea en uno y el PUT
+    pasa por el otro
+    Esperado: el primer worker no sirve la entrada vieja (las versiones estan en la BD)
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    employee_id = create_employee(first_name = "Worker", last_name = "Uno", department = "IT")
+    worker_a = response_cache.backend
+    worker_b = InMemoryBackend(maxsize = 100, ttl = response_cache.ttl)
+
+    client.get(f"/api/v1/employees/{employee_id}", headers = headers)
+    client.get("/api/v1/employees", headers = headers)
+    try:
+        response_cache.backend = worker_b
+        assert client.put(
+            f"/api/v1/employees/{employee_id}", json = {"department": "HR"}, headers = headers,
+        ).status_code == 200
+    finally:
+        response_cache.backend = worker_a
+
+    hits = response_cache.hits
+    assert client.get(f"/api/v1/employees/{employee_id}", headers = headers).json()["department"] == "HR"
+    listed = {emp["id"]: emp for emp in client.get("/api/v1/employees", headers = headers).json()}
+    assert listed[employee_id]["department"] == "HR"
+    assert response_cache.hits == hits
+
+
+def test_response_cache_disabled_without_backend():
+    """
+    Test: RESPONSE_CACHE_BACKEND=none
+    Esperado: nunca devuelve entradas ni claves (ni consulta la BD)
+    """
+    cache = EmployeeResponseCache(None, ttl = 60)
+    assert asyncio.run(cache.get_employee(None, 1)) == (None, None)
+    assert not cache.enabled
+
+
+class FakeRedis:
+    """Lo minimo de redis.asyncio.Redis que usa RedisBackend (bytes, TTL en ms)."""
+
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, px = None):
+        self.values[key] = value
+        self.ttls[key] = px
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+
+    async def scan_iter(self, match = None):
+        prefix = match.rstrip("*")
+        for key in list(self.values):
+            if key.startswith(prefix):
+                yield key
+
+
+def test_redis_backend_against_fake_client():
+    """
+    Test: RedisBackend sobre un cliente falso
+    Esperado: claves con prefijo, TTL en milisegundos (minimo 1) y clear solo borra
+    las claves del prefijo
+    """
+    async def scenario():
+        client = FakeRedis()
+        client.values["otra-app:x"] = b"1"
+        backend = RedisBackend(client, prefix = "ema:")
+
+        await backend.set("employees:1:1", b"body", ttl = 30)
+        await backend.set("employees:2:1", b"body", ttl = 0.0001)
+        assert client.ttls == {"ema:employees:1:1": 30000, "ema:employees:2:1": 1}
+        assert await backend.get("employees:1:1") == b"body"
+        assert await backend.get("employees:3:1") is None
+
+        await backend.delete("employees:1:1")
+        assert await backend.get("employees:1:1") is None
+
+        await backend.clear()
+        assert client.values == {"otra-app:x": b"1"}
+
+    asyncio.run(scenario())
+
+
+def test_response_cache_with_redis_backend(client, admin_token, create_employee):
+    """
+    Test: Cache de respuestas con RedisBackend (cliente falso)
+    Esperado: el segundo GET sale del cache y un PUT lo invalida
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    employee_id = create_employee(first_name = "Redis", last_name = "Uno", department = "IT")
+    backend = response_cache.backend
+    response_cache.backend = RedisBackend(FakeRedis())
+    try:
+        client.get(f"/api/v1/employees/{employee_id}", headers = headers)
+        hits = response_cache.hits
+        client.get(f"/api/v1/employees/{employee_id}", headers = headers)
+        assert response_cache.hits == hits + 1
+
+        client.put(f"/api/v1/employees/{employee_id}", json = {"department": "HR"}, headers = headers)
+        assert client.get(f"/api/v1/employees/{employee_id}", headers = headers).json()["department"] == "HR"
+    finally:
+        response_cache.backend = backend
+
+
+def test_writes_invalidate_without_queries_on_event_loop(client, admin_token, loop_queries):
+    """
+    Test: PUT y DELETE de un empleado (invalidan la cache en su transaccion)
+    Esperado: ninguna query corre en el thread del event loop
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    employee_id = client.post(
+        "/api/v1/employees", json = {"first_name": "Loop", "last_name": "Check"}, headers = headers,
+    ).json()["id"]
+
+    assert client.put(f"/api/v1/employees/{employee_id}", json = {"position": "Dev"}, headers = headers).status_code == 200
+    assert client.delete(f"/api/v1/employees/{employee_id}", headers = headers).status_code == 204
+    assert loop_queries == []
+
+
+def test_build_backend_from_config(monkeypatch):
+    """
+    Test: RESPONSE_CACHE_BACKEND memory (default), none y redis sin el paquete
+    Esperado: LRU en memoria, sin cache, y RuntimeError claro si falta redis
+    """
+    from app.core.config import settings
+    from app.core.response_cache import _build_backend
+
+    assert isinstance(_build_backend(dataclasses.replace(settings, response_cache_backend = "memory")), InMemoryBackend)
+    assert _build_backend(dataclasses.replace(settings, response_cache_backend = "none")) is None
+
+    monkeypatch.setitem(sys.modules, "redis", None)
+    with pytest.raises(RuntimeError):
+        _build_backend(dataclasses.replace(settings, response_cache_backend = "redis"))
+
+
+def test_cache_backend_is_abstract():
+    """
+    Test: Backend que no implementa toda la interfaz
+    Esperado: TypeError al instanciarlo (no un NotImplementedError en el primer uso)
+    """
+    class Partial(CacheBackend):
+        async def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Partial()
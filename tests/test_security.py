@@ -0,0 +1,132 @@
+# tests/test_security.py
+import asyncio
+import threading
+import time
+
+from app.core import security
+from app.core.security import (
+    PasswordHasher,
+    create_access_token,
+    decode_access_token,
+    get_password_hash,
+    token_cache,
+)
+
+
+def test_decode_access_token_cached():
+    """
+    Test: Decodificar el mismo token dos veces
+    Esperado: el segundo decode sale del cache con el mismo payload
+    """
+    token = create_access_token(subject = "cache@example.com")
+
+    first = decode_access_token(token)
+    second = decode_access_token(token)
+
+    assert first["sub"] == "cache@example.com"
+    assert second == first
+    assert token_cache.stats()["hits"] == 1
+
+
+def test_decode_access_token_cache_respects_exp(monkeypatch):
+    """
+    Test: Un token cacheado cuyo exp ya paso
+    Esperado: no se sirve desde el cache, se vuelve a verificar con jwt.decode
+    """
+    token = create_access_token(subject = "expired@example.com")
+    payload = decode_access_token(token)
+
+    calls = []
+    real_decode = security.jwt.decode
+
+    def spy_decode(*args, **kwargs):
+        calls.append(args)
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(security.jwt, "decode", spy_decode)
+    monkeypatch.setattr(security.time, "time", lambda: payload["exp"] + 1)
+
+    decode_access_token(token)
+
+    assert len(calls) == 1
+    assert token_cache.stats()["hits"] == 1
+
+
+def test_decode_access_token_invalid_not_cached():
+    """
+    Test: Token con firma invalida
+    Esperado: None y no se guarda en el cache
+    """
+    token = create_access_token(subject = "tampered@example.com")
+    tampered = token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+
+    assert decode_access_token(tampered) is None
+    assert token_cache.stats()["size"] == 0
+
+
+def test_password_hasher_limits_concurrency():
+    """
+    Test: 8 operaciones de hashing simultaneas con un pool de 2 workers
+    Esperado: nunca corren mas de 2 a la vez y todas terminan
+    """
+    hasher = PasswordHasher(workers = 2)
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_hash():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return "hash"
+
+    async def storm():
+        return await asyncio.gather(*(hasher._submit(slow_hash) for _ in range(8)))
+
+    try:
+        assert asyncio.run(storm()) == ["hash"] * 8
+    finally:
+        hasher.shutdown()
+    assert peak == 2
+    assert hasher.stats()["completed"] == 8
+    assert hasher.stats()["pending"] == 0
+
+
+def test_password_hasher_verify_and_update():
+    """
+    Test: verify_and_update con un hash de rounds viejos y uno actual
+    Esperado: nuevo hash solo para el viejo; password incorrecta -> (False, None)
+    """
+    from passlib.hash import pbkdf2_sha256
+
+    hasher = PasswordHasher(workers = 1)
+    outdated = pbkdf2_sha256.using(rounds = 1000).hash("secreto")
+    current = get_password_hash("secreto")
+
+    try:
+        valid, new_hash = asyncio.run(hasher.verify_and_update("secreto", outdated))
+        assert valid and new_hash is not None
+        assert asyncio.run(hasher.verify_and_update("secreto", current)) == (True, None)
+        assert asyncio.run(hasher.verify_and_update("otro", outdated)) == (False, None)
+    finally:
+        hasher.shutdown()
+    assert hasher.stats()["rehashed"] == 1
+
+
+def test_create_access_token_with_expires_delta():
+    """
+    Test: create_access_token con expires_delta explicito y claims
+    Esperado: devuelve un token valido con ese exp y los claims
+    """
+    from datetime import timedelta
+
+    token = create_access_token(subject = "delta@example.com", expires_delta = timedelta(minutes = 5), claims = {"uid": 3})
+    payload = decode_access_token(token)
+
+    assert payload["sub"] == "delta@example.com"
+    assert payload["uid"] == 3
+    assert 0 < payload["exp"] - time.time() <= 300
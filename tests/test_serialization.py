@@ -0,0 +1,107 @@
+# tests/test_serialization.py
+import json
+from datetime import date
+
+from app.api.v1.routes_employees import READ_FIELDS, _read_dict
+from app.core import serialization
+from app.models.employee import Employee
+from app.schemas.employee import EmployeeRead
+from benchmarks import bench_read_path, bench_serialization
+
+
+def _row(**overrides):
+    values = {
+        "first_name": "José",
+        "last_name": "Núñez",
+        "email": "jose@example.com",
+        "department": None,
+        "position": "Dev",
+        "is_active": True,
+        "hired_at": date(2024, 2, 29),
+        "id": 7,
+        "created_by_id": None,
+        **overrides,
+    }
+    return tuple(values[name] for name in READ_FIELDS)
+
+
+def test_fast_path_matches_pydantic_output():
+    """
+    Test: Serializar una fila con dumps() vs EmployeeRead.model_dump_json()
+    Esperado: el mismo JSON (claves, orden, fechas, None, unicode)
+    """
+    row = _row()
+    expected = json.loads(EmployeeRead.model_validate(_read_dict(row)).model_dump_json())
+
+    body = serialization.dumps(_read_dict(row))
+    assert json.loads(body) == expected
+    assert list(json.loads(body)) == list(expected)
+
+
+def test_stdlib_fallback_without_orjson(monkeypatch):
+    """
+    Test: dumps() cuando orjson no esta instalado
+    Esperado: mismo resultado con json de la stdlib
+    """
+    value = _read_dict(_row())
+    fast = serialization.dumps(value)
+
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert json.loads(serialization.dumps(value)) == json.loads(fast)
+
+
+def test_list_response_shape(client, admin_token):
+    """
+    Test: GET /employees servido desde filas de columnas
+    Esperado: solo los campos de EmployeeRead, con fechas en ISO
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    client.post(
+        "/api/v1/employees",
+        json = {"first_name": "Rapido", "last_name": "Uno", "hired_at": "2023-05-01"},
+        headers = headers,
+    )
+    response = client.get("/api/v1/employees", headers = headers)
+    assert response.headers["content-type"] == "application/json"
+
+    employee = response.json()[0]
+    assert list(employee) == READ_FIELDS
+    assert employee["hired_at"] == "2023-05-01"
+
+
+def test_list_does_not_load_orm_instances(client, admin_token, db_session):
+    """
+    Test: GET /employees y GET /employees/{id} con el identity map vacio
+    Esperado: ningun Employee queda en la sesion (se leen filas, no instancias ORM)
+    """
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    employee_id = client.post(
+        "/api/v1/employees",
+        json = {"first_name": "Sin", "last_name": "ORM"},
+        headers = headers,
+    ).json()["id"]
+    db_session.expunge_all()
+
+    assert client.get("/api/v1/employees", headers = headers).status_code == 200
+    assert client.get(f"/api/v1/employees/{employee_id}", headers = headers).status_code == 200
+    assert not any(isinstance(obj, Employee) for obj in db_session.identity_map.values())
+
+
+def test_read_path_benchmark():
+    """
+    Test: Benchmark ORM vs columnas con pocas filas
+    Esperado: reporta tiempo y memoria de ambos caminos
+    """
+    results = bench_read_path.run(rows = 200, repeat = 1)
+    assert results["orm"]["peak_mb"] > 0
+    assert results["rows"]["ms"] > 0
+
+
+def test_serialization_benchmark():
+    """
+    Test: Benchmark de serializacion de paginas de 100 items (pocas iteraciones)
+    Esperado: reporta el costo por item de ambos caminos
+    """
+    results = bench_serialization.run(items = 100, iterations = 5)
+    assert results["orm_pydantic_us"] > 0
+    assert results["rows_fast_us"] > 0
@@ -0,0 +1,94 @@
+# tests/test_startup.py
+import dataclasses
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.db.deps import ThreadedSession, get_async_db
+from app.db.session import Database, database
+from app.main import create_app
+from benchmarks import bench_startup
+
+
+def test_import_app_without_database_url():
+    """
+    Test: import app.main en un proceso nuevo, sin DATABASE_URL
+    Esperado: importa bien y no carga jose / passlib / drivers de BD
+    """
+    results = bench_startup.run(runs = 1, top = 5)
+    assert results["total_ms"] > 0
+    assert results["deferred_loaded"] == []
+
+
+def test_engine_created_on_first_use():
+    """
+    Test: Database sin DATABASE_URL y luego configurado
+    Esperado: el error aparece al pedir el engine (no al crearlo); el engine se crea una sola vez
+    """
+    db = Database(dataclasses.replace(settings, database_url = None))
+    with pytest.raises(RuntimeError, match = "DATABASE_URL"):
+        db.engine
+
+    db.configure(dataclasses.replace(settings, database_url = "sqlite://"))
+    assert db._engine is None
+    assert db.engine is db.engine
+    db.dispose()
+    assert db._engine is None
+
+
+def test_create_app_lifespan_configures_database(tmp_path):
+    """
+    Test: create_app(config) con otra DATABASE_URL, arrancando y cerrando la app
+    Esperado: el engine se crea en el startup con esa URL y se libera en el shutdown
+    """
+    config = dataclasses.replace(settings, database_url = f"sqlite:///{tmp_path}/startup.db", metrics_enabled = False)
+    app = create_app(config)
+    try:
+        with TestClient(app) as client:
+            assert database.config is config
+            assert database._engine is not None
+            assert str(database.engine.url).endswith("startup.db")
+            assert client.get("/health").status_code == 200
+        assert database._engine is None
+    finally:
+        database.configure(settings)
+
+
+def test_create_app_metrics_follow_config():
+    """
+    Test: create_app(config) con METRICS_ENABLED=false en config (y true en los settings globales)
+    Esperado: /metrics no existe; /health y /health/stats responden sin crear el engine
+    """
+    config = dataclasses.replace(settings, database_url = None, metrics_enabled = False, environment = "staging")
+    client = TestClient(create_app(config))
+
+    assert client.get("/metrics").status_code == 404
+    assert client.get("/health").json()["environment"] == "staging"
+    assert client.get("/health/stats").status_code == 200
+
+
+def test_create_app_routes_follow_config(client, db_session, admin_token, test_settings):
+    """
+    Test: Segunda app con otra SECRET_KEY, otra duracion de tokens y otro LOOKUP_MAX_IDS
+    Esperado: firma y valida con su propia clave (el token de la otra app da 401),
+    expires_in y el limite de ids salen de su config
+    """
+    config = dataclasses.replace(test_settings, secret_key = "otra-clave", access_token_expire_minutes = 5, lookup_max_ids = 1)
+    other = create_app(config)
+
+    async def override_get_async_db():
+        yield ThreadedSession(db_session)
+
+    other.dependency_overrides[get_async_db] = override_get_async_db
+    other_client = TestClient(other)
+
+    login = other_client.post("/api/v1/auth/login", data = {"username": "admin@example.com", "password": "hola123123"})
+    assert login.json()["expires_in"] == 300
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    assert other_client.get("/api/v1/employees", headers = {"Authorization": f"Bearer {admin_token}"}).status_code == 401
+    assert client.get("/api/v1/employees", headers = headers).status_code == 401
+    response = other_client.post("/api/v1/employees/lookup", json = {"ids": [1, 2]}, headers = headers)
+    assert response.status_code == 413
+    assert response.json()["detail"] == "Too many ids (max 1)"